@@ -0,0 +1,319 @@
+"""
+A local SQLite journal of commits, so a report over many days costs about what a report over one does.
+
+Without it, `daily-work-summary.py` asks each repository for its commits with `git log` on every run, so a weekly or
+monthly report walks the same history over and over.  The journal keeps every commit it has seen (repository, full
+hash, author name and email, commit time, and summary) and, for each repository, the tip of every local and
+remote-tracking branch as of the last look.  Bringing a repository up to date (`CommitJournal.ingest`) costs one
+`git for-each-ref`, and, only if some tip moved, one `git log` of just the new commits (`<new tips> --not <old tips>`).
+Reports are then a query.
+
+The journal also records, for each repository, how far back it has looked.  Asking for commits from before that
+(say, the first `--since "30 days ago"` after a week of daily reports) walks the history back that far once.
+
+Commits are only ever added: one that a force-push or a deleted branch has since made unreachable stays in the journal
+(and in reports).
+
+Asked for one author's commits, the journal finds the ones `git log --author` would: the author is a pattern (POSIX
+basic regular expression, case-sensitive) searched for in each commit's "Name <email>", so an email finds its
+commits, and so does part of one, or a name.
+
+The journal lives in `$XDG_CACHE_HOME/git-bin/commit-journal.sqlite3`: everything in it can be rebuilt from the
+repositories, so deleting it is always safe.  A journal kept by an older version of this file is started over.
+"""
+import os
+import re
+import sqlite3
+import string
+import subprocess
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+# Kept in the database as `PRAGMA user_version`; a journal with any other version is started over
+SCHEMA_VERSION = 2
+
+SCHEMA = (
+    """
+    CREATE TABLE commits (
+        repo TEXT NOT NULL,
+        sha TEXT NOT NULL,
+        author_name TEXT NOT NULL,
+        author_email TEXT NOT NULL,
+        committed_at INTEGER NOT NULL,
+        summary TEXT NOT NULL,
+        PRIMARY KEY (repo, sha)
+    )
+    """,
+    "CREATE INDEX commits_by_time ON commits (repo, committed_at)",
+    """
+    CREATE TABLE tips (
+        repo TEXT NOT NULL,
+        ref TEXT NOT NULL,
+        sha TEXT NOT NULL,
+        PRIMARY KEY (repo, ref)
+    )
+    """,
+    """
+    CREATE TABLE coverage (
+        repo TEXT PRIMARY KEY,
+        since INTEGER NOT NULL
+    )
+    """,
+)
+
+# What a backslash makes of these characters in a basic regular expression: special, where Python's are plain
+BRE_ESCAPES = {"(": "(", ")": ")", "{": "{", "}": "}", "|": "|", "+": "+", "?": "?", "<": r"\b", ">": r"\b"}
+
+POSIX_CLASSES = {
+    "alpha": "A-Za-z",
+    "digit": "0-9",
+    "alnum": "0-9A-Za-z",
+    "upper": "A-Z",
+    "lower": "a-z",
+    "space": r"\s",
+    "blank": " \t",
+    "xdigit": "0-9A-Fa-f",
+    "punct": re.escape(string.punctuation),
+    "cntrl": r"\x00-\x1f\x7f",
+    "print": r"\x20-\x7e",
+    "graph": r"\x21-\x7e",
+}
+
+
+class Commit(NamedTuple):
+    """One commit, as the journal keeps it."""
+
+    sha: str
+    author_name: str
+    author_email: str
+    committed_at: int
+    summary: str
+
+
+# One commit per NUL-terminated record (`git log -z`), fields separated by the ASCII unit separator
+LOG_FORMAT = "--format=%H%x1f%an%x1f%ae%x1f%ct%x1f%s"
+
+
+def default_journal_file() -> Path:
+    """Where the journal is kept: `$XDG_CACHE_HOME/git-bin/commit-journal.sqlite3`."""
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_home / "git-bin" / "commit-journal.sqlite3"
+
+
+def parse_since(since: str, repo: Path) -> int:
+    """
+    Turn a `--since` like "midnight" or "24 hours ago" into a Unix time, exactly as `git log --since` would.
+
+    Args:
+        since: Anything `git log --since` accepts.
+        repo: Any repository (git only parses dates inside one).
+
+    Returns:
+        The time, in seconds since the epoch.
+    """
+    result = subprocess.run(
+        ["git", "rev-parse", f"--since={since}"], cwd=repo, capture_output=True, text=True, check=True
+    )
+    return int(result.stdout.strip().removeprefix("--max-age="))
+
+
+def branch_tips(repo: Path) -> dict[str, str]:
+    """Every local and remote-tracking branch of the repository → the commit at its tip."""
+    result = subprocess.run(
+        ["git", "for-each-ref", "--format=%(refname)%00%(objectname)", "refs/heads", "refs/remotes"],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    tips = {}
+    for line in result.stdout.splitlines():
+        ref, _, sha = line.partition("\0")
+        if not ref.endswith("/HEAD"):
+            tips[ref] = sha
+    return tips
+
+
+def log_commits(repo: Path, *revisions: str) -> list[Commit]:
+    """Each commit `git log <revisions>` lists, in its order."""
+    result = subprocess.run(
+        ["git", "log", "-z", LOG_FORMAT, "--ignore-missing", *revisions, "--"],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    commits = []
+    for record in result.stdout.split("\0"):
+        if record:
+            sha, author_name, author_email, committed_at, summary = record.split("\x1f", 4)
+            commits.append(Commit(sha, author_name, author_email, int(committed_at), summary))
+    return commits
+
+
+def author_regex(pattern: str) -> re.Pattern:
+    """
+    Compile an author pattern as `git log --author` reads it: a POSIX basic regular expression (with GNU's `\\+`, `\\?`,
+    and `\\|`), case-sensitive.
+
+    In a basic regular expression `+`, `?`, `|`, `(`, `)`, `{`, and `}` are themselves unless escaped, the reverse of
+    Python; so is a `*` with nothing before it, a `^` anywhere but the start, and a `$` anywhere but the end.
+
+    Args:
+        pattern: The pattern, as given to `git log --author`.
+
+    Returns:
+        The same pattern, as a Python regular expression.
+    """
+    parts = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        # Where a `^` anchors, and a `*` repeats nothing
+        at_start = not parts or parts[-1] in ("(", "|")
+        if char == "\\" and i + 1 < len(pattern):
+            i += 1
+            char = pattern[i]
+            if char in BRE_ESCAPES:
+                parts.append(BRE_ESCAPES[char])
+            elif char.isdigit() or char in "wWsSbB":
+                parts.append(f"\\{char}")
+            else:
+                parts.append(re.escape(char))
+        elif char == "[" and (bracket := bracket_expression(pattern, i)) is not None:
+            part, i = bracket
+            parts.append(part)
+        elif char in "+?|(){}[]" or (char == "*" and (at_start or parts[-1] == "^")) or (char == "^" and not at_start):
+            parts.append(re.escape(char))
+        elif char == "$" and not (i + 1 == len(pattern) or pattern.startswith(("\\)", "\\|"), i + 1)):
+            parts.append(re.escape(char))
+        else:
+            parts.append(char)
+        i += 1
+    return re.compile("".join(parts))
+
+
+def bracket_expression(pattern: str, start: int) -> Optional[tuple[str, int]]:
+    """
+    The bracket expression (`[...]`) opening at `pattern[start]`, as a Python character set, and where it closes.
+
+    Returns:
+        The character set and the index of its closing `]`; or None, if it doesn't close.
+    """
+    end = start + 1
+    negate = pattern.startswith("^", end)
+    end += negate
+    members = []
+    # A `]` first is one of the characters, not the end
+    if pattern.startswith("]", end):
+        members.append(re.escape("]"))
+        end += 1
+    while end < len(pattern) and pattern[end] != "]":
+        if pattern.startswith("[:", end) and (close := pattern.find(":]", end + 2)) != -1:
+            name = pattern[end + 2 : close]
+            if name not in POSIX_CLASSES:
+                raise re.error(f"invalid character class: {name}")
+            members.append(POSIX_CLASSES[name])
+            end = close + 2
+        else:
+            # Backslashes are plain characters here; escape whatever Python would take as more than a character
+            members.append(re.escape(pattern[end]) if pattern[end] in "\\[]^&~|" else pattern[end])
+            end += 1
+    if end == len(pattern):
+        return None
+    return f"[{'^' if negate else ''}{''.join(members)}]", end
+
+
+class CommitJournal:
+    """
+    The journal database.  Use it as a context manager, one per thread.
+
+    Args:
+        path: The SQLite database file; created (with its directory) if need be.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        path = path or default_journal_file()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Several threads (each with its own journal) may write at once; WAL lets them, a few milliseconds apart
+        self.connection = sqlite3.connect(path, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        with self.connection:
+            # One at a time, so that no thread starts over on a journal another has just brought up to date
+            self.connection.execute("BEGIN IMMEDIATE")
+            if self.connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                for table in ("commits", "tips", "coverage"):
+                    self.connection.execute(f"DROP TABLE IF EXISTS {table}")
+                for statement in SCHEMA:
+                    self.connection.execute(statement)
+                self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def __enter__(self) -> "CommitJournal":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def ingest(self, repo: Path, since: int) -> int:
+        """
+        Record the repository's new commits, and make sure the journal goes back at least to `since`.
+
+        Args:
+            repo: Path to the repository.
+            since: The earliest commit time (Unix) a report is about to ask for.
+
+        Returns:
+            How many commits were new to the journal.
+        """
+        key = str(repo.absolute())
+        tips = branch_tips(repo)
+        old_tips = dict(self.connection.execute("SELECT ref, sha FROM tips WHERE repo = ?", (key,)).fetchall())
+        row = self.connection.execute("SELECT since FROM coverage WHERE repo = ?", (key,)).fetchone()
+
+        if row is None or since < row[0]:
+            # Never looked this far back: walk every branch back to `since`
+            commits = log_commits(repo, f"--since={since}", *tips.values()) if tips else []
+            covered_since = since
+        else:
+            # Only what's been added since the last look
+            moved = [sha for ref, sha in tips.items() if old_tips.get(ref) != sha]
+            commits = log_commits(repo, *moved, "--not", *old_tips.values()) if moved else []
+            covered_since = row[0]
+
+        with self.connection:
+            before = self.connection.total_changes
+            # Oldest first, so that among commits made in the same second, the later row is the newer commit
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO commits VALUES (?, ?, ?, ?, ?, ?)",
+                [(key, *commit) for commit in reversed(commits)],
+            )
+            added = self.connection.total_changes - before
+            self.connection.execute("DELETE FROM tips WHERE repo = ?", (key,))
+            self.connection.executemany("INSERT INTO tips VALUES (?, ?, ?)", [(key, r, s) for r, s in tips.items()])
+            self.connection.execute("INSERT OR REPLACE INTO coverage VALUES (?, ?)", (key, covered_since))
+        return added
+
+    def commits(self, repo: Path, since: int, author: str) -> list[Commit]:
+        """
+        The repository's commits by `author` made at or after `since`, newest first.
+
+        Args:
+            repo: Path to the repository.
+            since: The earliest commit time (Unix) to include.
+            author: Who to look for, matched as `git log --author` matches it (see `author_regex`).
+
+        Returns:
+            The commits.
+        """
+        matches = author_regex(author).search
+        rows = self.connection.execute(
+            "SELECT sha, author_name, author_email, committed_at, summary FROM commits"
+            " WHERE repo = ? AND committed_at >= ?"
+            " ORDER BY committed_at DESC, rowid DESC",
+            (str(repo.absolute()), since),
+        )
+        commits = map(Commit._make, rows)
+        return [commit for commit in commits if matches(f"{commit.author_name} <{commit.author_email}>")]
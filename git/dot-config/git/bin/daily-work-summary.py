@@ -26,11 +26,38 @@ Example:
     # Skip fetching (faster, but may miss recent remote commits)
     daily-work-summary.py --no-fetch
 
+    # Fetch every repository, even those fetched in the last 5 minutes
+    daily-work-summary.py --max-fetch-age 0
+
+    # Find repositories by walking everything, not just the directories that changed since the last run
+    daily-work-summary.py --rescan
+
+    # Ask git for the commits directly, instead of the commit journal
+    daily-work-summary.py --since "30 days ago" --no-journal
+
+    # Fetch up to 16 repositories at a time, giving up on any that takes over 30 seconds
+    daily-work-summary.py --jobs 16 --fetch-timeout 30
+
     # Override author email (default: uses each repo's configured email)
     daily-work-summary.py --author-email "you@example.com"
+
+    # One JSON object per commit, written as soon as each repository is done (progress goes to stderr)
+    daily-work-summary.py --format ndjson
+
+    # One JSON array of every commit, at the end
+    daily-work-summary.py --since "7 days ago" --format json
 """
+import json
 import os
+import re
+import signal
+import sqlite3
 import subprocess
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
 from pathlib import Path
 from typing import Optional
 
@@ -38,15 +65,173 @@ import typer
 from typing_extensions import Annotated
 
 from git_workflow_utils import (
-    fetch_all,
     filter_repos_by_ignore_file,
-    find_git_repos,
     get_commits,
     user_email_in_this_working_copy,
 )
 
+from commit_journal import Commit, CommitJournal, log_commits, parse_since
+from fetch_policy import DEFAULT_MAX_FETCH_AGE, MAX_FETCH_AGE_HELP, fetched_recently, record_fetch
+from repo_index import find_repos
+
 app = typer.Typer()
 
+# The same fetch `fetch_all` does
+FETCH_COMMAND = ["git", "fetch", "--prune", "--all", "--tags", "--recurse-submodules", "--quiet"]
+
+
+class OutputFormat(str, Enum):
+    """How the report is written: for people, or one JSON record per commit."""
+
+    text = "text"
+    ndjson = "ndjson"
+    json = "json"
+
+
+@dataclass
+class RepoSurvey:
+    """
+    What one repository contributed: how its fetch went (if it was fetched), and your commits in it; or, if they
+    couldn't be collected, why not.
+    """
+
+    repo: Path
+    fetch_status: Optional[str] = None
+    commits: list[Commit] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def fetch_repo(repo: Path, timeout: Optional[float]) -> str:
+    """
+    Fetch every remote of a repository, giving up after `timeout` seconds.
+
+    Runs without a terminal to prompt on, and in its own process group, so a
+    fetch that times out takes its `ssh` (or other helper) down with it.  Only
+    a fetch that succeeds is recorded (see fetch_policy.py).
+
+    Args:
+        repo: Path to the repository.
+        timeout: Seconds to wait before killing the fetch; None waits forever.
+
+    Returns:
+        The status to report: "✓", "(no remotes)", or "(timed out)".
+    """
+    process = subprocess.Popen(
+        FETCH_COMMAND,
+        cwd=repo,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+        start_new_session=True,
+    )
+    try:
+        returncode = process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+        process.wait()
+        return "(timed out)"
+    if returncode != 0:
+        return "(no remotes)"
+    record_fetch(repo)
+    return "✓"
+
+
+def survey_repo(
+    repo: Path,
+    since: str,
+    author_email: Optional[str],
+    fetch: bool,
+    fetch_timeout: Optional[float],
+    max_fetch_age: float = DEFAULT_MAX_FETCH_AGE,
+    since_time: Optional[int] = None,
+) -> RepoSurvey:
+    """
+    Fetch a repository (if asked, and not fetched recently), then collect your commits in it since `since`.
+
+    Given `since_time` (`since` as a Unix time), the commits come from the commit journal, which first takes in
+    whatever the repository gained since it last looked; otherwise, straight from `get_commits`.
+
+    A repository whose commits can't be collected (git fails on it, or the journal does) gets an `error` instead,
+    so one broken repository doesn't cost the whole report.
+    """
+    survey = RepoSurvey(repo)
+    if fetch:
+        if fetched_recently(repo, max_fetch_age):
+            survey.fetch_status = "(fetched recently)"
+        else:
+            survey.fetch_status = fetch_repo(repo, fetch_timeout)
+
+    try:
+        survey.commits = repo_commits(repo, since, author_email, since_time)
+    except subprocess.CalledProcessError as e:
+        survey.error = (e.stderr or "").strip() or str(e)
+    except (sqlite3.Error, OSError, re.error) as e:
+        survey.error = f"{type(e).__name__}: {e}"
+    return survey
+
+
+def repo_commits(repo: Path, since: str, author_email: Optional[str], since_time: Optional[int]) -> list[Commit]:
+    """Your commits in `repo` since `since` (from the journal, given `since_time`); see `survey_repo`."""
+    # Get author email for this repo (unless overridden)
+    email = author_email or user_email_in_this_working_copy(repo)
+    if not email:
+        return []
+    if since_time is None:
+        shas = [sha for sha, _ in get_commits(repo=repo, since=since, author_email=email)]
+        # Just the hashes, in get_commits' order, filled out with author and time
+        return log_commits(repo, "--no-walk=unsorted", *shas) if shas else []
+    with CommitJournal() as journal:
+        journal.ingest(repo, since_time)
+        return journal.commits(repo, since_time, email)
+
+
+def survey_repos(
+    repos: Sequence[Path],
+    since: str,
+    author_email: Optional[str],
+    fetch: bool,
+    fetch_timeout: Optional[float],
+    jobs: int,
+    max_fetch_age: float = DEFAULT_MAX_FETCH_AGE,
+    journal: bool = False,
+    ordered: bool = True,
+) -> Iterator[RepoSurvey]:
+    """
+    Survey `repos`, up to `jobs` at a time, yielding each result in the order of `repos`.
+
+    Each repository's commits are collected as soon as its own fetch is done,
+    without waiting for any other fetch.  Results are yielded in order, each
+    as soon as it and every one before it is finished; or, if not `ordered`,
+    each as soon as it is finished.
+
+    With `journal`, commits come from the commit journal (see commit_journal.py).
+    """
+    # Resolved once, so every repository is asked about the same moment
+    since_time = parse_since(since, repos[0]) if journal and repos else None
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(survey_repo, repo, since, author_email, fetch, fetch_timeout, max_fetch_age, since_time)
+            for repo in repos
+        ]
+        for future in futures if ordered else as_completed(futures):
+            yield future.result()
+
+
+def commit_record(repo: Path, commit: Commit) -> dict:
+    """One commit, as written by `--format ndjson` and `--format json`."""
+    return {
+        "repo": repo.name,
+        "path": str(repo.absolute()),
+        "hash": commit.sha,
+        "author": commit.author_email,
+        "timestamp": datetime.fromtimestamp(commit.committed_at).astimezone().isoformat(),
+        "summary": commit.summary,
+    }
+
 
 @app.command()
 def main(
@@ -68,8 +253,34 @@ def main(
         Optional[str],
         typer.Option(help="Override author email (default: use each repo's config)"),
     ] = None,
+    jobs: Annotated[
+        int,
+        typer.Option(min=1, help="How many repositories to fetch (and search) at once"),
+    ] = 8,
+    fetch_timeout: Annotated[
+        Optional[float],
+        typer.Option(help="Give up fetching a repository after this many seconds"),
+    ] = 60.0,
+    max_fetch_age: Annotated[float, typer.Option(help=MAX_FETCH_AGE_HELP)] = DEFAULT_MAX_FETCH_AGE,
+    rescan: Annotated[
+        bool,
+        typer.Option(help="Walk all of the repos directory, instead of only what changed since the last run"),
+    ] = False,
+    journal: Annotated[
+        bool,
+        typer.Option("--journal/--no-journal", help="Read commits from the local commit journal, not from git log"),
+    ] = True,
+    output_format: Annotated[
+        OutputFormat,
+        typer.Option(
+            "--format",
+            help="text: the summary; ndjson: a JSON object per commit, as each repo is done; json: one JSON array",
+        ),
+    ] = OutputFormat.text,
 ) -> None:
     """Generate a summary of your git commits from today."""
+    # With JSON output, stdout is only the JSON; progress goes to stderr
+    progress_to_stderr = output_format is not OutputFormat.text
 
     # Determine repos directory
     if repos_dir is None:
@@ -83,34 +294,53 @@ def main(
         typer.echo(f"Error: Directory not found: {repos_dir}", err=True)
         raise typer.Exit(1)
 
-    # Find all repos (excluding worktrees, with .journalignore filtering)
-    typer.echo(f"Scanning {repos_dir} for git repositories...")
-    all_repos = find_git_repos(repos_dir, include_worktrees=False)
+    # Find all repos (excluding worktrees, with .journalignore filtering), re-listing only directories that changed
+    typer.echo(f"Scanning {repos_dir} for git repositories...", err=progress_to_stderr)
+    all_repos = find_repos(repos_dir, rescan=rescan)
     repos = sorted(filter_repos_by_ignore_file(all_repos, repos_dir, ".journalignore"))
-    typer.echo(f"Found {len(repos)} repositories (after filtering)\n")
+    typer.echo(f"Found {len(repos)} repositories (after filtering)\n", err=progress_to_stderr)
 
-    # Collect commits from all repos
+    # Collect commits from all repos, reporting each fetch in order (with ndjson, in the order they finish)
     all_commits = {}
-    for repo in repos:
-        if fetch:
-            typer.echo(f"Fetching {repo.name}...", nl=False)
-            try:
-                fetch_all(repo=repo)
-                typer.echo(" ✓")
-            except subprocess.CalledProcessError:
-                typer.echo(" (no remotes)")
-
-        # Get author email for this repo (unless overridden)
-        email = author_email or user_email_in_this_working_copy(repo)
-        if not email:
-            continue
-
-        # Get commits
-        commits = list(get_commits(repo=repo, since=since, author_email=email))
-        if commits:
-            all_commits[repo] = commits
-
-    # Display summary
+    records = []
+    failed = []
+    for survey in survey_repos(
+        repos,
+        since,
+        author_email,
+        fetch,
+        fetch_timeout,
+        jobs,
+        max_fetch_age,
+        journal,
+        ordered=output_format is not OutputFormat.ndjson,
+    ):
+        if survey.fetch_status is not None:
+            typer.echo(f"Fetching {survey.repo.name}... {survey.fetch_status}", err=progress_to_stderr)
+        if survey.error is not None:
+            typer.echo(f"Skipping {survey.repo.name}: {survey.error}", err=True)
+            failed.append(survey.repo)
+        if output_format is OutputFormat.ndjson:
+            for commit in survey.commits:
+                typer.echo(json.dumps(commit_record(survey.repo, commit)))
+        elif output_format is OutputFormat.json:
+            records.extend(commit_record(survey.repo, commit) for commit in survey.commits)
+        elif survey.commits:
+            all_commits[survey.repo] = survey.commits
+
+    if output_format is OutputFormat.json:
+        typer.echo(json.dumps(records, indent=2))
+    if output_format is OutputFormat.text:
+        print_summary(since, all_commits)
+
+    # The report is complete except for these; say so, and don't exit as if it were all there
+    if failed:
+        typer.echo(f"Could not search {len(failed)} repositories: {', '.join(repo.name for repo in failed)}", err=True)
+        raise typer.Exit(1)
+
+
+def print_summary(since: str, all_commits: dict[Path, list[Commit]]) -> None:
+    """The text report: your commits, grouped by repository."""
     typer.echo(f"\n=== Work Summary (since {since}) ===\n")
 
     if not all_commits:
@@ -120,9 +350,9 @@ def main(
     total_commits = 0
     for repo, commits in all_commits.items():
         typer.echo(f"{repo.name}:")
-        for hash_full, summary in commits:
+        for commit in commits:
             # Show short hash (first 7 chars)
-            typer.echo(f"  {hash_full[:7]} - {summary}")
+            typer.echo(f"  {commit.sha[:7]} - {commit.summary}")
             total_commits += 1
         typer.echo()
 
@@ -0,0 +1,126 @@
+"""
+When a fetch can be skipped: the one freshness rule shared by make-worktree.py, sync-main.py, and daily-work-summary.py.
+
+Each of those fetches every remote before doing anything else, and running them back to back fetched again what had
+only just been fetched.  So each records a successful fetch of every remote (`record_fetch`) by touching a stamp file,
+`git-bin-fetched`, in the repository's git directory; a repository whose stamp is younger than `--max-fetch-age`
+seconds (default: 5 minutes) is fresh enough, and isn't fetched again.  `--max-fetch-age 0` always fetches.
+
+Only a complete fetch counts: one that failed, or timed out, part way through the remotes leaves the stamp as it was.
+So does anything else that fetches, even though it rewrites `FETCH_HEAD` (which is why that isn't the test): a
+`git pull` fetches a single branch of a single remote, without `--prune` or `--tags`.
+
+Worktrees share their remote-tracking branches with the main repository, so the stamp lives in the common git
+directory, and a fetch from any of them counts for all.
+"""
+import subprocess
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_MAX_FETCH_AGE = 300.0
+
+MAX_FETCH_AGE_HELP = "Don't fetch if the remotes were fetched less than this many seconds ago (0: always fetch)"
+
+FETCH_STAMP = "git-bin-fetched"
+
+
+def fetch_stamp(repo: Optional[Path] = None) -> Optional[Path]:
+    """
+    The stamp file recording the repository's last complete fetch (whether or not it exists yet).
+
+    Args:
+        repo: Path to the repository; the current directory if None.
+
+    Returns:
+        The path of the stamp, in the common git directory; or None if `repo` isn't a repository.
+    """
+    result = subprocess.run(
+        ["git", "rev-parse", "--git-common-dir"],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return None
+    return Path(repo or ".") / result.stdout.strip() / FETCH_STAMP
+
+
+def record_fetch(repo: Optional[Path] = None) -> None:
+    """Record that every remote of the repository was just fetched successfully; failing to record is not an error."""
+    if (stamp := fetch_stamp(repo)) is not None:
+        try:
+            stamp.touch()
+        except OSError:
+            pass
+
+
+def last_fetch_time(repo: Optional[Path] = None) -> Optional[float]:
+    """
+    When the repository (or its main repository, for a worktree) last completed a fetch of every remote.
+
+    Args:
+        repo: Path to the repository; the current directory if None.
+
+    Returns:
+        The modification time of the stamp `record_fetch` touches, or None if it never has (or `repo` isn't a
+        repository).
+    """
+    if (stamp := fetch_stamp(repo)) is None:
+        return None
+    try:
+        return stamp.stat().st_mtime
+    except OSError:
+        return None
+
+
+def fetch_age(repo: Optional[Path] = None) -> Optional[float]:
+    """Seconds since the repository last completed a fetch, or None if it never has."""
+    fetched = last_fetch_time(repo)
+    return None if fetched is None else max(0.0, time.time() - fetched)
+
+
+def fetched_recently(repo: Optional[Path] = None, max_age: float = DEFAULT_MAX_FETCH_AGE) -> bool:
+    """
+    Whether the repository fetched less than `max_age` seconds ago, so fetching again can be skipped.
+
+    Args:
+        repo: Path to the repository; the current directory if None.
+        max_age: How many seconds old a fetch may be and still count; 0 (or less) means never skip.
+
+    Returns:
+        True if the last fetch is recent enough.
+    """
+    if max_age <= 0:
+        return False
+    age = fetch_age(repo)
+    return age is not None and age < max_age
+
+
+def fetch_unless_fresh(
+    fetch: Callable[..., object],
+    repo: Optional[Path] = None,
+    max_age: float = DEFAULT_MAX_FETCH_AGE,
+    **kwargs,
+) -> bool:
+    """
+    Call `fetch` (e.g., `fetch_all`) for the repository, unless it fetched less than `max_age` seconds ago.
+
+    If `fetch` returns (rather than raising), the fetch is recorded with `record_fetch`.
+
+    Args:
+        fetch: The function that fetches; called with `repo=repo` (if given) and `kwargs`.
+        repo: Path to the repository; the current directory if None.
+        max_age: As for `fetched_recently`.
+
+    Returns:
+        True if it fetched, False if the last fetch was fresh enough.
+    """
+    if fetched_recently(repo, max_age):
+        return False
+    if repo is not None:
+        kwargs["repo"] = repo
+    fetch(**kwargs)
+    record_fetch(repo)
+    return True
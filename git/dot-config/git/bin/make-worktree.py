@@ -48,6 +48,8 @@ from git_workflow_utils import (
     submodule_update,
 )
 
+from fetch_policy import DEFAULT_MAX_FETCH_AGE, MAX_FETCH_AGE_HELP, fetch_unless_fresh
+
 
 def worktree_add(
     repo: Path,
@@ -55,6 +57,7 @@ def worktree_add(
     new_worktree: str|Path|None = None,
     starting_ref: str|None = None,
     remote_name: str = "origin",
+    max_fetch_age: float = DEFAULT_MAX_FETCH_AGE,
 ) -> Path:
     """
     Create a new Git worktree for a branch.
@@ -70,6 +73,7 @@ def worktree_add(
                      Defaults to branch name as a sibling directory.
         starting_ref: Starting point for new branches. Defaults to current branch.
         remote_name: Name of the remote to check for existing branches.
+        max_fetch_age: Skip fetching if the repo fetched less than this many seconds ago.
 
     Returns:
         Absolute path to the newly created worktree.
@@ -77,7 +81,7 @@ def worktree_add(
     assert is_absolute_repo_path(repo)
     assert new_worktree_branch
 
-    fetch_all(repo=repo, quiet=True)
+    fetch_unless_fresh(fetch_all, repo, max_fetch_age, quiet=True)
 
     remote_prefix = f"{remote_name}/"
     existing_branches = find_branches(new_worktree_branch, repo=repo, remote_name=remote_name)
@@ -137,6 +141,7 @@ def main(
     repo: Annotated[Optional[Path], typer.Option("-C", help="The repo to which you are adding a worktree. Uses the repo you are currently **in** if not supplied.")] = None,
     starting_ref: Annotated[Optional[str], typer.Option("--from", "-f", help="When creating a new branch, start it from this commit/branch/tag. Defaults to the current branch of the repo.")] = None,
     remote: Annotated[str, typer.Option(help="In case you need a remote other than origin.")] = "origin",
+    max_fetch_age: Annotated[float, typer.Option(help=MAX_FETCH_AGE_HELP)] = DEFAULT_MAX_FETCH_AGE,
 ):
     """
     Create a new Git worktree with intelligent defaults and automated setup.
@@ -148,7 +153,7 @@ def main(
     - Sets up direnv if .envrc.sample exists
     """
     starting_repo = resolve_repo(repo)
-    new_repo = worktree_add(starting_repo, branch, worktree, starting_ref, remote)
+    new_repo = worktree_add(starting_repo, branch, worktree, starting_ref, remote, max_fetch_age)
     initialize_repo(new_repo)
     print(str(new_repo))
 
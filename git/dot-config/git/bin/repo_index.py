@@ -0,0 +1,143 @@
+"""
+A persistent index of the git repositories under a directory, so finding them doesn't mean walking the whole tree.
+
+`find_git_repos` walks everything under `$REPOS_DIR` every time, including the insides of every repository
+(`node_modules`, build outputs, large checkouts) which can never hold another repository of interest.  Instead,
+`find_repos` keeps, for every directory it has visited above the repositories, that directory's modification time and
+its subdirectories.  A directory's modification time changes exactly when something is added to, removed from, or
+renamed in it; so on the next run, a directory whose modification time is unchanged needs one `stat` instead of a
+listing, and only the directories that changed are listed again.  It never descends into a repository.
+
+Like `find_git_repos(..., include_worktrees=False)`, a directory is a repository if it has a `.git` directory; one
+with a `.git` file (a worktree) is neither reported nor descended into.  Symbolic links aren't followed.
+
+The index for each root lives in its own JSON file under `$XDG_CACHE_HOME/git-bin`.  Pass `rescan=True` to ignore it
+and walk everything again (the new answer is saved just the same).
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+INDEX_VERSION = 1
+
+
+def default_index_file(root: Path) -> Path:
+    """
+    Where the index for `root` is kept.
+
+    Args:
+        root: The directory searched for repositories.
+
+    Returns:
+        A file under `$XDG_CACHE_HOME/git-bin`, named for `root`.
+    """
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    digest = hashlib.sha256(str(root.absolute()).encode()).hexdigest()[:16]
+    return cache_home / "git-bin" / f"repo-index-{digest}.json"
+
+
+def scan_directory(directory: Path, mtime_ns: int) -> Optional[dict]:
+    """
+    List one directory: is it a repository, and (if not) what are its subdirectories.
+
+    Args:
+        directory: The directory to list.
+        mtime_ns: Its modification time, recorded with the answer.
+
+    Returns:
+        The index entry for `directory`, or None if it can't be listed.
+    """
+    subdirectories = []
+    git_entry = None
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    is_directory = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if entry.name == ".git":
+                    git_entry = "repo" if is_directory else "worktree"
+                elif is_directory:
+                    subdirectories.append(entry.name)
+    except OSError:
+        return None
+    return {
+        "mtime_ns": mtime_ns,
+        "repo": git_entry == "repo",
+        "subdirectories": [] if git_entry else sorted(subdirectories),
+    }
+
+
+def refresh_index(root: Path, directories: dict[str, dict]) -> dict[str, dict]:
+    """
+    Bring an index up to date, listing only the directories whose modification time changed.
+
+    Args:
+        root: The directory searched for repositories.
+        directories: The old index: each directory's path relative to `root` ("." for `root` itself) → its entry.
+
+    Returns:
+        The new index, with only the directories that still exist.
+    """
+    refreshed: dict[str, dict] = {}
+    pending = ["."]
+    while pending:
+        relative = pending.pop()
+        directory = root / relative
+        try:
+            mtime_ns = directory.stat().st_mtime_ns
+        except OSError:
+            continue
+        entry = directories.get(relative)
+        if entry is None or entry["mtime_ns"] != mtime_ns:
+            entry = scan_directory(directory, mtime_ns)
+            if entry is None:
+                continue
+        refreshed[relative] = entry
+        pending.extend(os.path.join(relative, name) if relative != "." else name for name in entry["subdirectories"])
+    return refreshed
+
+
+def read_index(index_file: Path, root: Path) -> dict[str, dict]:
+    """The saved index for `root`, or an empty one if there's none (or it's unreadable, or for another root)."""
+    try:
+        saved = json.loads(index_file.read_text())
+        if saved.get("version") == INDEX_VERSION and saved.get("root") == str(root.absolute()):
+            return saved["directories"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    return {}
+
+
+def write_index(index_file: Path, root: Path, directories: dict[str, dict]) -> None:
+    """Save the index for `root`, atomically; failing to save is not an error."""
+    temporary_file = index_file.with_name(f"{index_file.name}.{os.getpid()}.tmp")
+    try:
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        temporary_file.write_text(
+            json.dumps({"version": INDEX_VERSION, "root": str(root.absolute()), "directories": directories})
+        )
+        os.replace(temporary_file, index_file)
+    except OSError:
+        temporary_file.unlink(missing_ok=True)
+
+
+def find_repos(root: Path, index_file: Optional[Path] = None, rescan: bool = False) -> list[Path]:
+    """
+    Find the git repositories under `root` (not worktrees), using and updating the saved index.
+
+    Args:
+        root: The directory to search.
+        index_file: Where the index is kept (default: `default_index_file(root)`).
+        rescan: Ignore the saved index, and walk the whole tree.
+
+    Returns:
+        The repositories found, sorted.
+    """
+    index_file = index_file or default_index_file(root)
+    directories = refresh_index(root, {} if rescan else read_index(index_file, root))
+    write_index(index_file, root, directories)
+    return sorted(root / relative for relative, entry in directories.items() if entry["repo"])
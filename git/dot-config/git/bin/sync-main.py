@@ -37,6 +37,9 @@ Example:
 
     # Preview what would happen
     sync-main.py --dry-run
+
+    # Fetch even if the remotes were fetched in the last 5 minutes
+    sync-main.py --max-fetch-age 0
 """
 import subprocess
 import sys
@@ -47,12 +50,26 @@ from typing_extensions import Annotated
 
 from git_workflow_utils import current_branch, fetch_all, has_uncommitted_changes, run_git
 
+from fetch_policy import DEFAULT_MAX_FETCH_AGE, MAX_FETCH_AGE_HELP, fetched_recently, record_fetch
+
+
+def fetch_remotes(max_fetch_age: float, dry_run: bool) -> None:
+    """Fetch all remotes, unless they were fetched less than `max_fetch_age` seconds ago."""
+    if fetched_recently(max_age=max_fetch_age):
+        typer.echo(f"Remotes were fetched less than {max_fetch_age:g} seconds ago; not fetching again")
+    elif dry_run:
+        typer.echo(f"[DRY RUN] Would run: git fetch --prune --all --tags --recurse-submodules")
+    else:
+        fetch_all()
+        record_fetch()
+
 
 def main(
     branch: Annotated[str, typer.Option("--branch", "-b", help="Branch to pull from (e.g., 'main')")] = "main",
     target: Annotated[str, typer.Option("--target", "-t", help="Branch to cherry-pick into. Defaults to current branch.")] = "",
     stash: Annotated[bool, typer.Option("--stash", "-s", help="Stash uncommitted changes before syncing and restore after")] = False,
     dry_run: Annotated[bool, typer.Option("--dry-run", "-n", help="Show what would be done without doing it")] = False,
+    max_fetch_age: Annotated[float, typer.Option(help=MAX_FETCH_AGE_HELP)] = DEFAULT_MAX_FETCH_AGE,
 ) -> None:
     """
     Pull updates from a shared branch and cherry-pick them into your working branch.
@@ -77,11 +94,10 @@ def main(
     # If we're already on the branch to pull, just fetch and pull
     if original_branch == branch:
         typer.echo(f"Already on {branch}, fetching and pulling...")
+        fetch_remotes(max_fetch_age, dry_run)
         if not dry_run:
-            fetch_all()
             run_git("pull")
         else:
-            typer.echo(f"[DRY RUN] Would run: git fetch --prune --all --tags --recurse-submodules")
             typer.echo(f"[DRY RUN] Would run: git pull")
 
         # Restore stash if we stashed
@@ -95,10 +111,7 @@ def main(
 
     typer.echo(f"Current branch: {original_branch}")
     typer.echo(f"Fetching all remotes...")
-    if not dry_run:
-        fetch_all()
-    else:
-        typer.echo(f"[DRY RUN] Would run: git fetch --prune --all --tags --recurse-submodules")
+    fetch_remotes(max_fetch_age, dry_run)
 
     typer.echo(f"Switching to {branch} to pull updates...")
 
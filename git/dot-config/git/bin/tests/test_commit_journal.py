@@ -0,0 +1,142 @@
+"""Tests for commit_journal.py, the local database of commits behind daily-work-summary.py."""
+import os
+import sqlite3
+import subprocess
+
+import pytest
+
+import commit_journal
+from commit_journal import Commit, CommitJournal, parse_since
+
+
+def git(*args, cwd):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+
+def hashes_and_summaries(commits):
+    return [(commit.sha, commit.summary) for commit in commits]
+
+
+def commit(repo, message, email="test@example.com", date=None):
+    """Make an (empty) commit, optionally dated (author and committer both)."""
+    identity = ["-c", f"user.email={email}", "-c", "user.name=Test User"]
+    env = None
+    if date is not None:
+        env = {**os.environ, "GIT_AUTHOR_DATE": date, "GIT_COMMITTER_DATE": date}
+    subprocess.run(
+        ["git", *identity, "commit", "--allow-empty", "--message", message],
+        cwd=repo,
+        env=env,
+        check=True,
+        capture_output=True,
+    )
+    return git("rev-parse", "HEAD", cwd=repo).strip()
+
+
+@pytest.fixture
+def journal(tmp_path):
+    with CommitJournal(tmp_path / "cache" / "journal.sqlite3") as journal:
+        yield journal
+
+
+@pytest.fixture
+def count_walks(monkeypatch):
+    """Record the revisions of every `git log` the journal runs."""
+    walks = []
+    original = commit_journal.log_commits
+
+    def counting_log_commits(repo, *revisions):
+        walks.append(revisions)
+        return original(repo, *revisions)
+
+    monkeypatch.setattr(commit_journal, "log_commits", counting_log_commits)
+    return walks
+
+
+def test_parse_since_matches_git(git_repo):
+    """Test that dates are read the way git reads them."""
+    assert parse_since("2025-12-30 08:00 +0000", git_repo) == 1767081600
+
+
+def test_commits_by_author_newest_first(git_repo, journal):
+    """Test that a query returns only the author's commits in the time range, newest first."""
+    old = commit(git_repo, "old", date="2020-01-01T12:00:00Z")
+    first = commit(git_repo, "first", date="2030-01-01T12:00:00Z")
+    commit(git_repo, "someone else's", email="other@example.com", date="2030-01-02T12:00:00Z")
+    second = commit(git_repo, "second", date="2030-01-03T12:00:00Z")
+    since = parse_since("2029-12-31", git_repo)
+
+    journal.ingest(git_repo, since)
+    commits = journal.commits(git_repo, since, "test@example.com")
+    assert commits == [
+        Commit(second, "Test User", "test@example.com", parse_since("2030-01-03T12:00:00Z", git_repo), "second"),
+        Commit(first, "Test User", "test@example.com", parse_since("2030-01-01T12:00:00Z", git_repo), "first"),
+    ]
+    assert (old, "old") not in hashes_and_summaries(journal.commits(git_repo, 0, "test@example.com"))
+
+
+def test_nothing_new_means_no_walk(git_repo, journal, count_walks):
+    """Test that a repository whose branches haven't moved costs no `git log` at all."""
+    journal.ingest(git_repo, 0)
+    count_walks.clear()
+    assert journal.ingest(git_repo, 0) == 0
+    assert count_walks == []
+
+
+def test_only_new_commits_are_walked(git_repo, journal, count_walks):
+    """Test that a moved branch is walked only from its new tip down to the old one."""
+    journal.ingest(git_repo, 0)
+    old_tip = git("rev-parse", "HEAD", cwd=git_repo).strip()
+    count_walks.clear()
+    new = commit(git_repo, "new")
+    assert journal.ingest(git_repo, 0) == 1
+    assert count_walks == [(new, "--not", old_tip)]
+    assert (new, "new") in hashes_and_summaries(journal.commits(git_repo, 0, "test@example.com"))
+
+
+def test_remote_tracking_branches_are_journaled(git_repo_with_remote, journal, tmp_path):
+    """Test that commits only on a remote-tracking branch are recorded too."""
+    repo, remote = git_repo_with_remote
+    journal.ingest(repo, 0)
+    upstream = tmp_path / "upstream"
+    git("clone", str(remote), str(upstream), cwd=tmp_path)
+    pushed = commit(upstream, "pushed from elsewhere")
+    git("push", "origin", "HEAD:main", cwd=upstream)
+    git("fetch", "origin", cwd=repo)
+    assert journal.ingest(repo, 0) == 1
+    assert (pushed, "pushed from elsewhere") in hashes_and_summaries(journal.commits(repo, 0, "test@example.com"))
+
+
+def test_looking_further_back_walks_again(git_repo, journal, count_walks):
+    """Test that asking for an earlier time than ever before fills in the older commits."""
+    old = commit(git_repo, "old", date="2020-01-01T12:00:00Z")
+    commit(git_repo, "recent", date="2025-01-01T12:00:00Z")
+    journal.ingest(git_repo, parse_since("2024-01-01", git_repo))
+    assert (old, "old") not in hashes_and_summaries(journal.commits(git_repo, 0, "test@example.com"))
+
+    journal.ingest(git_repo, parse_since("2019-01-01", git_repo))
+    assert (old, "old") in hashes_and_summaries(journal.commits(git_repo, 0, "test@example.com"))
+    assert len(count_walks) == 2
+
+    count_walks.clear()
+    journal.ingest(git_repo, parse_since("2024-01-01", git_repo))
+    assert count_walks == []
+
+
+def test_older_journal_is_started_over(git_repo, tmp_path):
+    """Test that a journal kept by an older version (a different schema) is replaced, not misread."""
+    path = tmp_path / "journal.sqlite3"
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE commits (repo, sha, author_email, committed_at, summary)")
+        connection.execute("INSERT INTO commits VALUES (?, 'abc', 'test@example.com', 0, 'stale')", (str(git_repo),))
+    first = commit(git_repo, "first")
+    with CommitJournal(path) as journal:
+        journal.ingest(git_repo, 0)
+        summaries = hashes_and_summaries(journal.commits(git_repo, 0, "test@example.com"))
+    assert (first, "first") in summaries and ("abc", "stale") not in summaries
+
+
+def test_default_journal_file(tmp_path, monkeypatch):
+    """Test that the journal lives under $XDG_CACHE_HOME."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    assert commit_journal.default_journal_file() == tmp_path / "cache" / "git-bin" / "commit-journal.sqlite3"
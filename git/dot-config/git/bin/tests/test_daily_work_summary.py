@@ -0,0 +1,299 @@
+"""Tests for daily-work-summary.py script."""
+import importlib.util
+import json
+import sqlite3
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+import typer.testing
+
+# Import daily-work-summary.py using importlib (can't use regular import due to hyphens)
+SCRIPT_PATH = Path(__file__).parent.parent / "daily-work-summary.py"
+spec = importlib.util.spec_from_file_location("daily_work_summary", SCRIPT_PATH)
+daily_work_summary = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(daily_work_summary)
+
+fetch_repo = daily_work_summary.fetch_repo
+fetched_recently = daily_work_summary.fetched_recently
+survey_repos = daily_work_summary.survey_repos
+app = daily_work_summary.app
+
+runner = typer.testing.CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Keep the repo index and the commit journal out of the real cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+def git(*args, cwd):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout
+
+
+def commit(repo, message):
+    """Make an (empty) commit as the test user."""
+    identity = ["-c", "user.email=test@example.com", "-c", "user.name=Test User"]
+    git(*identity, "commit", "--allow-empty", "--message", message, cwd=repo)
+
+
+@pytest.fixture
+def repos_with_file_remotes(tmp_path):
+    """
+    Three repositories under a repos directory, each cloned from its own bare remote through a file:// URL,
+    and each remote one commit ahead of its clone.
+
+    Returns:
+        tuple: (repos_dir, list of repo paths in sorted order)
+    """
+    repos_dir = tmp_path / "repos"
+    repos = []
+    for name in ("alpha", "bravo", "charlie"):
+        remote = tmp_path / "remotes" / f"{name}.git"
+        remote.mkdir(parents=True)
+        git("init", "--bare", "--initial-branch=main", cwd=remote)
+        upstream = tmp_path / "upstream" / name
+        git("clone", remote.as_uri(), str(upstream), cwd=tmp_path)
+        commit(upstream, f"{name}: first")
+        git("push", "origin", "HEAD:main", cwd=upstream)
+
+        repo = repos_dir / name
+        git("clone", remote.as_uri(), str(repo), cwd=tmp_path)
+        git("config", "user.email", "test@example.com", cwd=repo)
+
+        commit(upstream, f"{name}: only on the remote")
+        git("push", "origin", "HEAD:main", cwd=upstream)
+        repos.append(repo)
+    return repos_dir, repos
+
+
+def test_fetch_repo_from_file_remote(repos_with_file_remotes):
+    """Test that fetch_repo brings in what's new on the remote."""
+    _, repos = repos_with_file_remotes
+    assert fetch_repo(repos[0], timeout=30) == "✓"
+    assert "only on the remote" in git("log", "-1", "--format=%s", "origin/main", cwd=repos[0])
+
+
+def test_fetch_repo_times_out(git_repo):
+    """Test that a fetch that hangs is killed after the timeout."""
+    git("config", "protocol.ext.allow", "always", cwd=git_repo)
+    git("remote", "add", "origin", "ext::sleep 30", cwd=git_repo)
+    start = time.monotonic()
+    assert fetch_repo(git_repo, timeout=0.5) == "(timed out)"
+    assert time.monotonic() - start < 10
+    assert not fetched_recently(git_repo)
+
+
+def test_fetch_repo_fetch_fails(git_repo, tmp_path):
+    """Test that a fetch that fails is reported, not raised."""
+    git("remote", "add", "origin", (tmp_path / "nowhere.git").as_uri(), cwd=git_repo)
+    assert fetch_repo(git_repo, timeout=30) == "(no remotes)"
+
+
+def test_partly_failed_fetch_is_not_fresh(repos_with_file_remotes, tmp_path):
+    """Test that fetching one remote, then failing on the next, doesn't make the repo look freshly fetched."""
+    _, repos = repos_with_file_remotes
+    git("remote", "add", "zzz-broken", (tmp_path / "nowhere.git").as_uri(), cwd=repos[0])
+    assert fetch_repo(repos[0], timeout=30) == "(no remotes)"
+    assert (repos[0] / ".git" / "FETCH_HEAD").stat().st_size
+    assert not fetched_recently(repos[0])
+    assert fetch_repo(repos[1], timeout=30) == "✓"
+    assert fetched_recently(repos[1])
+
+
+def test_survey_repos_in_order(repos_with_file_remotes):
+    """Test that surveying several repos at once yields each, in order, fetched and with its commits."""
+    _, repos = repos_with_file_remotes
+    surveys = list(survey_repos(repos, "1 hour ago", None, fetch=True, fetch_timeout=30, jobs=3))
+    assert [survey.repo for survey in surveys] == repos
+    assert all(survey.fetch_status == "✓" for survey in surveys)
+    assert all(survey.commits for survey in surveys)
+
+
+def test_survey_repos_without_fetch(repos_with_file_remotes):
+    """Test that --no-fetch neither fetches nor reports fetching."""
+    _, repos = repos_with_file_remotes
+    surveys = list(survey_repos(repos, "1 hour ago", None, fetch=False, fetch_timeout=30, jobs=2))
+    assert all(survey.fetch_status is None for survey in surveys)
+    assert all(survey.commits for survey in surveys)
+
+
+def test_survey_repos_skips_fresh_fetches(repos_with_file_remotes):
+    """Test that a repo fetched within --max-fetch-age isn't fetched again."""
+    _, repos = repos_with_file_remotes
+    fetch_repo(repos[0], timeout=30)
+    surveys = list(survey_repos(repos, "1 hour ago", None, fetch=True, fetch_timeout=30, jobs=3, max_fetch_age=300))
+    assert [survey.fetch_status for survey in surveys] == ["(fetched recently)", "✓", "✓"]
+
+
+@pytest.fixture
+def broken_repo(repos_with_file_remotes):
+    """Break the second repo ("bravo") with a config file git can't parse, so every git command in it fails."""
+    _, repos = repos_with_file_remotes
+    with (repos[1] / ".git" / "config").open("a") as config:
+        config.write("[not a config line\n")
+    return repos[1]
+
+
+@pytest.mark.parametrize("journal", [True, False])
+def test_survey_repos_survives_a_broken_repo(repos_with_file_remotes, broken_repo, journal):
+    """Test that a repo git fails on gets an error, and every other repo is still surveyed."""
+    _, repos = repos_with_file_remotes
+    # An explicit author, or bravo would just have no email (its config can't be read) rather than fail
+    email = "test@example.com"
+    surveys = list(survey_repos(repos, "1 hour ago", email, fetch=False, fetch_timeout=30, jobs=3, journal=journal))
+    assert [survey.repo for survey in surveys] == repos
+    assert [survey.error is not None for survey in surveys] == [False, True, False]
+    assert surveys[0].commits and surveys[2].commits and not surveys[1].commits
+
+
+def test_survey_repos_survives_a_journal_error(repos_with_file_remotes, monkeypatch):
+    """Test that a repo the commit journal fails on gets an error, and every other repo is still surveyed."""
+    _, repos = repos_with_file_remotes
+    ingest = daily_work_summary.CommitJournal.ingest
+
+    def locked_for_bravo(self, repo, since):
+        if repo.name == "bravo":
+            raise sqlite3.OperationalError("database is locked")
+        return ingest(self, repo, since)
+
+    monkeypatch.setattr(daily_work_summary.CommitJournal, "ingest", locked_for_bravo)
+    surveys = list(survey_repos(repos, "1 hour ago", None, fetch=False, fetch_timeout=30, jobs=3, journal=True))
+    assert [survey.error for survey in surveys] == [None, "OperationalError: database is locked", None]
+
+
+@pytest.mark.parametrize("output_format", ["text", "ndjson", "json"])
+def test_cli_reports_the_rest_of_a_broken_repo(repos_with_file_remotes, broken_repo, output_format):
+    """Test that one broken repo is reported on stderr, the report covers the rest, and the exit status says so."""
+    repos_dir, _ = repos_with_file_remotes
+    arguments = ["--repos-dir", str(repos_dir), "--since", "1 hour ago", "--no-fetch", "--format", output_format]
+    result = runner.invoke(app, [*arguments, "--author-email", "test@example.com"])
+    assert result.exit_code == 1, result.output
+    assert "Skipping bravo: " in result.stderr
+    assert "Could not search 1 repositories: bravo" in result.stderr
+    if output_format == "text":
+        assert "alpha:" in result.stdout and "charlie:" in result.stdout
+        assert "commits across 2 repos" in result.stdout
+    else:
+        if output_format == "ndjson":
+            records = [json.loads(line) for line in result.stdout.splitlines()]
+        else:
+            records = json.loads(result.stdout)
+        assert {record["repo"] for record in records} == {"alpha", "charlie"}
+
+
+def test_cli_parallel_fetch(repos_with_file_remotes):
+    """Test the whole report with several fetches at once: progress and summary both in repo order."""
+    repos_dir, _ = repos_with_file_remotes
+    result = runner.invoke(app, ["--repos-dir", str(repos_dir), "--since", "1 hour ago", "--jobs", "3"])
+    assert result.exit_code == 0, result.output
+    progress = [line for line in result.output.splitlines() if line.startswith("Fetching ")]
+    assert progress == [f"Fetching {name}... ✓" for name in ("alpha", "bravo", "charlie")]
+    assert result.output.index("alpha:") < result.output.index("bravo:") < result.output.index("charlie:")
+    assert "commits across 3 repos" in result.output
+
+
+def test_cli_journal_matches_git_log(repos_with_file_remotes):
+    """Test that the report from the commit journal, first run and second, is the report straight from git."""
+    repos_dir, _ = repos_with_file_remotes
+    arguments = ["--repos-dir", str(repos_dir), "--since", "1 hour ago"]
+
+    def summary(output):
+        return output[output.index("=== Work Summary"):]
+
+    direct = summary(runner.invoke(app, [*arguments, "--no-journal"]).output)
+    assert summary(runner.invoke(app, arguments).output) == direct
+    assert summary(runner.invoke(app, arguments).output) == direct
+
+
+@pytest.fixture
+def repo_with_several_authors(git_repo):
+    """The test repository, with a commit each by more authors (its first commit is Test User's)."""
+    for name, email in [
+        ("Test User", "test@example.com"),
+        ("Alice Smith", "alice@example.org"),
+        ("Bob", "me+tag@Example.com"),
+        ("Carol 2", "carol2@example.net"),
+    ]:
+        identity = ["-c", f"user.name={name}", "-c", f"user.email={email}"]
+        git(*identity, "commit", "--allow-empty", "--message", f"by {name}", cwd=git_repo)
+    return git_repo
+
+
+@pytest.mark.parametrize(
+    "author, count",
+    [
+        ("test@example.com", 2),
+        ("TEST@example.com", 0),
+        ("example", 4),
+        ("Alice", 1),
+        ("^Bob <", 1),
+        ("me+tag", 1),
+        (r"me\+tag", 0),
+        ("e.ample", 4),
+        (r"\(Alice\|Carol\) ", 2),
+        ("Alice|Bob", 0),
+        ("[[:digit:]] <", 1),
+        ("[^a-z]@", 1),
+        (".org>$", 1),
+        ("*User", 0),
+    ],
+)
+def test_journal_matches_authors_like_git_log(repo_with_several_authors, author, count):
+    """Test that the journal finds the commits `git log --author` does: by email, part of one, name, or pattern."""
+    repo = repo_with_several_authors
+
+    def commits(journal):
+        [survey] = survey_repos([repo], "1 hour ago", author, fetch=False, fetch_timeout=30, jobs=1, journal=journal)
+        assert survey.error is None
+        return survey.commits
+
+    direct = commits(journal=False)
+    assert len(direct) == count
+    assert commits(journal=True) == direct
+
+
+def test_cli_ndjson(repos_with_file_remotes):
+    """Test that --format ndjson writes only one JSON record per commit to stdout, and progress to stderr."""
+    repos_dir, repos = repos_with_file_remotes
+    result = runner.invoke(app, ["--repos-dir", str(repos_dir), "--since", "1 hour ago", "--format", "ndjson"])
+    assert result.exit_code == 0, result.output
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert {record["repo"] for record in records} == {"alpha", "bravo", "charlie"}
+    assert {"alpha: first", "alpha: only on the remote"} <= {record["summary"] for record in records}
+    record = records[0]
+    assert record["path"] == str(repos_dir / record["repo"])
+    assert record["hash"] == git("rev-parse", record["hash"], cwd=record["path"]).strip()
+    assert record["author"] == "test@example.com"
+    commit_date = git("log", "-1", "--format=%cd", "--date=short-local", record["hash"], cwd=record["path"])
+    assert record["timestamp"].startswith(commit_date.strip())
+    assert "Fetching alpha..." in result.stderr
+
+
+def test_cli_json_matches_ndjson(repos_with_file_remotes):
+    """Test that --format json is the same records as --format ndjson, as one array, in repo order."""
+    repos_dir, _ = repos_with_file_remotes
+    arguments = ["--repos-dir", str(repos_dir), "--since", "1 hour ago", "--no-fetch"]
+    streamed = runner.invoke(app, [*arguments, "--format", "ndjson"]).stdout
+    records = json.loads(runner.invoke(app, [*arguments, "--format", "json"]).stdout)
+    assert [record["repo"] for record in records] == sorted(record["repo"] for record in records)
+    assert sorted(map(json.dumps, records)) == sorted(streamed.splitlines())
+
+
+def test_cli_finds_new_repo_and_rescan(repos_with_file_remotes, tmp_path):
+    """Test that a repo cloned after the first run is found by the next one, with or without --rescan."""
+    repos_dir, _ = repos_with_file_remotes
+    arguments = ["--repos-dir", str(repos_dir), "--no-fetch"]
+    assert "Found 3 repositories" in runner.invoke(app, arguments).output
+    git("clone", (tmp_path / "remotes" / "alpha.git").as_uri(), str(repos_dir / "delta"), cwd=tmp_path)
+    assert "Found 4 repositories" in runner.invoke(app, arguments).output
+    assert "Found 4 repositories" in runner.invoke(app, [*arguments, "--rescan"]).output
+
+
+def test_cli_rejects_zero_jobs(tmp_path):
+    """Test that --jobs must be at least 1."""
+    result = runner.invoke(app, ["--repos-dir", str(tmp_path), "--jobs", "0"])
+    assert result.exit_code != 0
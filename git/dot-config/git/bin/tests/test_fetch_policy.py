@@ -0,0 +1,97 @@
+"""Tests for fetch_policy.py, the rule for when a fetch can be skipped."""
+import os
+import subprocess
+
+from fetch_policy import fetch_age, fetch_stamp, fetch_unless_fresh, fetched_recently, record_fetch
+
+
+def fetch(repo):
+    subprocess.run(["git", "fetch", "--all"], cwd=repo, check=True, capture_output=True)
+
+
+def age_last_fetch(repo, seconds):
+    """Make the last fetch look `seconds` older than it is."""
+    stamp = fetch_stamp(repo)
+    then = stamp.stat().st_mtime - seconds
+    os.utime(stamp, (then, then))
+
+
+def test_never_fetched(git_repo):
+    """Test that a repo that has never fetched is never fresh."""
+    assert fetch_age(git_repo) is None
+    assert not fetched_recently(git_repo)
+
+
+def test_not_a_repository(tmp_path):
+    """Test that a directory that isn't a repository is never fresh, and recording a fetch there does nothing."""
+    record_fetch(tmp_path)
+    assert fetch_age(tmp_path) is None
+
+
+def test_just_fetched(git_repo_with_remote):
+    """Test that a repo that just fetched is fresh, unless the maximum age is 0."""
+    git_repo, _ = git_repo_with_remote
+    fetch(git_repo)
+    record_fetch(git_repo)
+    assert fetched_recently(git_repo, max_age=300)
+    assert not fetched_recently(git_repo, max_age=0)
+
+
+def test_fetched_too_long_ago(git_repo_with_remote):
+    """Test that a fetch older than the maximum age doesn't count."""
+    git_repo, _ = git_repo_with_remote
+    record_fetch(git_repo)
+    age_last_fetch(git_repo, 600)
+    assert 590 < fetch_age(git_repo) < 700
+    assert not fetched_recently(git_repo, max_age=300)
+
+
+def test_other_fetches_do_not_count(git_repo_with_remote):
+    """Test that a fetch nothing recorded (a `git pull`, a fetch that failed part way) leaves the repo stale."""
+    git_repo, _ = git_repo_with_remote
+    subprocess.run(["git", "pull", "origin", "main"], cwd=git_repo, check=True, capture_output=True)
+    assert (git_repo / ".git" / "FETCH_HEAD").stat().st_size
+    assert not fetched_recently(git_repo)
+
+
+def test_worktree_sees_main_repo_fetch(git_repo_with_remote, tmp_path):
+    """Test that a fetch recorded in the main repo counts for its worktrees, and the other way around."""
+    git_repo, _ = git_repo_with_remote
+    worktree = tmp_path / "feature"
+    subprocess.run(["git", "worktree", "add", "-b", "feature", str(worktree)], cwd=git_repo, check=True,
+                   capture_output=True)
+    record_fetch(git_repo)
+    assert fetched_recently(worktree)
+    age_last_fetch(git_repo, 600)
+    record_fetch(worktree)
+    assert fetched_recently(git_repo)
+
+
+def test_fetch_unless_fresh(git_repo_with_remote):
+    """Test that the fetch function is called only when the last fetch is stale, and that its success is recorded."""
+    git_repo, _ = git_repo_with_remote
+    calls = []
+
+    def recording_fetch(**kwargs):
+        calls.append(kwargs)
+        fetch(kwargs["repo"])
+
+    assert fetch_unless_fresh(recording_fetch, git_repo, 300, quiet=True)
+    assert calls == [{"quiet": True, "repo": git_repo}]
+    assert not fetch_unless_fresh(recording_fetch, git_repo, 300, quiet=True)
+    assert len(calls) == 1
+    assert fetch_unless_fresh(recording_fetch, git_repo, 0, quiet=True)
+    assert len(calls) == 2
+
+
+def test_failed_fetch_is_not_recorded(git_repo):
+    """Test that a fetch function that raises leaves the repo stale."""
+
+    def failing_fetch(**kwargs):
+        raise subprocess.CalledProcessError(1, "git fetch")
+
+    try:
+        fetch_unless_fresh(failing_fetch, git_repo, 300)
+    except subprocess.CalledProcessError:
+        pass
+    assert not fetched_recently(git_repo)
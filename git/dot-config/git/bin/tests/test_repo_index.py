@@ -0,0 +1,109 @@
+"""Tests for repo_index.py, the saved index of repositories under a directory."""
+import os
+
+import pytest
+
+import repo_index
+from repo_index import find_repos
+
+
+def make_repo(path):
+    """A directory that looks like a repository to the index: it has a .git directory."""
+    (path / ".git").mkdir(parents=True)
+    return path
+
+
+@pytest.fixture
+def repos_tree(tmp_path):
+    """
+    A repos directory with two repositories (one nested a level down), a worktree, a repository inside a repository,
+    and a symbolic link to a repository.
+
+    Returns:
+        tuple: (repos_dir, index_file)
+    """
+    repos_dir = tmp_path / "repos"
+    make_repo(repos_dir / "alpha")
+    make_repo(repos_dir / "work" / "bravo")
+    make_repo(repos_dir / "alpha" / "node_modules" / "vendored")
+    (repos_dir / "alpha-feature").mkdir()
+    (repos_dir / "alpha-feature" / ".git").write_text("gitdir: ../alpha/.git/worktrees/alpha-feature\n")
+    os.symlink(repos_dir / "alpha", repos_dir / "link")
+    return repos_dir, tmp_path / "cache" / "index.json"
+
+
+@pytest.fixture
+def count_listings(monkeypatch):
+    """Count how many times each directory is listed."""
+    listed = []
+    original = repo_index.scan_directory
+
+    def counting_scan_directory(directory, mtime_ns):
+        listed.append(directory.name)
+        return original(directory, mtime_ns)
+
+    monkeypatch.setattr(repo_index, "scan_directory", counting_scan_directory)
+    return listed
+
+
+def test_finds_repositories_only(repos_tree):
+    """Test that worktrees, repositories inside repositories, and symbolic links are all left out."""
+    repos_dir, index_file = repos_tree
+    assert find_repos(repos_dir, index_file) == [repos_dir / "alpha", repos_dir / "work" / "bravo"]
+
+
+def test_unchanged_tree_lists_nothing(repos_tree, count_listings):
+    """Test that a second run with nothing changed only stats directories."""
+    repos_dir, index_file = repos_tree
+    first = find_repos(repos_dir, index_file)
+    count_listings.clear()
+    assert find_repos(repos_dir, index_file) == first
+    assert count_listings == []
+
+
+def test_only_changed_directories_are_listed(repos_tree, count_listings):
+    """Test that a new repository is found by listing just the directories that changed."""
+    repos_dir, index_file = repos_tree
+    find_repos(repos_dir, index_file)
+    count_listings.clear()
+    make_repo(repos_dir / "work" / "charlie")
+    assert find_repos(repos_dir, index_file) == [
+        repos_dir / "alpha",
+        repos_dir / "work" / "bravo",
+        repos_dir / "work" / "charlie",
+    ]
+    assert sorted(count_listings) == ["charlie", "work"]
+
+
+def test_removed_repository_is_forgotten(repos_tree):
+    """Test that a repository that's gone is no longer reported."""
+    repos_dir, index_file = repos_tree
+    find_repos(repos_dir, index_file)
+    (repos_dir / "work" / "bravo" / ".git").rmdir()
+    assert find_repos(repos_dir, index_file) == [repos_dir / "alpha"]
+
+
+def test_rescan_lists_everything(repos_tree, count_listings):
+    """Test that rescan ignores the saved index."""
+    repos_dir, index_file = repos_tree
+    find_repos(repos_dir, index_file)
+    count_listings.clear()
+    find_repos(repos_dir, index_file, rescan=True)
+    assert sorted(count_listings) == ["alpha", "alpha-feature", "bravo", "repos", "work"]
+
+
+def test_unreadable_index_means_a_full_walk(repos_tree):
+    """Test that a corrupt index file is ignored, then replaced."""
+    repos_dir, index_file = repos_tree
+    index_file.parent.mkdir(parents=True)
+    index_file.write_text("not json")
+    assert find_repos(repos_dir, index_file) == [repos_dir / "alpha", repos_dir / "work" / "bravo"]
+    assert repo_index.read_index(index_file, repos_dir)
+
+
+def test_default_index_file_is_per_root(tmp_path, monkeypatch):
+    """Test that each root gets its own index file under $XDG_CACHE_HOME."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    first = repo_index.default_index_file(tmp_path / "one")
+    assert first.parent == tmp_path / "cache" / "git-bin"
+    assert first != repo_index.default_index_file(tmp_path / "two")
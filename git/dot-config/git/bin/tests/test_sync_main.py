@@ -9,6 +9,7 @@ import typer
 import typer.testing
 
 from conftest import run_script_with_coverage
+from fetch_policy import record_fetch
 
 # Import sync-main.py using importlib (can't use regular import due to hyphen)
 SCRIPT_PATH = Path(__file__).parent.parent / "sync-main.py"
@@ -704,3 +705,21 @@ def test_main_cherry_pick_with_stash_failure(git_repo_with_remote, tmp_path, mon
 
     # Clean up
     subprocess.run(["git", "cherry-pick", "--abort"], cwd=git_repo, capture_output=True)
+
+
+def test_main_skips_fetch_when_fresh(git_repo_with_remote, monkeypatch, capsys):
+    """Test that a fetch newer than --max-fetch-age isn't repeated, and that 0 always fetches."""
+    git_repo, remote_repo = git_repo_with_remote
+    monkeypatch.chdir(git_repo)
+    subprocess.run(["git", "checkout", "-b", "test-branch"], cwd=git_repo, check=True, capture_output=True)
+    subprocess.run(["git", "fetch", "--all"], cwd=git_repo, check=True, capture_output=True)
+    record_fetch(git_repo)
+
+    main(branch="main", target="", stash=False, dry_run=True, max_fetch_age=300)
+    captured = capsys.readouterr()
+    assert "not fetching again" in captured.out
+    assert "Would run: git fetch" not in captured.out
+
+    main(branch="main", target="", stash=False, dry_run=True, max_fetch_age=0)
+    captured = capsys.readouterr()
+    assert "Would run: git fetch" in captured.out
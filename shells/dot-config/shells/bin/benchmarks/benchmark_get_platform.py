@@ -0,0 +1,139 @@
+#!/usr/bin/env -S uv run --no-project --script --quiet
+# /// script
+# requires-python = ">=3.13"
+# dependencies = [
+#     "typer",
+#     "typing_extensions",
+# ]
+# ///
+"""
+Time `get_platform` on each of the platforms it tells apart, whatever platform this actually runs on.
+
+Each scenario (Linux, WSL, macOS, MinGW, Cygwin) is simulated: the environment variables `detect_platform` looks at are
+set or cleared, and `os.uname` reports the matching system name and kernel release (calling the mock costs a little
+more than the real `os.uname`).  For each scenario this measures, in microseconds per call:
+
+- `detect_platform`, i.e., what the first call in a process costs;
+- `get_platform` once it has remembered its answer, i.e., every call after the first;
+- `get_platform` in a process told the answer through `$SHELLS_PLATFORM` (see `export_platform`).
+
+With `--get-platform`, it also times `get_platform` from another `get_platform.py`, e.g., one from before it stopped
+running `uname -r`.  That one may not notice the simulated `os.uname` (and so may answer for the real platform), but
+what it costs is still the point.
+
+Example:
+    $ benchmarks/benchmark_get_platform.py --get-platform /tmp/old_get_platform.py
+"""
+
+import os
+import sys
+import timeit
+from contextlib import contextmanager
+from pathlib import Path
+from types import ModuleType
+from typing import Iterator, Optional
+from unittest import mock
+
+import typer
+from typing_extensions import Annotated
+
+_BENCHMARKS_DIR = Path(__file__).resolve().parent
+_BIN_DIR = _BENCHMARKS_DIR.parent
+for _dir in (_BIN_DIR, _BENCHMARKS_DIR):
+    if str(_dir) not in sys.path:
+        sys.path.insert(0, str(_dir))
+
+import get_platform  # noqa: E402
+from count_topic_syscalls import load_get_topics  # noqa: E402
+
+
+# Every variable `detect_platform` reads; each scenario starts with all of them unset
+PLATFORM_VARIABLES = ("MSYSTEM", "MSYSTEM_CHOST", "CYGWIN", "TERM", get_platform.PLATFORM_ENVIRONMENT_VARIABLE)
+
+# scenario → (environment, `os.uname().sysname`, `os.uname().release`)
+SCENARIOS: dict[str, tuple[dict[str, str], str, str]] = {
+    "linux": ({"TERM": "xterm-256color"}, "Linux", "6.8.0-45-generic"),
+    "wsl": ({"TERM": "xterm-256color"}, "Linux", "5.15.153.1-microsoft-standard-WSL2"),
+    "darwin": ({"TERM": "xterm-256color"}, "Darwin", "23.6.0"),
+    "mingw": ({"MSYSTEM": "MINGW64", "TERM": "xterm"}, "MINGW64_NT-10.0-19045", "3.4.10-87d57229.x86_64"),
+    "cygwin": ({"TERM": "cygwin"}, "CYGWIN_NT-10.0-19045", "3.5.3-1.x86_64"),
+}
+
+
+@contextmanager
+def simulated(scenario: str) -> Iterator[None]:
+    """Within this context, the process looks as if it's running on `scenario`."""
+    environment, sysname, release = SCENARIOS[scenario]
+    real = os.uname()
+    uname = os.uname_result((sysname, real.nodename, release, real.version, real.machine))
+    cleared = {name: "" for name in PLATFORM_VARIABLES}
+    with mock.patch.dict(os.environ, cleared), mock.patch("os.uname", return_value=uname):
+        for name in PLATFORM_VARIABLES:
+            del os.environ[name]
+        os.environ.update(environment)
+        yield
+
+
+def microseconds_per_call(function) -> float:
+    """The fastest of five timings of `function`, each over enough calls to take a while, per call."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e6
+
+
+def uncached(module: ModuleType):
+    """`module.get_platform`, made to do its work on every call, whether or not that version remembers its answer."""
+    function = module.get_platform
+
+    def call():
+        if hasattr(function, "cache_clear"):
+            function.cache_clear()
+        return function()
+
+    return call
+
+
+def benchmark_scenario(scenario: str, baseline: ModuleType | None) -> dict:
+    with simulated(scenario):
+        answer = get_platform.detect_platform()
+        result = {
+            "scenario": scenario,
+            "answer": answer,
+            "detect_us": microseconds_per_call(get_platform.detect_platform),
+        }
+        get_platform.get_platform.cache_clear()
+        get_platform.get_platform()
+        result["cached_us"] = microseconds_per_call(get_platform.get_platform)
+        os.environ[get_platform.PLATFORM_ENVIRONMENT_VARIABLE] = answer
+        result["environment_us"] = microseconds_per_call(uncached(get_platform))
+        del os.environ[get_platform.PLATFORM_ENVIRONMENT_VARIABLE]
+        if baseline is not None:
+            result["baseline_answer"] = uncached(baseline)()
+            result["baseline_us"] = microseconds_per_call(uncached(baseline))
+    get_platform.get_platform.cache_clear()
+    return result
+
+
+def main(
+    get_platform_path: Annotated[
+        Optional[Path],
+        typer.Option("--get-platform", help="Also time this get_platform.py, e.g., an older one"),
+    ] = None,
+):
+    """Time `get_platform` in each simulated scenario, and print a table (microseconds per call)."""
+    baseline = load_get_topics(get_platform_path, "get_platform_under_test") if get_platform_path else None
+    typer.echo(
+        f"{'scenario':<9} {'answer':<8} {'detect µs':>10} {'cached µs':>10} {'env µs':>8}"
+        + (f" {'baseline µs':>12} (answer)" if baseline is not None else "")
+    )
+    for scenario in SCENARIOS:
+        result = benchmark_scenario(scenario, baseline)
+        typer.echo(
+            f"{scenario:<9} {result['answer']:<8} {result['detect_us']:>10.2f} {result['cached_us']:>10.3f}"
+            f" {result['environment_us']:>8.2f}"
+            + (f" {result['baseline_us']:>12.2f} {result['baseline_answer']}" if baseline is not None else "")
+        )
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,168 @@
+#!/usr/bin/env -S uv run --no-project --script --quiet
+# /// script
+# requires-python = ">=3.13"
+# dependencies = [
+#     "typer",
+#     "typing_extensions",
+# ]
+# ///
+"""
+Benchmark `get_topics` on synthetic topic trees from 10 to 10,000 topics, and save the numbers as JSON.
+
+For each tree size this measures:
+
+- wall time of `get_topics` without a cache (the fastest and the median of `--repeat` runs), and with a warm cache
+    (n/a for a `get_topics` from before there was a cache);
+- filesystem calls, counted as by `count_topic_syscalls.py`;
+- peak memory allocated by Python during one call (from `tracemalloc`).
+
+The trees come from `synthetic_topics.make_topic_tree`: a mix of "*.sh", "*.bash", and "*.zsh" topics, "darwin",
+"linux", and "wsl" override directories, and initial, final, and non-interactive lists whose size scales with the
+tree.  Before changing `resolve_topic_paths`, `find_existing_topic_stems`, or anything near them, save a run with
+`--output`; after, run again with `--baseline` pointing at that file to see the difference.
+
+Example:
+    $ benchmarks/benchmark_get_topics.py --output /tmp/before.json
+    $ benchmarks/benchmark_get_topics.py --baseline /tmp/before.json
+"""
+
+import inspect
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from types import ModuleType
+from typing import List, Optional
+
+import typer
+from typing_extensions import Annotated
+
+_BENCHMARKS_DIR = Path(__file__).resolve().parent
+_BIN_DIR = _BENCHMARKS_DIR.parent
+for _dir in (_BIN_DIR, _BENCHMARKS_DIR):
+    if str(_dir) not in sys.path:
+        sys.path.insert(0, str(_dir))
+
+from count_topic_syscalls import count_filesystem_calls, load_get_topics  # noqa: E402
+from synthetic_topics import make_topic_tree  # noqa: E402
+
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+
+
+def time_calls(function, repeat: int) -> dict[str, float]:
+    """Call `function` `repeat` times; return the fastest and the median, in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {"min": min(timings), "median": statistics.median(timings)}
+
+
+def benchmark_tree(get_topics_module: ModuleType, topics_root: Path, shell: str, repeat: int) -> dict:
+    """Every measurement for one tree."""
+    get_topics = get_topics_module.get_topics
+
+    with count_filesystem_calls() as counts:
+        paths = get_topics(topics_root, [shell])
+
+    tracemalloc.start()
+    get_topics(topics_root, [shell])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    cached = None
+    if "cache_dir" in inspect.signature(get_topics).parameters:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            get_topics(topics_root, [shell], cache_dir=cache_dir)  # Warm the cache
+            cached = time_calls(lambda: get_topics(topics_root, [shell], cache_dir=cache_dir), repeat)
+
+    return {
+        "paths": len(paths),
+        "wall_ms": time_calls(lambda: get_topics(topics_root, [shell]), repeat),
+        "cached_wall_ms": cached,
+        "filesystem_calls": {"total": sum(counts.values()), **dict(sorted(counts.items()))},
+        "peak_memory_kib": peak / 1024,
+    }
+
+
+def run_benchmarks(get_topics_module: ModuleType, sizes: list[int], shell: str, repeat: int) -> dict:
+    results = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as temporary_dir:
+            topics_root = make_topic_tree(Path(temporary_dir) / "topics", size)
+            results.append({"topics": size, **benchmark_tree(get_topics_module, topics_root, shell, repeat)})
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "shell": shell,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def change(value: float, baseline: float | None) -> str:
+    """`value` as a signed percentage of `baseline`, or "" if there's nothing to compare against."""
+    if not baseline:
+        return ""
+    return f"{(value - baseline) / baseline * 100:+.0f}%"
+
+
+def cached_median(result: dict | None) -> float | None:
+    """The median warm-cache time from one result, or `None` if there isn't one (or it wasn't measured)."""
+    return result and result["cached_wall_ms"] and result["cached_wall_ms"]["median"]
+
+
+def print_report(report: dict, baseline: dict | None) -> None:
+    baseline_by_size = {result["topics"]: result for result in (baseline or {}).get("results", [])}
+    typer.echo(
+        f"{'topics':>7} {'paths':>7} {'median ms':>10} {'':>7} {'cached ms':>10} {'':>7}"
+        f" {'fs calls':>9} {'':>7} {'peak KiB':>9} {'':>7}"
+    )
+    for result in report["results"]:
+        old = baseline_by_size.get(result["topics"])
+        median, cached = result["wall_ms"]["median"], cached_median(result)
+        calls, peak = result["filesystem_calls"]["total"], result["peak_memory_kib"]
+        if cached is None:
+            cached_column = f"{'n/a':>10} {'':>7}"
+        else:
+            cached_column = f"{cached:>10.2f} {change(cached, cached_median(old)):>7}"
+        typer.echo(
+            f"{result['topics']:>7} {result['paths']:>7}"
+            f" {median:>10.2f} {change(median, old and old['wall_ms']['median']):>7}"
+            f" {cached_column}"
+            f" {calls:>9} {change(calls, old and old['filesystem_calls']['total']):>7}"
+            f" {peak:>9.1f} {change(peak, old and old['peak_memory_kib']):>7}"
+        )
+
+
+def main(
+    sizes: Annotated[Optional[List[int]], typer.Option("--size", help="Number of topics in a tree (repeatable)")] = None,
+    shell: Annotated[str, typer.Option(help="Which shell's topics to resolve")] = "bash",
+    repeat: Annotated[int, typer.Option(help="How many timed calls per measurement")] = 5,
+    output: Annotated[Optional[Path], typer.Option(help="Save the results to this JSON file")] = None,
+    baseline: Annotated[
+        Optional[Path], typer.Option(help="Results saved earlier with --output, to compare against")
+    ] = None,
+    get_topics_path: Annotated[
+        Optional[Path], typer.Option("--get-topics", help="Benchmark this get_topics.py instead, e.g., an older one")
+    ] = None,
+):
+    """Benchmark `get_topics` on synthetic trees; print a table, and optionally save JSON."""
+    get_topics_module = load_get_topics(get_topics_path or _BIN_DIR / "get_topics.py", "get_topics_under_test")
+    report = run_benchmarks(get_topics_module, sizes or DEFAULT_SIZES, shell, repeat)
+    print_report(report, json.loads(baseline.read_text()) if baseline is not None else None)
+    if output is not None:
+        output.write_text(json.dumps(report, indent=2) + "\n")
+        typer.echo(f"\nSaved results to {output}")
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,95 @@
+#!/usr/bin/env -S uv run --no-project --script --quiet
+# /// script
+# requires-python = ">=3.13"
+# dependencies = [
+#     "typer",
+#     "typing_extensions",
+# ]
+# ///
+"""
+Time starting scripts through their `uv run` shebang against starting them through `install_frozen.py`'s launchers.
+
+Each command line is run `--repeat` times each way (after one untimed run each, so both start warm), and the table
+shows the fastest and the median wall time, in milliseconds, and how many times faster the launcher's median is.  The
+first word of each command line names a script in the shells' "bin" (or `~/.config/git/bin`); the rest are its
+arguments.  Everything runs with its output thrown away.
+
+Install the launchers first (`install_frozen.py`), and have `uv` on `$PATH`.
+
+Example:
+    $ benchmarks/benchmark_launchers.py --command "get_topics.py ~/.config/shells/topics bash" --repeat 50
+"""
+
+import os
+import shlex
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+from typing_extensions import Annotated
+
+_BENCHMARKS_DIR = Path(__file__).resolve().parent
+_BIN_DIR = _BENCHMARKS_DIR.parent
+if str(_BIN_DIR) not in sys.path:
+    sys.path.insert(0, str(_BIN_DIR))
+
+from install_frozen import default_prefix, default_script_dirs  # noqa: E402
+
+
+DEFAULT_COMMANDS = [
+    "get_platform.py",
+    "deduplicate_path.py",
+    "get_topics.py ~/.config/shells/topics bash",
+]
+
+
+def time_command(command: list[str], repeat: int) -> dict[str, float]:
+    """Run `command` once untimed, then `repeat` times; return the fastest and the median, in milliseconds."""
+    timings = []
+    for run in range(repeat + 1):
+        start = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        if run:
+            timings.append((time.perf_counter() - start) * 1000)
+    return {"min": min(timings), "median": statistics.median(timings)}
+
+
+def find_script(name: str) -> Path | None:
+    """The script called `name` in the first of the script directories that has one."""
+    return next((d / name for d in default_script_dirs() if (d / name).is_file()), None)
+
+
+def main(
+    commands: Annotated[
+        Optional[List[str]],
+        typer.Option("--command", help="A command line to time (repeatable; default: a few from every shell start)"),
+    ] = None,
+    prefix: Annotated[
+        Optional[Path], typer.Option(help="Where install_frozen.py installed (default: $XDG_DATA_HOME/shells/frozen)")
+    ] = None,
+    repeat: Annotated[int, typer.Option(help="Timed runs of each command, each way")] = 20,
+):
+    """Time each command through its `uv run` shebang and through its launcher, and print a table."""
+    bin_dir = (prefix or default_prefix()) / "bin"
+    typer.echo(f"{'command':<45} {'uv min':>8} {'uv median':>10} {'frozen min':>11} {'frozen median':>14} {'speedup':>8}")
+    for command_line in commands or DEFAULT_COMMANDS:
+        name, *arguments = [os.path.expanduser(word) for word in shlex.split(command_line)]
+        script = find_script(name)
+        launcher = bin_dir / name
+        if script is None or not launcher.is_file():
+            typer.echo(f"Error: No script or no launcher for '{name}' (run install_frozen.py?)", err=True)
+            raise typer.Exit(1)
+        uv = time_command([str(script), *arguments], repeat)
+        frozen = time_command([str(launcher), *arguments], repeat)
+        typer.echo(
+            f"{command_line[:45]:<45} {uv['min']:>8.1f} {uv['median']:>10.1f} {frozen['min']:>11.1f}"
+            f" {frozen['median']:>14.1f} {uv['median'] / frozen['median']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    typer.run(main)
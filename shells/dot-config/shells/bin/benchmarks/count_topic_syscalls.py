@@ -0,0 +1,122 @@
+#!/usr/bin/env -S uv run --no-project --script --quiet
+# /// script
+# requires-python = ">=3.13"
+# dependencies = [
+#     "typer",
+#     "typing_extensions",
+# ]
+# ///
+"""
+Count the filesystem calls `get_topics` makes, for synthetic topic trees of several sizes.
+
+What's counted is every call from Python into `os.stat`, `os.lstat`, `os.scandir`, and `open`, including the calls
+`pathlib` and `glob` make on our behalf.  Each one of those is (at least) one system call.  This is in-process and
+needs no special tools; if you want the real, kernel-level numbers, run `get_topics.py` under
+`strace --follow-forks --summary-only --trace=%file,getdents64`.
+
+To see "before" and "after", give `--compare` a second copy of `get_topics.py`, e.g., one you got with
+`git show <commit>:shells/dot-config/shells/bin/get_topics.py > /tmp/get_topics_before.py`.  It will be imported
+with this directory's siblings (`get_platform`, `posix_path`) available.
+
+Example:
+    $ benchmarks/count_topic_syscalls.py --compare /tmp/get_topics_before.py
+"""
+
+import builtins
+import glob
+import importlib.util
+import os
+import sys
+import tempfile
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from types import ModuleType
+from typing import Any, List, Optional
+
+import typer
+from typing_extensions import Annotated
+
+_BENCHMARKS_DIR = Path(__file__).resolve().parent
+_BIN_DIR = _BENCHMARKS_DIR.parent
+for _dir in (_BIN_DIR, _BENCHMARKS_DIR):
+    if str(_dir) not in sys.path:
+        sys.path.insert(0, str(_dir))
+
+from synthetic_topics import make_topic_tree  # noqa: E402
+
+
+def load_get_topics(path: Path, module_name: str) -> ModuleType:
+    """Import the `get_topics.py` at `path` as a module named `module_name`."""
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@contextmanager
+def count_filesystem_calls() -> Iterator[Counter]:
+    """Within this context, tally calls to the `os` (and `open`) functions that touch the filesystem, by name."""
+    counts: Counter = Counter()
+    patched: list[tuple[Any, str, Any]] = []
+
+    def counting(name: str, function: Callable) -> Callable:
+        def wrapper(*args, **kwargs):
+            counts[name] += 1
+            return function(*args, **kwargs)
+
+        return wrapper
+
+    targets = [(os, "stat"), (os, "lstat"), (os, "scandir"), (builtins, "open")]
+    # Since 3.13, `glob` (and through it `Path.glob`) holds its own references to `os.scandir` and `os.lstat`.
+    if (globber := getattr(glob, "_StringGlobber", None)) is not None:
+        targets += [(globber, "scandir"), (globber, "lstat")]
+
+    for owner, name in targets:
+        original = owner.__dict__[name]
+        function = original.__func__ if isinstance(original, staticmethod) else original
+        wrapped = counting(name, function)
+        setattr(owner, name, staticmethod(wrapped) if isinstance(original, staticmethod) else wrapped)
+        patched.append((owner, name, original))
+    try:
+        yield counts
+    finally:
+        for owner, name, original in reversed(patched):
+            setattr(owner, name, original)
+
+
+def measure(get_topics_module: ModuleType, topics_root: Path, shell: str) -> tuple[int, Counter]:
+    """Run `get_topics` once, without a cache, and return how many topic paths it found and what it cost."""
+    with count_filesystem_calls() as counts:
+        paths = get_topics_module.get_topics(topics_root, [shell])
+    return len(paths), counts
+
+
+def main(
+    sizes: Annotated[Optional[List[int]], typer.Option("--size", help="Number of topics in a tree (repeatable)")] = None,
+    shell: Annotated[str, typer.Option(help="Which shell's topics to resolve")] = "bash",
+    compare: Annotated[
+        Optional[Path], typer.Option(help="Another get_topics.py to measure side-by-side, e.g., an older version")
+    ] = None,
+):
+    """Print a table of filesystem calls made by `get_topics` for each tree size."""
+    sizes = sizes or [10, 100, 1000]
+    candidates = {"this": load_get_topics(_BIN_DIR / "get_topics.py", "get_topics_under_test")}
+    if compare is not None:
+        candidates["compare"] = load_get_topics(compare, "get_topics_to_compare")
+
+    header = f"{'topics':>8} {'paths':>8}" + "".join(f" {name + ' calls':>14}" for name in candidates)
+    typer.echo(header)
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as temporary_dir:
+            topics_root = make_topic_tree(Path(temporary_dir) / "topics", size)
+            row = ""
+            for get_topics_module in candidates.values():
+                path_count, counts = measure(get_topics_module, topics_root, shell)
+                row += f" {sum(counts.values()):>14}"
+            typer.echo(f"{size:>8} {path_count:>8}{row}")
+
+
+if __name__ == "__main__":
+    typer.run(main)
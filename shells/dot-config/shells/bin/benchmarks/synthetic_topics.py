@@ -0,0 +1,51 @@
+"""
+Build throw-away topic trees shaped like `~/.config/shells/topics`, but as big as you like.
+
+The benchmarks in this directory need trees much larger than my real one, with all the features `get_topics` has to
+handle: "*.sh", "*.bash", and "*.zsh" topics; platform-specific sub-directories that override some of the general
+topics; and the special list files.  Everything is deterministic, so the same arguments always build the same tree.
+"""
+
+from os import PathLike
+from pathlib import Path
+
+
+PLATFORMS = ("darwin", "linux", "wsl")
+
+
+def make_topic_tree(
+    topics_root: PathLike | str,
+    topic_count: int,
+    platforms: tuple[str, ...] = PLATFORMS,
+    listed_fraction: float = 0.1,
+) -> Path:
+    """
+    Fill `topics_root` with `topic_count` topics and return it as a `Path`.
+
+    Topic number `i` is named "topic-<i>".  Every topic has a "*.sh" file; every second topic also has a "*.bash" file,
+    and every third a "*.zsh" file.  Every seventh topic gets an override in each of the `platforms` directories.  The
+    first and last `listed_fraction` of the topics are named in "initial-topics" and "final-topics" respectively, and
+    every other topic is named in "non-interactive-topics".
+    """
+    topics_root = Path(topics_root)
+    topics_root.mkdir(parents=True, exist_ok=True)
+    for platform in platforms:
+        (topics_root / platform).mkdir(exist_ok=True)
+
+    stems = [f"topic-{i}" for i in range(topic_count)]
+    for i, stem in enumerate(stems):
+        (topics_root / f"{stem}.sh").write_text(f"# {stem}\n")
+        if i % 2 == 0:
+            (topics_root / f"{stem}.bash").write_text(f"# {stem} for Bash\n")
+        if i % 3 == 0:
+            (topics_root / f"{stem}.zsh").write_text(f"# {stem} for Zsh\n")
+        if i % 7 == 0:
+            for platform in platforms:
+                (topics_root / platform / f"{stem}.sh").write_text(f"# {stem} on {platform}\n")
+
+    listed_count = int(topic_count * listed_fraction)
+    (topics_root / "initial-topics").write_text("".join(f"{stem}\n" for stem in stems[:listed_count]))
+    (topics_root / "final-topics").write_text("".join(f"{stem}\n" for stem in stems[topic_count - listed_count :]))
+    (topics_root / "non-interactive-topics").write_text("".join(f"{stem}\n" for stem in stems[::2]))
+
+    return topics_root
@@ -0,0 +1,158 @@
+#!/usr/bin/env -S uv run --no-project --script --quiet
+# /// script
+# requires-python = ">=3.13"
+# dependencies = [
+#     "typer",
+#     "typing_extensions",
+# ]
+# ///
+"""
+Run a command whose output is meant to be `eval`ed at shell startup, e.g., `starship init bash`, and cache that output.
+
+Lots of topics do something like `eval "$(starship init bash)"`.  That's a fork and exec of some binary at every
+shell start, just to get text that only changes when the binary does.  Instead, a topic says
+`cached_eval starship init bash` (see `required_functions.sh.inc`), and:
+
+- The first time, `cached_eval` calls this script, which runs the command, saves its standard output in the cache,
+    and prints it, to be `eval`ed just as before.
+- Every time after that, `cached_eval` finds the cached file on its own and `source`s it.  No fork at all: the checks
+    it makes are all shell builtins.
+
+The cache file for a command is named by `cache_file_name` from the shell and the command line, in a way the shell
+can compute without running anything.  Its first line records the resolved path of the binary, so the shell can check
+(with `[ ... -ef ... ]`) that the command still resolves to the same file, and (with `[ ... -nt ... ]`) that the
+binary isn't newer than the cache.  Arguments that name existing files, e.g., a configuration file, are treated as
+inputs: if one is newer than the cache, the cache is stale.  This script then does the full check against the recorded
+key: resolved path, modification time and size of the binary, the arguments, the shell, and the modification times of
+those input files.
+
+Nothing else is in the key, so only cache a command whose output depends on nothing else: not on the environment, and
+not on files other than the binary and its arguments.  `starship init`, `atuin init`, `fzf --bash`, and the like
+qualify.  `dircolors --sh` doesn't (its output depends on `$TERM`), and neither does `brew shellenv` (it leaves out
+what's already on `$PATH`, and its code lives in the Homebrew library, which `brew update` changes without touching
+`bin/brew`); those topics still run the command every time.
+
+A command that fails isn't cached; its output is still printed, so `eval` sees exactly what it would have without us.
+Neither is a command that prints nothing: some only print their setup when it hasn't been done yet, and caching that
+empty answer would leave every later fresh shell with no setup at all.
+
+The header is three lines: the binary, the key, and `OUTPUT_MARKER`; the output follows, exactly as printed (it may
+well start with a blank line).  A cache file without the marker, e.g., one written before there was a marker (when an
+empty output could still be saved), is a miss.
+
+Example:
+    $ cached_init.py bash -- starship init bash --print-full-init
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Annotated, List
+
+from fast_cli import Argument, Option, run
+from get_topics import default_cache_dir, mtime_ns
+
+
+HEADER_PREFIX = "# cached_init: "
+KEY_PREFIX = "# key: "
+OUTPUT_MARKER = "# cached_init: output follows"
+
+
+def cache_file_name(shell: str, command: list[str]) -> str:
+    """
+    The name of the cache file for `command` run on behalf of `shell`.
+
+    `cached_eval` builds the very same name in the shell with `${NAME//[^A-Za-z0-9._-]/_}`, so keep the two in sync.
+    """
+    return re.sub(r"[^A-Za-z0-9._-]", "_", " ".join([shell, *command]))
+
+
+def resolve_binary(name: str) -> Path | None:
+    """The real path of the executable `name` would run, following every symbolic link; `None` if there isn't one."""
+    if (found := shutil.which(name)) is None:
+        return None
+    return Path(found).resolve()
+
+
+def cache_key(shell: str, binary: Path, command: list[str]) -> dict:
+    """Everything that must be unchanged for the cached output of `command` to still be what it would print now."""
+    stat = binary.stat()
+    return {
+        "binary": str(binary),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "arguments": command[1:],
+        "shell": shell,
+        "inputs": {argument: mtime_ns(argument) for argument in command[1:] if os.path.isfile(argument)},
+    }
+
+
+def read_cached_output(cache_file: Path, key: dict) -> str | None:
+    """The cached output in `cache_file` if it was saved under exactly `key`; else `None`."""
+    try:
+        header, key_line, marker, output = cache_file.read_text().split("\n", 3)
+    except (OSError, ValueError):
+        return None
+    if marker != OUTPUT_MARKER:
+        return None
+    try:
+        if json.loads(key_line.removeprefix(KEY_PREFIX)) != key:
+            return None
+    except ValueError:
+        return None
+    return output
+
+
+def write_cached_output(cache_file: Path, key: dict, output: str) -> None:
+    """Save `output` under `key`, atomically; failing to save is not an error."""
+    temporary_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temporary_file.write_text(
+            f"{HEADER_PREFIX}{key['binary']}\n{KEY_PREFIX}{json.dumps(key)}\n{OUTPUT_MARKER}\n{output}"
+        )
+        os.replace(temporary_file, cache_file)
+    except OSError:
+        temporary_file.unlink(missing_ok=True)
+
+
+def cached_init(shell: str, command: list[str], cache_dir: Path) -> str:
+    """Return what `command` prints on standard output, from the cache in `cache_dir` when it's still valid."""
+    if (binary := resolve_binary(command[0])) is None:
+        raise FileNotFoundError(f"command not found: {command[0]}")
+
+    key = cache_key(shell, binary, command)
+    cache_file = cache_dir / cache_file_name(shell, command)
+    if (output := read_cached_output(cache_file, key)) is not None:
+        return output
+
+    result = subprocess.run(command, stdout=subprocess.PIPE, text=True)
+    if result.returncode == 0 and result.stdout:
+        write_cached_output(cache_file, key, result.stdout)
+    return result.stdout
+
+
+def main(
+    shell: Annotated[str, Argument(help="The shell that will `eval` the output, e.g., 'bash'")],
+    command: Annotated[List[str], Argument(help="The command (and its arguments) to run; put it after `--`")],
+    cache_dir: Annotated[
+        Path | None, Option(help="Where to keep the cached output (default: $XDG_CACHE_HOME/shells/init)")
+    ] = None,
+):
+    if cache_dir is None:
+        cache_dir = default_cache_dir() / "init"
+
+    try:
+        output = cached_init(shell, command, cache_dir)
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(127)
+    print(output, end="")
+
+
+if __name__ == "__main__":
+    run(main)
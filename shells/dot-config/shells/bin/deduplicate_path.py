@@ -10,59 +10,233 @@
 $PATH may contain (useless) duplicates.  Running `eval "$(deduplicate_path.py)"` eliminates them.
 
 To be run once as the very last thing that happens in the Bash (and this is a Bash-only script) startup sequence.
+
+Other colon-separated lists pile up duplicates too.  Name them, e.g., `deduplicate_path.py PATH MANPATH CDPATH`, and
+one run cleans them all, printing one assignment for each (unset variables are left alone).  A lower-case name, e.g.,
+`fpath`, means the Zsh array tied to the upper-case variable: it's read from `$FPATH` and assigned as an array.
+`--remove` applies to every variable.
+
+With `--optimize`, it goes further, and also drops entries that can't contribute anything: directories that don't exist,
+and later spellings of a directory already in the list (e.g., through a symbolic link).  For `$PATH`, where each of
+those would otherwise cost a `stat` whenever the shell looks for a command that isn't found earlier, it also drops empty
+entries and directories with no executables in them.  Relative entries, e.g., the "." in `$CDPATH`, are always kept.
+Each entry dropped is reported in a comment after the assignments.
+
+Two more options look at what's on the final `$PATH` (one scan of it serves both):
+
+- `--shadowed` reports, again in comments, each executable that's hidden by another of the same name in an earlier
+    directory.
+- `--hash-top N` pre-seeds Bash's table of where commands are (see `help hash`) with the N commands used most in the
+    history file (`--history`, by default `$HISTFILE`), so the first use of each doesn't search `$PATH`.  Bash only.
 """
 
-from os import getenv
+import os
 import platform
+import shlex
+import sys
+from collections import Counter
+from collections.abc import Iterable, Sequence
 from pathlib import Path
-from typing import List, Optional
-
-import typer
-from typing_extensions import Annotated
+from typing import Annotated, List, Optional
 
+from fast_cli import Argument, Option, run
 from posix_path import posix_path
 
 
-original_paths = getenv("PATH")  # Technically this can return `None`.  I handle it, but it will never really happen.
-output_paths = ""
-
 _is_windows = platform.system() == "Windows"
 _path_separator = ";" if _is_windows else ":"
-_paths_already_present = set()
 
+# Exporting `$CDPATH` changes what `cd` does in every script run from the shell, so it's only ever assigned.
+UNEXPORTED_VARIABLES = {"CDPATH"}
+
+
+def unique_paths(paths: Iterable[str]) -> list[str]:
+    """`paths`, in order, without any repeats."""
+    return list(dict.fromkeys(paths))
 
-def is_new_path(path: str) -> bool:
-    """`True` if we've seen `path` before; `False` otherwise"""
-    global _paths_already_present
-    if path in _paths_already_present:
+
+def without_interpreter_bin(paths: list[str]) -> list[str]:
+    """
+    The entries of `$PATH` without the first, if it's the `bin` directory of the environment running this script.
+
+    `uv run` puts that directory at the front of `$PATH` just to run this script.  A launcher from `install_frozen.py`
+    doesn't, so the first entry is then a real one (e.g., `$SHELLS_FROZEN_BIN`) and is kept.
+    """
+    interpreter_bin = os.path.normcase(os.path.normpath(os.path.dirname(sys.executable)))
+    if paths and paths[0] and os.path.normcase(os.path.normpath(paths[0])) == interpreter_bin:
+        return paths[1:]
+    return paths
+
+
+def has_executables(directory: str) -> bool:
+    """`True` if there's at least one executable file in `directory`."""
+    try:
+        with os.scandir(directory) as entries:
+            return any(entry.is_file() and os.access(entry.path, os.X_OK) for entry in entries)
+    except OSError:
         return False
-    _paths_already_present.add(path)
-    return True
+
+
+def optimize_paths(paths: Iterable[str], for_commands: bool = True) -> tuple[list[str], list[tuple[str, str]]]:
+    """
+    Split `paths` into those worth keeping, in order, and the rest, each with why it was dropped.
+
+    Absolute entries are compared by their real paths.  Only the first entry for any directory is kept, so everything
+    still resolves exactly as it did.  `for_commands` means `paths` is `$PATH`, so empty entries and directories without
+    executables go too.
+    """
+    kept: list[str] = []
+    dropped: list[tuple[str, str]] = []
+    kept_by_real_path: dict[str, str] = {}
+    for path in paths:
+        if not path:
+            if for_commands:
+                dropped.append((path, "empty (it means the current directory)"))
+            else:
+                kept.append(path)  # E.g., in `$MANPATH`, it means "the default directories go here"
+            continue
+        if not os.path.isabs(path):
+            kept.append(path)
+            continue
+        real_path = os.path.realpath(path)
+        if not os.path.exists(real_path) or (for_commands and not os.path.isdir(real_path)):
+            dropped.append((path, "doesn't exist"))
+        elif real_path in kept_by_real_path:
+            dropped.append((path, f"same directory as {kept_by_real_path[real_path]}"))
+        elif for_commands and not has_executables(real_path):
+            dropped.append((path, "no executables"))
+        else:
+            kept.append(path)
+            kept_by_real_path[real_path] = path
+    return kept, dropped
+
+
+def clean_variable(
+    name: str, value: str, paths_to_remove: set, optimize: bool = False
+) -> tuple[list[str], list[tuple[str, str]]]:
+    """The entries of the list variable `name` with its `value` cleaned up, and those `optimize` dropped, and why."""
+    new_paths = unique_paths(value.split(_path_separator))
+    if name.upper() == "PATH":
+        new_paths = without_interpreter_bin(new_paths)
+    dropped: list[tuple[str, str]] = []
+    if optimize:
+        new_paths, dropped = optimize_paths(new_paths, for_commands=name.upper() == "PATH")
+    # Because the result will always be handled inside a shell, I produce the well-known, forward slash version of each.
+    cleaned = [posix_path(Path(path)) if path else None for path in new_paths]
+    return [path.as_posix() if path is not None else "" for path in cleaned if path not in paths_to_remove], dropped
+
+
+def render_assignment(name: str, paths: list[str]) -> str:
+    """`name=...` for an upper-case `name` (`export`ed unless it shouldn't be), or a Zsh array for a lower-case one."""
+    if name.islower():
+        return f"{name}=({' '.join(shlex.quote(path) for path in paths)})"
+    assignment = f'{name}="{":".join(paths)}"'
+    return assignment if name in UNEXPORTED_VARIABLES else f"export {assignment}"
+
+
+def index_executables(paths: Iterable[str]) -> dict[str, list[str]]:
+    """
+    Each executable's name → every directory among `paths` that has one, in order (the first is the one that runs).
+
+    Relative entries are skipped: what they hold depends on the current directory at the time.
+    """
+    index: dict[str, list[str]] = {}
+    for directory in paths:
+        if not os.path.isabs(directory):
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and os.access(entry.path, os.X_OK):
+                        index.setdefault(entry.name, []).append(directory)
+        except OSError:
+            continue
+    return index
+
+
+def render_shadow_report(index: dict[str, list[str]]) -> list[str]:
+    """A comment for each executable in `index` hidden by one of the same name earlier on the path."""
+    return [
+        f"# shadowed: {name} in {directories[0]} hides {', '.join(directories[1:])}"
+        for name, directories in sorted(index.items())
+        if len(directories) > 1
+    ]
+
+
+def most_used_commands(history_file: Path, count: int) -> list[str]:
+    """The `count` command names used most in Bash's `history_file` (skipping timestamps and leading assignments)."""
+    uses: Counter = Counter()
+    try:
+        with open(history_file, errors="replace") as f:
+            for line in f:
+                if line.startswith("#"):
+                    continue
+                words = [word for word in line.split() if "=" not in word]
+                if words:
+                    uses[words[0]] += 1
+    except OSError:
+        return []
+    return [name for name, _ in uses.most_common(count)]
+
+
+def render_hash_seeds(index: dict[str, list[str]], names: Sequence[str]) -> list[str]:
+    """`hash -p` commands telling Bash where each of `names` (those that are in `index`) is."""
+    return [
+        f"hash -p {shlex.quote(posix_path(Path(index[name][0]) / name).as_posix())} {shlex.quote(name)}"
+        for name in names
+        if name in index
+    ]
 
 
 def main(
-    remove: Annotated[Optional[List[Path]], typer.Option(help="A directory to remove from `$PATH`")] = None,
+    variables: Annotated[
+        Optional[List[str]],
+        Argument(help="The variables to clean up (default: PATH); a lower-case name, e.g., fpath, means a Zsh array"),
+    ] = None,
+    remove: Annotated[Optional[List[Path]], Option(help="A directory to remove from every variable")] = None,
+    optimize: Annotated[
+        bool, Option(help="Also drop missing entries, other spellings of one directory, and (from PATH) useless ones")
+    ] = False,
+    shadowed: Annotated[
+        bool, Option(help="Report executables hidden by others of the same name earlier on the final PATH")
+    ] = False,
+    hash_top: Annotated[
+        int, Option(help="Emit `hash -p` for this many of the most-used commands in the history (Bash only)")
+    ] = 0,
+    history: Annotated[
+        Optional[Path], Option(help="The history file to count command uses in (default: $HISTFILE)")
+    ] = None,
 ):
     paths_to_remove = set()
     if remove is not None:
         paths_to_remove = {posix_path(path) for path in remove}
 
-    if original_paths is not None:
-        deduplicated_paths = [
-            posix_path(Path(path)) for path in original_paths.split(_path_separator) if is_new_path(path)
-        ]
-
-        # Because the result will always be handled inside Bash, I produce the well-known, `:` separated, forward slash
-        # version of `$PATH`.
-        output_paths = ":".join(
-            path.as_posix() for path in deduplicated_paths[1:] if path not in paths_to_remove
-        )  # Using the slice `[1:]` trims the path `uv` added just to run this script.
-    else:
-        # TODO: original_paths has the wrong format on Windows.  Yes, this can never happen; but fix it anyway.
-        output_paths = original_paths
-
-    print(f'export PATH="{output_paths}"')
+    dropped: list[tuple[str, str, str]] = []
+    final_path = without_interpreter_bin(os.environ.get("PATH", "").split(_path_separator))  # Unless cleaned up below
+    for name in variables or ["PATH"]:
+        # Technically even `$PATH` can be unset.  I handle it, but it will never really happen.
+        if not (value := os.environ.get(name.upper())):
+            continue
+        paths, dropped_here = clean_variable(name, value, paths_to_remove, optimize)
+        print(render_assignment(name, paths))
+        dropped += [(name, path, reason) for path, reason in dropped_here]
+        if name == "PATH":
+            final_path = paths
+
+    for name, path, reason in dropped:
+        print(f"# dropped {path!r} from {name}: {reason}")
+
+    if shadowed or hash_top > 0:
+        index = index_executables(unique_paths(final_path))
+        if shadowed:
+            for line in render_shadow_report(index):
+                print(line)
+        if hash_top > 0:
+            if history is None:
+                history = Path(os.environ.get("HISTFILE") or Path.home() / ".bash_history")
+            for line in render_hash_seeds(index, most_used_commands(history, hash_top)):
+                print(line)
 
 
 if __name__ == "__main__":
-    typer.run(main)
+    run(main)
@@ -0,0 +1,191 @@
+"""
+Run a `typer`-style `main` without importing `typer`, unless someone asks for `--help` (or gets the arguments wrong).
+
+Some of these scripts run at every shell start, and parse two or three arguments.  Importing `typer` (and with it
+`click` and `rich`) costs far more than everything else they do.  So such a script declares its parameters exactly as
+it would for `typer`, but with the `Argument` and `Option` from here:
+
+    def main(
+        topics_dir: Annotated[Path, Argument(help="The top-level topics directory")],
+        print0: Annotated[bool, Option(help="Separate paths with NULLs instead of line-breaks")] = False,
+    ): ...
+
+    if __name__ == "__main__":
+        run(main)
+
+`run` parses the command line itself, using only the standard library, for the shapes of parameter these scripts use:
+`str`, `int`, `float`, and `Path` (or `None`), `list`s of those, and `bool` flags (as `--flag/--no-flag`).  For
+`--help`, and for anything it can't parse, it hands the very same `main` to `typer`, with each `Argument` and `Option`
+translated, so help and error messages look exactly as they always have.  It follows that `main` must not use `typer`
+itself: report errors with `print(..., file=sys.stderr)` and `sys.exit`.
+"""
+
+import sys
+import types
+import typing
+from collections.abc import Callable
+from pathlib import Path
+
+
+class Argument:
+    def __init__(self, *, help: str | None = None):
+        self.help = help
+
+
+class Option:
+    def __init__(self, *names: str, help: str | None = None):
+        self.names = names
+        self.help = help
+
+
+class UsageError(Exception):
+    pass
+
+
+def _split_annotation(annotation) -> tuple[type, Argument | Option | None, bool]:
+    """From `Annotated[T | None, marker]`, return the base type of `T`, the marker, and whether `T` is a list."""
+    marker = None
+    if typing.get_origin(annotation) is typing.Annotated:
+        annotation, *metadata = typing.get_args(annotation)
+        marker = next((m for m in metadata if isinstance(m, (Argument, Option))), None)
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        members = [member for member in typing.get_args(annotation) if member is not type(None)]
+        annotation = members[0] if len(members) == 1 else annotation
+    is_list = typing.get_origin(annotation) in (list, typing.List)
+    if is_list:
+        (annotation,) = typing.get_args(annotation)
+    return annotation, marker, is_list
+
+
+def _convert(value: str, base_type: type):
+    if base_type not in (str, int, float, Path):
+        raise UsageError(f"no fast conversion to {base_type}")
+    try:
+        return base_type(value)
+    except ValueError as e:
+        raise UsageError(str(e)) from None
+
+
+def parse_arguments(main: Callable, arguments: list[str]) -> dict:
+    """
+    Turn `arguments` into keyword arguments for `main`, or raise `UsageError` for anything unexpected or wrong.
+
+    Deliberately doesn't use `inspect` (which costs more to import than all the rest of this).
+    """
+    code = main.__code__
+    names = code.co_varnames[: code.co_argcount]
+    defaults = dict(zip(reversed(names), reversed(main.__defaults__ or ())))
+    hints = typing.get_type_hints(main, include_extras=True)
+
+    positional: list[str] = []  # Names of the `Argument` parameters, in order
+    options: dict[str, tuple[str, bool]] = {}  # "--name" → (parameter name, value for a bool flag)
+    shapes: dict[str, tuple[type, bool]] = {}  # parameter name → (base type, is a list)
+    for name in names:
+        base_type, marker, is_list = _split_annotation(hints.get(name, str))
+        shapes[name] = (base_type, is_list)
+        if isinstance(marker, Option):
+            option_names = marker.names or (f"--{name.replace('_', '-')}",)
+            for option_name in option_names:
+                options[option_name] = (name, True)
+            if base_type is bool and not marker.names:
+                options[f"--no-{name.replace('_', '-')}"] = (name, False)
+        else:
+            positional.append(name)
+
+    result: dict = {}
+    remaining = list(arguments)
+    values: list[str] = []
+    while remaining:
+        argument = remaining.pop(0)
+        if argument == "--":
+            values += remaining
+            break
+        if not argument.startswith("-") or argument == "-":
+            values.append(argument)
+            continue
+        option_name, has_value, value = argument.partition("=")
+        if option_name not in options:
+            raise UsageError(f"no such option: {option_name}")
+        name, flag_value = options[option_name]
+        base_type, is_list = shapes[name]
+        if base_type is bool:
+            if has_value:
+                raise UsageError(f"{option_name} takes no value")
+            result[name] = flag_value
+            continue
+        if not has_value:
+            if not remaining:
+                raise UsageError(f"{option_name} requires a value")
+            value = remaining.pop(0)
+        if is_list:
+            result.setdefault(name, []).append(_convert(value, base_type))
+        else:
+            result[name] = _convert(value, base_type)
+
+    for name in positional:
+        base_type, is_list = shapes[name]
+        if is_list:
+            result[name], values = [_convert(value, base_type) for value in values], []
+        elif values:
+            result[name] = _convert(values.pop(0), base_type)
+    if values:
+        raise UsageError(f"unexpected extra arguments: {' '.join(values)}")
+
+    if missing := [name for name in names if name not in result and name not in defaults]:
+        raise UsageError(f"missing: {', '.join(missing)}")
+    return result
+
+
+def typer_main(main: Callable) -> Callable:
+    """The same `main`, with every `Argument` and `Option` replaced by its `typer` equivalent."""
+    import functools
+    import inspect
+
+    import typer
+
+    def translate(annotation):
+        if typing.get_origin(annotation) is not typing.Annotated:
+            return annotation
+        base, *metadata = typing.get_args(annotation)
+        translated = [
+            typer.Argument(help=m.help) if isinstance(m, Argument)
+            else typer.Option(*m.names, help=m.help) if isinstance(m, Option)
+            else m
+            for m in metadata
+        ]
+        return typing.Annotated[base, *translated]
+
+    @functools.wraps(main)
+    def wrapper(*args, **kwargs):
+        return main(*args, **kwargs)
+
+    hints = typing.get_type_hints(main, include_extras=True)
+    signature = inspect.signature(main)
+    wrapper.__signature__ = signature.replace(
+        parameters=[
+            parameter.replace(annotation=translate(hints.get(parameter.name, parameter.annotation)))
+            for parameter in signature.parameters.values()
+        ]
+    )
+    wrapper.__annotations__ = {name: translate(hint) for name, hint in hints.items()}
+    return wrapper
+
+
+def run(main: Callable, arguments: list[str] | None = None) -> None:
+    """Call `main` with the parsed command line; only `--help` and mistakes go through `typer`."""
+    if arguments is None:
+        arguments = sys.argv[1:]
+    if "--help" not in arguments:
+        try:
+            kwargs = parse_arguments(main, arguments)
+        except UsageError:
+            pass
+        else:
+            main(**kwargs)
+            return
+
+    import typer
+
+    # Exactly as the script did before it used this module; `typer.run` reads its command line from `sys.argv`
+    sys.argv[1:] = arguments
+    typer.run(typer_main(main))
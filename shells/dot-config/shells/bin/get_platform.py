@@ -4,16 +4,38 @@ Platform detection utility module.
 
 This module provides functionality to detect the current operating system
 platform with special handling for Windows subsystems and WSL.
+
+Detection never starts a process: the kernel release comes from `os.uname()`.
+The answer is remembered for the life of the process, and a process can be
+told the answer up front through the `SHELLS_PLATFORM` environment variable
+(`export_platform` in `required_functions.sh.inc` sets it, once, for a shell
+and everything it starts).
 """
 
+import functools
 import os
-import platform
-import re
-import subprocess
 from typing import Optional
 
 
+PLATFORM_ENVIRONMENT_VARIABLE = "SHELLS_PLATFORM"
+
+
+@functools.cache
 def get_platform() -> str:
+    """
+    The current operating system platform: `$SHELLS_PLATFORM` if it's set, else what `detect_platform` finds.
+
+    Only the first call does any work; after that the answer is remembered.
+
+    Returns
+    -------
+    str
+        The platform name in lowercase, e.g., 'linux', 'wsl', 'darwin', 'mingw'.
+    """
+    return os.environ.get(PLATFORM_ENVIRONMENT_VARIABLE) or detect_platform()
+
+
+def detect_platform() -> str:
     """
     Detect the current operating system platform.
 
@@ -30,13 +52,13 @@ def get_platform() -> str:
 
     Examples
     --------
-    >>> get_platform()  # On Linux
+    >>> detect_platform()  # On Linux
     'linux'
-    >>> get_platform()  # On WSL2
+    >>> detect_platform()  # On WSL2
     'wsl'
-    >>> get_platform()  # On Windows with MinGW, e.g., Git Bash for Windows
+    >>> detect_platform()  # On Windows with MinGW, e.g., Git Bash for Windows
     'mingw'
-    >>> get_platform()  # On macOS
+    >>> detect_platform()  # On macOS
     'darwin'
     """
     # Check environment variables first (for Git Bash/MinGW detection)
@@ -48,14 +70,14 @@ def get_platform() -> str:
     if "CYGWIN" in os.environ or os.environ.get("TERM", "").startswith("cygwin"):
         return "cygwin"
 
-    uname = platform.system().lower()
+    uname = _get_system_name().lower()
 
     # Check for MinGW (may be extraneous)
-    if re.match(r"mingw.*", uname):
+    if uname.startswith("mingw"):
         return "mingw"
 
     # Check for Cygwin (may be extraneous)
-    if re.match(r"cygwin.*", uname):
+    if uname.startswith("cygwin"):
         return "cygwin"
 
     # Check for WSL2 on Linux
@@ -67,9 +89,25 @@ def get_platform() -> str:
     return uname
 
 
+def _get_system_name() -> str:
+    """
+    Get the operating system name, equivalent to 'uname -s' (or, on native Windows, 'Windows').
+
+    Returns
+    -------
+    str
+        The operating system name, e.g., 'Linux', 'Darwin'.
+    """
+    if hasattr(os, "uname"):
+        return os.uname().sysname
+    import platform  # Native Windows has no `os.uname`
+
+    return platform.system()
+
+
 def _get_kernel_release() -> Optional[str]:
     """
-    Get the kernel release string, equivalent to 'uname -r'.
+    Get the kernel release string, equivalent to 'uname -r', without running it.
 
     Returns
     -------
@@ -77,10 +115,13 @@ def _get_kernel_release() -> Optional[str]:
         The kernel release string, or None if unable to retrieve.
     """
     try:
-        result = subprocess.run(["uname", "-r"], capture_output=True, text=True, check=True)
-        return result.stdout.strip()
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return None
+        return os.uname().release
+    except (AttributeError, OSError):
+        try:
+            with open("/proc/sys/kernel/osrelease") as f:
+                return f.read().strip()
+        except OSError:
+            return None
 
 
 if __name__ == "__main__":
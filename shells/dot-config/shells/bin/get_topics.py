@@ -27,7 +27,7 @@ Assumptions and Methodology
     immediate children of the root topics directory.
 - In the topics directory there are some special, non-topic, files:
     - Each of the files is a text file containing an ordered list of topic names (stems), e.g., "git", not "git.sh",
-        one name per line.  For all three files, that file need not exist.  If it does exist, it is allowed to
+        one name per line.  For all of these files, that file need not exist.  If it does exist, it is allowed to
         be empty.  Either of those cases just mean no topics take part in that category.
     - "initial-topics" will be listed before otherwise unordered topics.
     - "final-topics" will be listed after otherwise unordered topics.
@@ -38,6 +38,39 @@ Assumptions and Methodology
         except that no topic **not** in this list will be returned.  To repeat, the order of topic (stems) in
         "non-interactive-topics" is not important.  The order is still controlled by "initial-topics" and
         "final-topics".
+    - "deferred-topics".  Topics that are heavy and rarely needed right away, e.g., completions.  These are
+        left out of the normal result entirely.  Instead, they form a second stream, `get_topics(..., deferred=True)`
+        (`get_topics.py --deferred` from the command line), which the shell sources after the first prompt is up.
+        Within that stream, order is controlled exactly as above; the order of "deferred-topics" itself doesn't
+        matter.
+    - "lazy-topics".  Topics that only define functions, most of which any given session never calls.  These are
+        left out of both streams.  Instead, `get_topics.py` writes "autoload stubs" for them: a tiny stand-in for
+        each function the topic defines, which sources the whole topic the first time it's called, then calls the
+        real thing.  The stubs file is the first path `get_topics.py` prints.  See `render_autoload_stubs`.
+- Resolving topics means globbing every topics root and checking every candidate file, and this happens at every
+    shell start.  So `get_topics` can keep an on-disk cache of its (ordered) result.  The cache is keyed on everything
+    that could change the answer: the topics root, the extensions, interactive or not, the platform, and the
+    modification times of the topics root, the platform-specific directory, and the special files.  Adding,
+    removing, or renaming a topic changes the modification time of the directory that holds it; editing a topic
+    in-place doesn't change which paths we return, so doesn't need to invalidate anything.
+- Resolution doesn't ask the filesystem about each candidate topic file.  Instead, `index_topic_roots` lists each
+    topics root exactly once (with `os.scandir`), and every later question ("which topics exist?", "which files
+    make up the topic 'git'?") is answered from that in-memory index.
+- Instead of a list of topics to source one by one, `get_topics.py --bundle OUT` writes all of them, in order, into
+    a single script and prints just its path.  See `render_bundle` for how that keeps each topic's behavior, and
+    `bundle_is_current` for when it gets rebuilt.
+- `get_topics.py TOPICS_DIR bash zsh bash:noninteractive --manifest-dir DIR` answers for several targets at once,
+    writing each answer to its own manifest file, "DIR/topics.<target>".  The targets share one `get_platform` call and
+    one scan of the topic directories.  See `parse_target` for the modifiers a target may have.
+- `get_topics.py ... --watch` doesn't print anything.  Instead it does the same work every time something in the topics
+    tree changes (see `watch_topics`), so the cache, autoload stubs, bundle, or manifests are always fresh, and a
+    starting shell never pays to resolve topics.  Run it in the background, e.g., from a user service, with the same
+    arguments your shell uses.
+- `get_topics.py zsh --zcompile` also compiles each file it prints (the topics, stubs, or bundle) with `zcompile`,
+    into a ".zwc" beside it, whenever the ".zwc" is missing or older.  Zsh's `source` reads the ".zwc" instead of
+    parsing the file, so the printed paths don't change.  See `zcompile_topics`.
+- `get_topics.py --profile LOG` puts "--profile LOG" ahead of the paths it prints.  `source_all` takes that as an
+    instruction to time each file it sources and append the timings to LOG; `topic_profile_report.py` reads them.
 - When a particular topic is to be included in the result, there may be zero or more actual topic files, e.g.,
     for the topic "git", there might be "git.sh", "git.bash", "darwin/git.sh"...
 - The resulting list is ordered such that "*.sh" paths come first, then shell-specific topic paths.
@@ -59,20 +92,34 @@ From Python:
     >>> paths = get_topics('~/.config/shell/topics', ['zsh'])
 """
 
+import hashlib
+import json
+import os
+import re
+import shlex
 import sys
-from collections.abc import Container, Iterable, Sequence
+from collections.abc import Callable, Container, Iterable, Sequence
 from itertools import product
 from os import PathLike
 from pathlib import Path
-from typing import TextIO
-
-import typer
-from typing_extensions import Annotated
+from typing import Annotated, List, TextIO
 
+from fast_cli import Argument, Option, run
 from get_platform import get_platform
 from posix_path import posix_path
 
 
+SPECIAL_TOPIC_FILES = ("initial-topics", "final-topics", "non-interactive-topics", "deferred-topics", "lazy-topics")
+
+# topics root → topic stem → extension → path, e.g., `index[root]["git"]["sh"] == root / "git.sh"`
+type TopicIndex = dict[Path, dict[str, dict[str, Path]]]
+
+
+def default_cache_dir() -> Path:
+    """Where `get_topics.py` keeps its cache when run from the command line: `$XDG_CACHE_HOME/shells`."""
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "shells"
+
+
 def print_paths(
     paths: Iterable[PathLike | str],
     separator: str = "\n",
@@ -125,25 +172,57 @@ def read_topic_stems(input_path: PathLike | str) -> list[str]:
     return []
 
 
-def find_existing_topic_stems(topic_roots: Sequence[PathLike | str], extensions: Sequence[str]) -> set[str]:
+def index_topic_roots(topic_roots: Sequence[PathLike | str]) -> TopicIndex:
+    """
+    List each of the (existing) `topic_roots` exactly once, and index what's there by topic stem and extension.
+
+    Every name of the form "<stem>.<extension>" is indexed, whatever the extension, so a single index can answer
+    questions about Bash and Zsh topics alike.  An entry only counts if it would satisfy `Path.exists()`, i.e., a
+    broken symbolic link is not a topic.  That's exactly what the index replaces: a `glob` for each extension in each
+    root, followed by an `exists()` for every combination of stem, extension, and root.  For a non-symlink,
+    `os.scandir` already knows the answer from the directory listing, so most entries cost no system call at all.
+
+    The result preserves the order of `topic_roots`.
+    """
+    index: TopicIndex = {}
+    for topic_root in actual_dirs(topic_roots):
+        topics_here: dict[str, dict[str, Path]] = {}
+        with os.scandir(topic_root) as entries:
+            for entry in entries:
+                stem, dot, extension = entry.name.rpartition(".")
+                if not (stem and dot and extension):
+                    continue
+                if entry.is_symlink() and not os.path.exists(entry.path):
+                    continue
+                topics_here.setdefault(stem, {})[extension] = topic_root / entry.name
+        index[topic_root] = topics_here
+    return index
+
+
+def find_existing_topic_stems(
+    topic_roots: Sequence[PathLike | str],
+    extensions: Sequence[str],
+    index: TopicIndex | None = None,
+) -> set[str]:
     """
     Look for topics that actually exist in the filesystem and return a set of topic stems, e.g., "pixi" not "pixi.zsh".
 
-    The result is unordered.
+    The result is unordered.  If you already have an `index` (from `index_topic_roots`) covering `topic_roots`, pass it
+    in and the filesystem won't be consulted at all.
     """
-    actual_topic_roots = set(actual_dirs(topic_roots))
+    if index is None:
+        index = index_topic_roots(topic_roots)
+    actual_topic_roots = {topic_root for topic_root in map(Path, topic_roots) if topic_root in index}
     assert actual_topic_roots, "Error: you must provide at least one existing directory intended to contain topics."
 
     assert extensions, "Error: you must provide at least one filename extension."
     assert len(set(extensions)) == len(extensions), "Error: some extensions are listed more than once!"
 
-    # Yes, it's a nested comprehension.  Other places in this file I use `itertools.product`.  In this case
-    # the nested comprehension is clearer.
     return {
-        topic.stem
-        for extension in extensions
-        for path in actual_topic_roots
-        for topic in path.glob(f"*.{extension}")
+        stem
+        for topic_root in actual_topic_roots
+        for stem, paths_by_extension in index[topic_root].items()
+        if any(extension in paths_by_extension for extension in extensions)
     }
 
 
@@ -151,6 +230,7 @@ def resolve_topic_paths(
     topic_names: Iterable[str],
     topic_roots: Sequence[PathLike | str],
     extensions: Sequence[str],
+    index: TopicIndex | None = None,
 ) -> tuple[set[str], list[Path]]:
     """
     Produce both a set of topics (stems only) and a list of `Path`s from a collection of topic stems.
@@ -172,9 +252,14 @@ def resolve_topic_paths(
 
     All the files for a given topic are together.  If `topic_names` is ordered, then the corresponding
     paths appear (clumped) in that order.
+
+    Every lookup is answered from `index` (see `index_topic_roots`), which is built from `topic_roots` if you
+    don't supply one.
     """
     topic_stems = set(topic_names)
-    actual_topic_roots = actual_dirs(topic_roots)
+    if index is None:
+        index = index_topic_roots(topic_roots)
+    actual_topic_roots = [topic_root for topic_root in map(Path, topic_roots) if topic_root in index]
 
     # The list of directories to search must not contain duplicates; because that could make us return
     # the same topic path more than once.
@@ -185,7 +270,7 @@ def resolve_topic_paths(
     ordered_topic_paths: list[Path] = [
         topic_path
         for topic_stem, extension, topic_root in product(topic_names, extensions, actual_topic_roots)
-        if (topic_path := topic_root / f"{topic_stem}.{extension}").exists()
+        if (topic_path := index[topic_root].get(topic_stem, {}).get(extension)) is not None
     ]
 
     # If the result isn't a list of unique values, that must be a programming error.
@@ -201,6 +286,7 @@ def resolve_topic_paths_from_file(
     topic_roots: Sequence[PathLike | str],
     extensions: Sequence[str],
     limit_topics_to: Container[str] | None = None,
+    index: TopicIndex | None = None,
 ) -> tuple[set[str], list[Path]]:
     """
     Load topic names from a file and resolve them to filesystem paths.
@@ -220,6 +306,9 @@ def resolve_topic_paths_from_file(
         Filename extensions to search for (without leading dots).
     limit_topics_to : Container[str] or None, default None
         If provided, only include topics whose names are in this set.
+    index : TopicIndex or None, default None
+        An index of `topic_roots` from `index_topic_roots`, if you already
+        have one.
 
     Returns
     -------
@@ -237,7 +326,89 @@ def resolve_topic_paths_from_file(
     if limit_topics_to is not None:
         # We can't just use set math because order matters: `filtered_topics` is a list.
         filtered_topics = [t for t in filtered_topics if t in limit_topics_to]
-    return resolve_topic_paths(filtered_topics, topic_roots, extensions)
+    return resolve_topic_paths(filtered_topics, topic_roots, extensions, index)
+
+
+def mtime_ns(path: PathLike | str) -> int | None:
+    """The modification time of `path` in nanoseconds, or `None` if `path` doesn't exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def topics_cache_key(
+    general_topics_root: Path,
+    platform: str,
+    extensions: Sequence[str],
+    interactive: bool,
+    deferred: bool,
+) -> dict:
+    """
+    Build the `dict` that must match exactly for a cached answer from `get_topics` to be trusted.
+
+    Every value is something that can be written to and read back from JSON without changing, so comparing a freshly
+    built key against one loaded from disk is just `==`.  The topics root is recorded as an absolute path, so the
+    same directory reached by different relative paths shares one cache entry.
+    """
+    return {
+        "topics_root": str(general_topics_root.absolute()),
+        "extensions": list(extensions),
+        "interactive": interactive,
+        "deferred": deferred,
+        "platform": platform,
+        "mtimes": {
+            name: mtime_ns(general_topics_root / name)
+            for name in (".", platform, *SPECIAL_TOPIC_FILES)
+        },
+    }
+
+
+def topics_cache_file(cache_dir: PathLike | str, key: dict) -> Path:
+    """
+    The file in `cache_dir` holding the cached answer for `key`.
+
+    The name only depends on the parts of `key` that describe the question (which root, which shell, interactive
+    or not, which stream), not on the modification times.  That way a stale answer gets overwritten instead of piling
+    up.
+    """
+    question = json.dumps([key["topics_root"], key["extensions"], key["interactive"], key["deferred"]])
+    return Path(cache_dir) / f"topics-{hashlib.sha1(question.encode()).hexdigest()[:16]}.json"
+
+
+def read_cached_topics(cache_file: PathLike | str, key: dict, general_topics_root: Path) -> list[Path] | None:
+    """
+    Return the cached topic paths from `cache_file` if it exists and was written for exactly `key`; else `None`.
+
+    Paths are cached relative to the topics root, and come back out relative to `general_topics_root`, spelled
+    however the caller spelled it.
+    """
+    try:
+        with open(cache_file, "r") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    return [general_topics_root / path for path in cached.get("paths", [])]
+
+
+def write_cached_topics(cache_file: PathLike | str, key: dict, general_topics_root: Path, paths: Sequence[Path]) -> None:
+    """
+    Save `paths` as the answer for `key`.
+
+    The write goes to a temporary file that is then renamed into place, so a shell starting at the same moment
+    never reads half a cache file.  Failing to write the cache is not an error; we'll just compute again next time.
+    """
+    cache_file = Path(cache_file)
+    temporary_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(temporary_file, "w") as f:
+            json.dump({"key": key, "paths": [str(path.relative_to(general_topics_root)) for path in paths]}, f)
+        os.replace(temporary_file, cache_file)
+    except OSError:
+        temporary_file.unlink(missing_ok=True)
 
 
 def ordered_unique_extensions(sequence: Sequence[str]) -> list[str]:
@@ -257,10 +428,38 @@ def ordered_unique_extensions(sequence: Sequence[str]) -> list[str]:
     return result
 
 
+def topic_extensions(extensions: str | Sequence[str]) -> list[str]:
+    """
+    Turn whatever the caller said about extensions into the clean, ordered list the rest of this file expects.
+    """
+    # There's a couple of things you **might** do wrong in communicating the extensions you want.  Some things I can
+    # fix (so I do), and some things I can't (so I assert).
+
+    # Can fix: if the caller provided a non-empty string instead of a list of strings, convert it into a list of strings.
+    if extensions and isinstance(extensions, str) and extensions != ".":
+        extensions = [extensions]
+    # So now, `extensions` must be a (plausible) list, or else a bad string.  A bad string, or even a bad list will
+    # be caught by the following `assert`.
+
+    # Can't fix: caller must supply at least one non-empty string ("." doesn't coun't because that will **become** an
+    # empty string when I strip leading dots).
+    assert extensions and isinstance(extensions, list) and any(e and isinstance(e, str) and e != "." for e in extensions), \
+        "Error: at least one non-empty filename extension (a string, not starting with '.') must be given."
+
+    # Can fix: weed out anything that's not a non-empty string; drop any "." prefixes; make sure "sh" is included, and
+    # appears first in the list.  We already know that extensions contains at least one real string.
+    return ordered_unique_extensions(["sh"] + list(extensions))
+
+
 def get_topics(
     topics_root: PathLike | str,
     extensions: str | Sequence[str],
     interactive: bool = True,
+    cache_dir: PathLike | str | None = None,
+    deferred: bool = False,
+    *,
+    platform: str | None = None,
+    index: TopicIndex | None = None,
 ) -> list[Path]:
     """
     Discover and order shell topic files for sourcing at startup.
@@ -280,6 +479,20 @@ def get_topics(
     interactive : bool, default True
         If False, only return topics suitable for non-interactive shells
         as specified in the 'non-interactive-topics' file.
+    cache_dir : PathLike | str or None, default None
+        If given, look for a cached answer in this directory before doing any
+        work, and save the answer there afterwards.  See `topics_cache_key`
+        for what makes a cached answer stale.
+    deferred : bool, default False
+        If True, return only the topics listed in 'deferred-topics', meant
+        to be sourced after the first prompt.  If False (the normal case),
+        return everything else.
+    platform : str or None, default None
+        The answer from `get_platform`, if the caller already has it.
+    index : TopicIndex or None, default None
+        An index of the topic roots (see `topic_roots`) from
+        `index_topic_roots`, if the caller already has one.  Both of these
+        let one caller ask several questions for the price of one scan.
 
     Returns
     -------
@@ -302,6 +515,8 @@ def get_topics(
         ├── initial-topics          # Optional: topics to source first
         ├── final-topics           # Optional: topics to source last
         ├── non-interactive-topics # Optional: subset for non-interactive shells
+        ├── deferred-topics        # Optional: topics to source after the first prompt
+        ├── lazy-topics            # Optional: topics to source when one of their functions is first called
         ├── git.sh                # General shell-agnostic topics
         ├── git.bash              # Shell-specific topics
         └── darwin/               # Platform-specific overrides
@@ -331,34 +546,65 @@ def get_topics(
     general_topics_root = Path(topics_root)
     assert general_topics_root.is_dir(), "Error: a valid directory must be supplied (where to search for topics)."
 
-    # There's a couple of things you **might** do wrong in communicating the extensions you want.  Some things I can
-    # fix (so I do), and some things I can't (so I assert).
+    extensions = topic_extensions(extensions)
 
-    # Can fix: if the caller provided a non-empty string instead of a list of strings, convert it into a list of strings.
-    if extensions and isinstance(extensions, str) and extensions != ".":
-        extensions = [extensions]
-    # So now, `extensions` must be a (plausible) list, or else a bad string.  A bad string, or even a bad list will
-    # be caught by the following `assert`.
+    #
+    # If we've answered exactly this question before, and nothing that could change the answer has been touched since,
+    # then we already know the answer.
+    #
 
-    # Can't fix: caller must supply at least one non-empty string ("." doesn't coun't because that will **become** an
-    # empty string when I strip leading dots).
-    assert extensions and isinstance(extensions, list) and any(e and isinstance(e, str) and e != "." for e in extensions), \
-        "Error: at least one non-empty filename extension (a string, not starting with '.') must be given."
+    if platform is None:
+        platform = get_platform()
 
-    # Can fix: weed out anything that's not a non-empty string; drop any "." prefixes; make sure "sh" is included, and
-    # appears first in the list.  We already know that extensions contains at least one real string.
-    extensions = ordered_unique_extensions(["sh"] + list(extensions))
+    if cache_dir is not None:
+        key = topics_cache_key(general_topics_root, platform, extensions, interactive, deferred)
+        cache_file = topics_cache_file(cache_dir, key)
+        if (cached_paths := read_cached_topics(cache_file, key, general_topics_root)) is not None:
+            return cached_paths
+
+    topic_paths = order_topics(general_topics_root, platform, extensions, interactive, deferred, index)
+
+    if cache_dir is not None:
+        write_cached_topics(cache_file, key, general_topics_root, topic_paths)
+
+    return topic_paths
 
+
+def topic_roots(general_topics_root: Path, platform: str) -> list[Path]:
+    """The directories to search for topics, in order: the topics root, then its directory for `platform`, if any."""
+    all_topic_roots = [general_topics_root]
+    if (platform_topics_root := general_topics_root / platform).exists():
+        all_topic_roots += [platform_topics_root]
+    return all_topic_roots
+
+
+def order_topics(
+    general_topics_root: Path,
+    platform: str,
+    extensions: Sequence[str],
+    interactive: bool,
+    deferred: bool = False,
+    index: TopicIndex | None = None,
+) -> list[Path]:
+    """
+    Do the actual work of `get_topics`: scan the filesystem and order what we find.
+
+    Unlike `get_topics`, this function trusts its arguments: `general_topics_root` is an existing directory, and
+    `extensions` has already been cleaned up by `ordered_unique_extensions` (so "sh" comes first).
+    """
     #
     # Make a list of all the directories we will search; and build a `set` of all the topic (stems) we find there.
     #
 
-    all_topic_roots = [general_topics_root]
-    if (platform_topics_root := general_topics_root / get_platform()).exists():
-        all_topic_roots += [platform_topics_root]
+    all_topic_roots = topic_roots(general_topics_root, platform)
+
+    # Each directory is listed exactly once, here (unless the caller already did it).  Everything after this is
+    # dictionary lookups.
+    if index is None:
+        index = index_topic_roots(all_topic_roots)
 
     # Important: `all_topics` will also include topic names found **only** in platform-specific directories.
-    all_topics = find_existing_topic_stems(all_topic_roots, extensions)
+    all_topics = find_existing_topic_stems(all_topic_roots, extensions, index)
 
     if not all_topics:
         # If no actual topics exist, that's not an error.  It just means there's nothing to return.
@@ -370,10 +616,23 @@ def get_topics(
 
     non_interactive_topics_file = general_topics_root / "non-interactive-topics"
     if non_interactive_topics_file.exists() and not interactive:
-        limit_topics_to = set(read_topic_stems(non_interactive_topics_file))
-        all_topics &= limit_topics_to
+        all_topics &= set(read_topic_stems(non_interactive_topics_file))
+
+    #
+    # Lazy topics aren't sourced at all, only stubbed.  "deferred-topics" splits what's left into two streams.  We only
+    # want the one we were asked for.
+    #
+
+    all_topics -= set(read_topic_stems(general_topics_root / "lazy-topics"))
+
+    deferred_topics = set(read_topic_stems(general_topics_root / "deferred-topics"))
+    if deferred:
+        all_topics &= deferred_topics
     else:
-        limit_topics_to = None
+        all_topics -= deferred_topics
+
+    # Initial and final topics only count if they survived both of the cuts above.
+    limit_topics_to = all_topics
 
     #
     # Now collect, separately both the initial topics and final topics
@@ -387,6 +646,7 @@ def get_topics(
         all_topic_roots,
         extensions,
         limit_topics_to,
+        index,
     )
 
     final_topics, ordered_final_topic_paths = resolve_topic_paths_from_file(
@@ -394,6 +654,7 @@ def get_topics(
         all_topic_roots,
         extensions,
         limit_topics_to,
+        index,
     )
 
     #
@@ -401,7 +662,7 @@ def get_topics(
     # subtracting everything that's already spoken for by initial and final.
     #
 
-    # `all_topics` is already limited by `limit_topics_to`, so no need for further constraints.
+    # `all_topics` already reflects both cuts above, so no need for further constraints.
     # Technically don't need `sorted` here.  I didn't promise to order topics not mentioned in initial or final;
     # but why not alphabetize them.  Of course they still obey the rules with a given topic: ".sh" before shell-
     # specific, general before platform-specific.
@@ -409,6 +670,7 @@ def get_topics(
         sorted(all_topics - (initial_topics | final_topics)),
         all_topic_roots,
         extensions,
+        index,
     )
 
     #
@@ -418,24 +680,571 @@ def get_topics(
     return ordered_initial_topic_paths + ordered_other_topic_paths + ordered_final_topic_paths
 
 
+BUNDLE_FUNCTION = "__get_topics_bundled_topic"
+
+
+def topics_signature(topic_paths: Sequence[PathLike | str]) -> str:
+    """A short fingerprint of an ordered list of topic paths; a bundle records the one it was built from."""
+    return hashlib.sha1("\0".join(str(Path(path).absolute()) for path in topic_paths).encode()).hexdigest()
+
+
+def bundle_is_current(bundle: PathLike | str, topic_paths: Sequence[PathLike | str]) -> bool:
+    """
+    `True` if `bundle` exists, was built from exactly `topic_paths` (in this order), and is newer than every one of them.
+    """
+    try:
+        bundle_mtime = os.stat(bundle).st_mtime_ns
+        with open(bundle, "r") as f:
+            f.readline()
+            signature_line = f.readline()
+    except OSError:
+        return False
+    if signature_line.strip() != f"# topics: {topics_signature(topic_paths)}":
+        return False
+    return all((topic_mtime := mtime_ns(path)) is not None and topic_mtime < bundle_mtime for path in topic_paths)
+
+
+def render_bundle(topic_paths: Sequence[PathLike | str]) -> str:
+    """
+    Concatenate `topic_paths`, in order, into the text of a single script that does what sourcing each of them would.
+
+    Each topic becomes the body of a function that is defined, called once, and forgotten.  That way a topic that
+    bails out early with `return` (e.g., `command -v starship >/dev/null 2>&1 || return`) skips only the rest of
+    itself, just as it would if sourced on its own.  Two consequences of running inside a function: a `local`,
+    `declare`, or `typeset` at the top level of a topic makes a variable local to that topic; and, since each topic
+    is parsed all at once, an alias is only available to **later** topics, not to the rest of the topic defining it.
+
+    Error messages from the shell name the bundle and a line in it.  The header of the bundle maps bundle lines back
+    to the original topic files, and each topic is preceded by a comment naming its file.
+    """
+    body: list[str] = []
+    line_map: list[tuple[int, str]] = []
+    for path in topic_paths:
+        text = Path(path).read_text()
+        body.append(f"# >>> {posix_path(path)}")
+        body.append(f"{BUNDLE_FUNCTION}() {{ :")
+        line_map.append((len(body) + 1, str(posix_path(path))))  # Counted within the body; the header comes later.
+        body.extend(text.splitlines())
+        body.append("}")
+        body.append(BUNDLE_FUNCTION)
+        body.append("")
+    body.append(f"unset -f {BUNDLE_FUNCTION}")
+
+    header = [
+        "# Generated by get_topics.py --bundle; rebuilt whenever the list of topics changes or any topic is newer.",
+        f"# topics: {topics_signature(topic_paths)}",
+        "#",
+        "# Line 1 of each topic file is at the following line of this bundle:",
+    ]
+    header_length = len(header) + len(line_map) + 1
+    header += [f"#   {header_length + first_line:>6}  {path}" for first_line, path in line_map]
+    header.append("")
+
+    return "\n".join(header + body) + "\n"
+
+
+def write_bundle(bundle: PathLike | str, topic_paths: Sequence[PathLike | str]) -> bool:
+    """
+    (Re)build `bundle` from `topic_paths` unless it is already current.  Return `True` if it was rebuilt.
+
+    Like the cache, the bundle is written to a temporary file and renamed into place, so a shell never sources half of
+    one.
+    """
+    if bundle_is_current(bundle, topic_paths):
+        return False
+    bundle = Path(bundle)
+    temporary_file = bundle.with_name(f"{bundle.name}.{os.getpid()}.tmp")
+    bundle.parent.mkdir(parents=True, exist_ok=True)
+    temporary_file.write_text(render_bundle(topic_paths))
+    os.replace(temporary_file, bundle)
+    return True
+
+
+# Compile each file to a temporary ".zwc" and rename it into place, so a starting shell never reads half of one.
+# `zf_mv` is `mv` as a builtin: no fork per file.
+ZCOMPILE_SCRIPT = (
+    "zmodload -F zsh/files b:zf_mv || exit; "
+    'for f; do zcompile -- "$f.$$.tmp.zwc" "$f" && zf_mv -f "$f.$$.tmp.zwc" "$f.zwc"; done'
+)
+
+
+def zwc_is_current(path: PathLike | str) -> bool:
+    """
+    `True` if "`path`.zwc" exists and Zsh would use it in place of `path`.
+
+    Zsh compares modification times in whole seconds, and uses the ".zwc" only if it's strictly newer; so must I, or a
+    topic edited in the same second it was compiled would never be compiled again.
+    """
+    try:
+        return int(os.stat(f"{path}.zwc").st_mtime) > int(os.stat(path).st_mtime)
+    except OSError:
+        return False
+
+
+def zcompile_topics(topic_paths: Sequence[PathLike | str]) -> list[Path]:
+    """
+    Make sure each of `topic_paths` has a current compiled form, "`path`.zwc", beside it.  Return the ".zwc" paths
+    (none at all if there's no `zsh` to compile with).
+
+    Zsh's `source` reads "`path`.zwc" instead of `path` whenever it is newer, skipping the parse, so the list of paths
+    to source doesn't change.  Only stale files are compiled, all in one `zsh -f`.
+    Because aliases are expanded when a file is compiled (and `zsh -f` has none), an alias used in a compiled topic
+    isn't expanded, not even one defined by an earlier topic.
+    """
+    import shutil
+    import subprocess
+
+    if stale := [str(path) for path in topic_paths if not zwc_is_current(path)]:
+        if (zsh := shutil.which("zsh")) is None:
+            return []
+        subprocess.run([zsh, "-fc", ZCOMPILE_SCRIPT, "zsh", *stale], check=False)
+    return [Path(f"{path}.zwc") for path in topic_paths]
+
+
+def get_lazy_topics(
+    topics_root: PathLike | str,
+    extensions: str | Sequence[str],
+    interactive: bool = True,
+    *,
+    platform: str | None = None,
+    index: TopicIndex | None = None,
+) -> dict[str, list[Path]]:
+    """
+    Resolve the topics named in "lazy-topics" to their files: topic stem → ordered list of paths.
+
+    Stems come out in the order "lazy-topics" lists them, and the paths for each stem are ordered just as
+    `resolve_topic_paths` orders them.  A stem with no files (for this shell, on this platform) is left out, as is
+    anything not in "non-interactive-topics" for a non-interactive shell.  Most of the time "lazy-topics" doesn't
+    exist, and this returns an empty `dict` without looking at anything else.  `platform` and `index` are as for
+    `get_topics`.
+    """
+    general_topics_root = Path(topics_root)
+    if not (lazy_topics := read_topic_stems(general_topics_root / "lazy-topics")):
+        return {}
+
+    non_interactive_topics_file = general_topics_root / "non-interactive-topics"
+    if non_interactive_topics_file.exists() and not interactive:
+        limit_topics_to = set(read_topic_stems(non_interactive_topics_file))
+        lazy_topics = [t for t in lazy_topics if t in limit_topics_to]
+
+    extensions = topic_extensions(extensions)
+    all_topic_roots = topic_roots(general_topics_root, platform or get_platform())
+    if index is None:
+        index = index_topic_roots(all_topic_roots)
+
+    lazy_topic_paths: dict[str, list[Path]] = {}
+    for stem in lazy_topics:
+        if paths := resolve_topic_paths([stem], all_topic_roots, extensions, index)[1]:
+            lazy_topic_paths[stem] = paths
+    return lazy_topic_paths
+
+
+# A function definition, either "name() {" or "function name {" (or both at once), maybe indented, maybe with a
+# `show_help`-style "# help" comment at the end of the line.
+FUNCTION_DEFINITION_RE = re.compile(
+    r"^\s*(?:function\s+(?P<keyword_name>[A-Za-z_][\w-]*)\s*(?:\(\s*\))?|(?P<name>[A-Za-z_][\w-]*)\s*\(\s*\))"
+    r"\s*\{?[^#]*(?:#\s*(?P<help>.*))?$"
+)
+
+
+def find_function_definitions(topic_path: PathLike | str) -> list[tuple[str, str]]:
+    """
+    Scan a topic file for the functions it defines, returning `(name, help)` pairs in the order they appear.
+
+    This is a line-by-line scan, not a parse, using the same conventions `show_help` relies on.  `help` is the text
+    of a trailing "# ..." comment on the defining line, or "" if there isn't one.  A function defined more than once
+    (e.g., inside both branches of an `if`) is listed once.
+    """
+    definitions: dict[str, str] = {}
+    with open(topic_path, "r") as f:
+        for line in f:
+            if m := FUNCTION_DEFINITION_RE.match(line):
+                name = m.group("keyword_name") or m.group("name")
+                definitions.setdefault(name, (m.group("help") or "").strip())
+    return list(definitions.items())
+
+
+def render_autoload_stubs(lazy_topic_paths: dict[str, Sequence[PathLike | str]]) -> str:
+    """
+    Write a script (for Bash or Zsh) defining a stub for every function defined by the given lazy topics.
+
+    Calling a stub forgets all the stubs for its topic, sources the topic's files in order (which defines the real
+    functions), then calls the real function with the same arguments.  Forgetting the stubs first means a topic
+    that, for whatever reason, doesn't define one of them just fails the call instead of looping forever.
+
+    Keep in mind what that means for a lazy topic: anything it does besides defining functions (exporting variables,
+    defining aliases, printing warnings) doesn't happen until one of its functions is first called.  And a first call
+    made inside `$(...)` loads the topic only into that subshell.
+    """
+    all_paths = [path for paths in lazy_topic_paths.values() for path in paths]
+    lines = [
+        "# Generated by get_topics.py from \"lazy-topics\"; rebuilt whenever those topics change.",
+        f"# topics: {topics_signature(all_paths)}",
+    ]
+    for stem, paths in lazy_topic_paths.items():
+        definitions = {}
+        for path in paths:
+            for name, help_text in find_function_definitions(path):
+                definitions.setdefault(name, help_text)
+        if not definitions:
+            continue
+        sources = [f"source {shlex.quote(str(posix_path(Path(path).absolute())))}" for path in paths]
+        load = "; ".join([f"unset -f {' '.join(definitions)}"] + sources)
+        lines.append("")
+        lines.append(f"# >>> {stem}: {', '.join(str(posix_path(path)) for path in paths)}")
+        for name, help_text in definitions.items():
+            lines.append(f'{name}() {{ {load}; {name} "$@"; }}' + (f"  # {help_text}" if help_text else ""))
+    return "\n".join(lines) + "\n"
+
+
+def write_autoload_stubs(stubs_file: PathLike | str, lazy_topic_paths: dict[str, Sequence[PathLike | str]]) -> bool:
+    """
+    (Re)build `stubs_file` unless it's already current.  Return `True` if it was rebuilt.
+
+    The stubs depend on what the lazy topic files contain, so this uses the same test as a bundle: built from exactly
+    these files, and newer than all of them.
+    """
+    all_paths = [path for paths in lazy_topic_paths.values() for path in paths]
+    if bundle_is_current(stubs_file, all_paths):
+        return False
+    stubs_file = Path(stubs_file)
+    temporary_file = stubs_file.with_name(f"{stubs_file.name}.{os.getpid()}.tmp")
+    stubs_file.parent.mkdir(parents=True, exist_ok=True)
+    temporary_file.write_text(render_autoload_stubs(lazy_topic_paths))
+    os.replace(temporary_file, stubs_file)
+    return True
+
+
+def lazy_topics_cache_file(cache_dir: PathLike | str, key: dict) -> Path:
+    """The file in `cache_dir` recording the autoload stubs last written for `key` (see `autoload_stubs`)."""
+    topics_file = topics_cache_file(cache_dir, key)
+    return topics_file.with_name(f"lazy-{topics_file.name}")
+
+
+def read_cached_stubs(cache_file: PathLike | str, key: dict, general_topics_root: Path) -> bool | None:
+    """
+    What `cache_file` says about the stubs for `key`, if that's still true: `True` if the stubs file is current, `False`
+    if no lazy topic has files (so there are no stubs); `None` if it must be worked out again.
+
+    Still true means saved under exactly `key`, no lazy topic file modified since, and the stubs file (if any) there.
+    """
+    try:
+        with open(cache_file, "r") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key or not isinstance(mtimes := cached.get("mtimes"), dict):
+        return None
+    if any(mtime_ns(general_topics_root / path) != mtime for path, mtime in mtimes.items()):
+        return None
+    if mtimes and not os.path.exists(key["stubs"]):
+        return None
+    return bool(mtimes)
+
+
+def write_cached_stubs(
+    cache_file: PathLike | str, key: dict, general_topics_root: Path, lazy_topic_paths: dict[str, Sequence[Path]]
+) -> None:
+    """Save the lazy topic files the stubs for `key` were written from, with their modification times."""
+    cache_file = Path(cache_file)
+    temporary_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    mtimes = {
+        str(path.relative_to(general_topics_root)): mtime_ns(path)
+        for paths in lazy_topic_paths.values()
+        for path in paths
+    }
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(temporary_file, "w") as f:
+            json.dump({"key": key, "mtimes": mtimes}, f)
+        os.replace(temporary_file, cache_file)
+    except OSError:
+        temporary_file.unlink(missing_ok=True)
+
+
+def autoload_stubs(
+    topics_dir: PathLike | str,
+    shell: str,
+    interactive: bool,
+    stubs: PathLike | str,
+    cache_dir: PathLike | str | None = None,
+    *,
+    platform: str | None = None,
+    index: TopicIndex | None = None,
+) -> Path | None:
+    """
+    Make sure `stubs` holds current autoload stubs for "lazy-topics", and return it; or `None` if there are none.
+
+    Resolving the lazy topics means listing every topic root, and checking the stubs means reading them and a `stat`
+    of every lazy topic file.  With a `cache_dir`, the answer is saved under the same key `get_topics` uses (plus the
+    stubs file), along with the modification time of each lazy topic file; so while nothing has changed, this costs one
+    small cache file and a `stat` per lazy topic file, like `get_topics` itself.
+    """
+    general_topics_root = Path(topics_dir)
+    if platform is None:
+        platform = get_platform()
+
+    if cache_dir is not None:
+        key = topics_cache_key(general_topics_root, platform, topic_extensions([shell]), interactive, False)
+        if key["mtimes"]["lazy-topics"] is None:
+            return None
+        key["stubs"] = str(Path(stubs).absolute())
+        cache_file = lazy_topics_cache_file(cache_dir, key)
+        if (cached := read_cached_stubs(cache_file, key, general_topics_root)) is not None:
+            return Path(stubs) if cached else None
+
+    lazy_topic_paths = get_lazy_topics(general_topics_root, [shell], interactive, platform=platform, index=index)
+    if lazy_topic_paths:
+        write_autoload_stubs(stubs, lazy_topic_paths)
+    if cache_dir is not None:
+        write_cached_stubs(cache_file, key, general_topics_root, lazy_topic_paths)
+    return Path(stubs) if lazy_topic_paths else None
+
+
+def topics_to_source(
+    topics_dir: PathLike | str,
+    shell: str,
+    interactive: bool = True,
+    deferred: bool = False,
+    cache_dir: PathLike | str | None = None,
+    bundle: PathLike | str | None = None,
+    stubs: PathLike | str | None = None,
+    zcompile: bool = False,
+    *,
+    platform: str | None = None,
+    index: TopicIndex | None = None,
+) -> list[Path]:
+    """
+    Everything `get_topics.py` does except print: the files a shell should source, after writing any stubs or bundle.
+
+    This is `get_topics`, plus the autoload stubs for "lazy-topics" (written to `stubs`, by default in the cache
+    directory; see `autoload_stubs`) at the front, all replaced by just `bundle` if one was asked for.  For Zsh,
+    `zcompile` also compiles each of those files (see `zcompile_topics`); for other shells it does nothing.  `platform`
+    and `index` are as for `get_topics`.
+    """
+    if platform is None:
+        platform = get_platform()
+    topics_paths = get_topics(topics_dir, [shell], interactive, cache_dir, deferred, platform=platform, index=index)
+    if not deferred:
+        if stubs is None:
+            stubs = default_cache_dir() / f"autoload-stubs.{shell}{'' if interactive else '.noninteractive'}"
+        if (
+            stubs_file := autoload_stubs(
+                topics_dir, shell, interactive, stubs, cache_dir, platform=platform, index=index
+            )
+        ) is not None:
+            topics_paths = [stubs_file] + topics_paths
+    if bundle is not None:
+        write_bundle(bundle, topics_paths)
+        topics_paths = [Path(bundle)]
+    if zcompile and shell == "zsh":
+        zcompile_topics(topics_paths)
+    return topics_paths
+
+
+def parse_target(target: str, interactive: bool = True, deferred: bool = False) -> tuple[str, bool, bool]:
+    """
+    Split a target like "bash", "zsh:noninteractive", or "bash:deferred" into `(shell, interactive, deferred)`.
+
+    Modifiers after the shell override `interactive` and `deferred`; there can be more than one, e.g.,
+    "bash:noninteractive:deferred".
+    """
+    shell, *modifiers = target.split(":")
+    for modifier in modifiers:
+        match modifier:
+            case "interactive" | "noninteractive":
+                interactive = modifier == "interactive"
+            case "deferred":
+                deferred = True
+            case _:
+                raise ValueError(f"unknown modifier '{modifier}' in target '{target}'")
+    return shell, interactive, deferred
+
+
+def topics_for_targets(
+    topics_dir: PathLike | str,
+    targets: Sequence[str],
+    interactive: bool = True,
+    deferred: bool = False,
+    cache_dir: PathLike | str | None = None,
+    zcompile: bool = False,
+) -> dict[str, list[Path]]:
+    """
+    `topics_to_source` for each of several targets (see `parse_target`), sharing one `get_platform` and one scan.
+
+    Getting the platform and listing the topic directories are the same for every target, so asking for "bash",
+    "zsh", and "bash:noninteractive" together costs barely more than asking for one of them.
+    """
+    platform = get_platform()
+    index = index_topic_roots(topic_roots(Path(topics_dir), platform))
+    return {
+        target: topics_to_source(
+            topics_dir,
+            shell,
+            target_interactive,
+            target_deferred,
+            cache_dir,
+            zcompile=zcompile,
+            platform=platform,
+            index=index,
+        )
+        for target in targets
+        for shell, target_interactive, target_deferred in [parse_target(target, interactive, deferred)]
+    }
+
+
+def manifest_file(manifest_dir: PathLike | str, target: str) -> Path:
+    """Where `get_topics.py --manifest-dir` writes the answer for `target`, e.g., "topics.bash.noninteractive"."""
+    return Path(manifest_dir) / f"topics.{target.replace(':', '.')}"
+
+
+def render_output(topics_paths: Iterable[PathLike | str], separator: str, profile: Path | None = None) -> str:
+    """Exactly what `get_topics.py` prints (or writes to a manifest) for `topics_paths`."""
+    prefix = f"--profile{separator}{posix_path(profile.absolute())}{separator}" if profile is not None else ""
+    return prefix + separator.join(str(posix_path(path)) for path in topics_paths)
+
+
+def watch_topics(topics_dir: Path, generate: Callable[[], Iterable[Path]], debounce: float = 0.25) -> None:
+    """
+    Call `generate` now, and again after every change to the topics tree, until interrupted.
+
+    The topics root and its platform-specific directories are watched with inotify, so while nothing changes this
+    process is asleep in `select`.  A burst of changes (an editor saving, `git checkout`) causes one call, once things
+    have been quiet for `debounce` seconds.  `generate` returns the files it wrote; changes to only those (say, a
+    bundle kept inside the topics tree), or to compiled ".zwc" files, don't count.
+    """
+    import select
+
+    from inotify import Inotify
+
+    topics_dir = topics_dir.absolute()
+    watcher = Inotify()
+    watcher.watch_tree(topics_dir)
+    written = set(generate())
+    try:
+        while True:
+            events = watcher.read_events()
+            while select.select([watcher], [], [], debounce)[0]:
+                events += watcher.read_events()
+            if all(event.path in written or event.path.suffix in (".tmp", ".zwc") for event in events):
+                continue
+            watcher.watch_tree(topics_dir)  # There might be a new platform-specific directory
+            written = set(generate())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
 def main(
-    topics_dir: Annotated[Path, typer.Argument(help="The top-level topics directory")],
-    shell: Annotated[str, typer.Argument(help="Return topics appropriate for this shell, e.g., 'zsh'")],
-    print0: Annotated[bool, typer.Option(help="Separate paths with NULLs instead of line-breaks")] = False,
+    topics_dir: Annotated[Path, Argument(help="The top-level topics directory")],
+    targets: Annotated[
+        List[str],
+        Argument(help="A shell, e.g., 'zsh'; or with --manifest-dir, several, e.g., 'bash zsh bash:noninteractive'"),
+    ],
+    print0: Annotated[bool, Option(help="Separate paths with NULLs instead of line-breaks")] = False,
     interactive: Annotated[
-        bool, typer.Option(help="When False, only return topics needed for a non-interactive shell session.")
+        bool, Option(help="When False, only return topics needed for a non-interactive shell session.")
     ] = True,
+    deferred: Annotated[
+        bool, Option(help="Return only the topics listed in 'deferred-topics', to source after the first prompt")
+    ] = False,
+    cache: Annotated[bool, Option(help="Reuse (and save) the answer from an earlier run when still valid")] = True,
+    cache_dir: Annotated[
+        Path | None, Option(help="Where to keep the cache (default: $XDG_CACHE_HOME/shells)")
+    ] = None,
+    bundle: Annotated[
+        Path | None,
+        Option(help="Concatenate the topics into this one script (if it's out of date), and print only its path"),
+    ] = None,
+    stubs: Annotated[
+        Path | None,
+        Option(help="Where to write autoload stubs for 'lazy-topics' (default: $XDG_CACHE_HOME/shells)"),
+    ] = None,
+    profile: Annotated[
+        Path | None,
+        Option(help="Emit '--profile PROFILE' ahead of the paths, so `source_all` logs how long each one takes"),
+    ] = None,
+    manifest_dir: Annotated[
+        Path | None,
+        Option(help="Write each target's answer to a file here ('topics.<target>') instead of printing it"),
+    ] = None,
+    watch: Annotated[
+        bool, Option(help="Print nothing; instead keep the cache, stubs, bundle, or manifests fresh until interrupted")
+    ] = False,
+    zcompile: Annotated[
+        bool, Option(help="For zsh, also compile each file to be sourced (if it's out of date) into a '.zwc' beside it")
+    ] = False,
 ):
     if not topics_dir.is_dir():
-        typer.echo(f"Error: Directory {topics_dir} does not exist", err=True)
-        raise typer.Exit(1)
-
-    if shell not in {"bash", "zsh", "sh"}:
-        typer.echo(f"Warning: Unusual shell '{shell}' - supported: bash, zsh", err=True)
-
-    topics_paths = get_topics(topics_dir, [shell], interactive)
-    print_paths(topics_paths, separator="\0" if print0 else "\n")
+        print(f"Error: Directory {topics_dir} does not exist", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        shells = {parse_target(target)[0] for target in targets}
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    for shell in sorted(shells - {"bash", "zsh", "sh"}):
+        print(f"Warning: Unusual shell '{shell}' - supported: bash, zsh", file=sys.stderr)
+
+    if len(targets) > 1 and manifest_dir is None:
+        print("Error: several targets need --manifest-dir, to write one manifest for each", file=sys.stderr)
+        sys.exit(1)
+    if manifest_dir is not None and (bundle is not None or stubs is not None):
+        print("Error: --bundle and --stubs name a single file; they can't be used with --manifest-dir", file=sys.stderr)
+        sys.exit(1)
+
+    if cache and cache_dir is None:
+        cache_dir = default_cache_dir()
+
+    if watch:
+        from inotify import inotify_available  # Only here: importing `ctypes` would slow down every shell start
+
+        if not inotify_available():
+            print("Error: --watch needs inotify, i.e., Linux (or WSL)", file=sys.stderr)
+            sys.exit(1)
+
+    separator = "\0" if print0 else "\n"
+
+    def generate() -> list[Path]:
+        """Do what was asked, once.  Return the files written, so `--watch` can ignore the changes it makes itself."""
+        if manifest_dir is None:
+            shell, target_interactive, target_deferred = parse_target(targets[0], interactive, deferred)
+            topics_paths = topics_to_source(
+                topics_dir,
+                shell,
+                target_interactive,
+                target_deferred,
+                cache_dir if cache else None,
+                bundle,
+                stubs,
+                zcompile,
+            )
+            if not watch:
+                print(render_output(topics_paths, separator, profile), end="")
+            return [Path(path).absolute() for path in (bundle, stubs) if path is not None]
+
+        answers = topics_for_targets(
+            topics_dir, targets, interactive, deferred, cache_dir if cache else None, zcompile
+        )
+        manifest_dir.mkdir(parents=True, exist_ok=True)
+        manifests = []
+        for target, topics_paths in answers.items():
+            manifest = manifest_file(manifest_dir, target)
+            temporary_file = manifest.with_name(f"{manifest.name}.{os.getpid()}.tmp")
+            temporary_file.write_text(render_output(topics_paths, separator, profile))
+            os.replace(temporary_file, manifest)
+            manifests.append(manifest.absolute())
+            if not watch:
+                print(posix_path(manifest))
+        return manifests
+
+    if watch:
+        watch_topics(topics_dir, generate)
+    else:
+        generate()
 
 
 if __name__ == "__main__":
-    typer.run(main)
+    run(main)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Ask `get_topics_server.py` for the topics to source; if it isn't running, work it out right here instead.
+
+Takes the same arguments as `get_topics.py`, and prints the same thing.  This is meant to run at every shell start, so
+it imports nothing but the standard library, and deliberately isn't run through `uv` (that's most of what the server
+saves).  Without a server, it imports `get_topics` and calls its `main` directly (that too needs only the standard
+library); if that can't be imported by this Python (e.g., it's too old), it hands its arguments to `get_topics.py`.
+
+Example:
+    $ get_topics_client.py ~/.config/shells/topics zsh --print0
+"""
+
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+
+
+BIN_DIR = Path(__file__).resolve().parent
+
+# Options whose values are paths.  The server doesn't share our working directory, so all paths are made absolute.
+PATH_OPTIONS = {"--bundle": "bundle", "--stubs": "stubs", "--profile": "profile"}
+
+# What the server needs to know: the arguments of `topics_to_source`, and how to print the answer
+QUESTION = ("topics_dir", "shell", "interactive", "deferred", "bundle", "stubs", "zcompile", "print0", "profile")
+
+
+def default_socket_path() -> Path:
+    """Must match `default_socket_path` in `get_topics_server.py`."""
+    if runtime_dir := os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(runtime_dir) / "shells" / "get_topics.sock"
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_home / "shells" / "run" / "get_topics.sock"
+
+
+def parse_arguments(arguments: list[str]) -> dict | None:
+    """
+    Parse `get_topics.py` arguments into the keyword arguments of its `main` (but with the one target as `shell`).
+
+    Return `None` for anything unexpected (including `--help`): that's for `get_topics.py` to deal with.
+    """
+    options: dict = {"print0": False, "interactive": True, "deferred": False, "cache": True, "zcompile": False}
+    positional: list[str] = []
+    remaining = iter(arguments)
+    for argument in remaining:
+        if argument in PATH_OPTIONS or argument == "--cache-dir":
+            if (value := next(remaining, None)) is None:
+                return None
+            options[PATH_OPTIONS.get(argument, "cache_dir")] = Path(os.path.abspath(value))
+        elif argument in ("--print0", "--interactive", "--deferred", "--cache", "--zcompile"):
+            options[argument[2:]] = True
+        elif argument in ("--no-print0", "--no-interactive", "--no-deferred", "--no-cache", "--no-zcompile"):
+            options[argument[5:]] = False
+        elif argument.startswith("-"):
+            return None
+        else:
+            positional.append(argument)
+    if len(positional) != 2 or ":" in positional[1]:
+        return None  # Several targets, or modifiers; those are for `get_topics.py`
+    options["topics_dir"] = Path(os.path.abspath(positional[0]))
+    options["shell"] = positional[1]
+    return options
+
+
+def get_topics_arguments(options: dict) -> dict:
+    """The keyword arguments of `get_topics.main` for `options` from `parse_arguments`."""
+    return {**{name: value for name, value in options.items() if name != "shell"}, "targets": [options["shell"]]}
+
+
+def ask_server(options: dict) -> bytes | None:
+    """
+    Exactly what `get_topics.py` would print for `options`, from the server; or `None` if there's no server or it
+    couldn't answer.
+    """
+    if not options["cache"] or "cache_dir" in options:
+        return None  # The server always uses its own cache, so these are questions only `get_topics.py` can answer.
+    question = {
+        name: str(value) if isinstance(value, Path) else value
+        for name, value in options.items()
+        if name in QUESTION
+    }
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.settimeout(2)
+            connection.connect(str(default_socket_path()))
+            connection.sendall(json.dumps(question).encode() + b"\n")
+            connection.shutdown(socket.SHUT_WR)
+            reply = b"".join(iter(lambda: connection.recv(65536), b""))
+    except OSError:
+        return None
+    status, _, output = reply.partition(b"\n")
+    if status != b"ok":
+        return None
+    return output
+
+
+def main(arguments: list[str]) -> None:
+    if (options := parse_arguments(arguments)) is None:
+        os.execv(BIN_DIR / "get_topics.py", [str(BIN_DIR / "get_topics.py"), *arguments])
+
+    if (output := ask_server(options)) is not None:
+        sys.stdout.buffer.write(output)
+        return
+
+    try:
+        sys.path.insert(0, str(BIN_DIR))
+        import get_topics
+    except (ImportError, SyntaxError):
+        os.execv(BIN_DIR / "get_topics.py", [str(BIN_DIR / "get_topics.py"), *arguments])
+    get_topics.main(**get_topics_arguments(options))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
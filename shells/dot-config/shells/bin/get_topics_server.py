@@ -0,0 +1,164 @@
+#!/usr/bin/env -S uv run --no-project --script --quiet
+# /// script
+# requires-python = ">=3.13"
+# dependencies = [
+#     "typer",
+#     "typing_extensions",
+# ]
+# ///
+"""
+Answer `get_topics.py` questions from a long-lived process, so a starting shell pays for neither `uv` nor Python.
+
+Every shell start runs `get_topics.py`: `uv run` resolves the script's environment, Python starts, `typer` is
+imported, and only then does any real work happen.  Almost all of that is the same every time.  This server does it
+once, then listens on a per-user Unix socket (see `default_socket_path`).  `get_topics_client.py` is a tiny,
+standard-library-only script taking the same arguments as `get_topics.py`; it asks this server, and if there's no
+server (or anything goes wrong), it does the work itself.
+
+The server remembers each answer.  On Linux, it watches each topics tree it has been asked about (the root and its
+immediate sub-directories, i.e., the platform-specific directories) with inotify, and forgets every answer about a tree
+as soon as anything in it changes.  Elsewhere there's no inotify, so it keeps nothing in memory and relies on
+`get_topics`'s own on-disk cache, which checks modification times.
+
+The protocol is one line of JSON from the client (the arguments of `topics_to_source`, plus `print0` and `profile`), and
+in reply either "ok" and a line-break followed by exactly what `get_topics.py` would print (from `render_output`), or
+"error" and a line-break followed by a message.
+
+Example:
+    $ get_topics_server.py &
+    $ get_topics_client.py ~/.config/shells/topics zsh --print0
+"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import threading
+from pathlib import Path
+
+import typer
+from typing_extensions import Annotated
+
+from get_topics import default_cache_dir, render_output, topics_to_source
+from inotify import Inotify, inotify_available
+
+
+def default_socket_path() -> Path:
+    """
+    The per-user socket: in `$XDG_RUNTIME_DIR` if there is one (it's private to the user by definition), otherwise in a
+    private directory in the cache.  `get_topics_client.py` has its own copy of this logic; keep them in sync.
+    """
+    if runtime_dir := os.environ.get("XDG_RUNTIME_DIR"):
+        return Path(runtime_dir) / "shells" / "get_topics.sock"
+    return default_cache_dir() / "run" / "get_topics.sock"
+
+
+class TopicsMemo:
+    """
+    Answers to questions, remembered until inotify reports a change to the topics tree they're about.
+
+    Questions are `dict`s of `topics_to_source` arguments; the topics tree is `question["topics_dir"]`.
+    """
+
+    def __init__(self, watcher: Inotify | None):
+        self._watcher = watcher
+        self._lock = threading.Lock()
+        self._answers: dict[str, dict[str, list[Path]]] = {}  # topics tree → JSON of the question → answer
+        self._watched_trees: set[str] = set()
+        self._generations: dict[str, int] = {}  # topics tree → how many times it has changed
+
+    def answer(self, question: dict) -> list[Path]:
+        if self._watcher is None:
+            return topics_to_source(**question, cache_dir=default_cache_dir())
+
+        topics_dir = question["topics_dir"]
+        question_key = json.dumps(question, sort_keys=True)
+        with self._lock:
+            if (answer := self._answers.get(topics_dir, {}).get(question_key)) is not None:
+                # A bundle or stubs file might have been deleted, which doesn't touch the topics tree.
+                if all(path.exists() for path in answer):
+                    return answer
+            if topics_dir not in self._watched_trees:
+                self._watcher.watch_tree(topics_dir)
+                self._watched_trees.add(topics_dir)
+            generation = self._generations.get(topics_dir, 0)
+
+        answer = topics_to_source(**question, cache_dir=default_cache_dir())
+        with self._lock:
+            # If the tree changed while we were working, this answer might already be stale.
+            if self._generations.get(topics_dir, 0) == generation:
+                self._answers.setdefault(topics_dir, {})[question_key] = answer
+        return answer
+
+    def forget_changed_trees(self) -> None:
+        """Forever: wait for changes, and forget answers about any tree that changed.  Run this in its own thread."""
+        while True:
+            events = self._watcher.read_events()
+            with self._lock:
+                for topics_dir in list(self._watched_trees):
+                    if any(event.path.is_relative_to(topics_dir) for event in events):
+                        self._answers.pop(topics_dir, None)
+                        self._generations[topics_dir] = self._generations.get(topics_dir, 0) + 1
+                        # A new platform-specific directory needs a watch of its own.
+                        self._watcher.watch_tree(topics_dir)
+
+
+class TopicsRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            question = json.loads(self.rfile.readline())
+            separator = "\0" if question.pop("print0", False) else "\n"
+            profile = question.pop("profile", None)
+            answer = self.server.memo.answer(question)
+            reply = b"ok\n" + os.fsencode(render_output(answer, separator, profile and Path(profile)))
+        except Exception as e:  # Whatever went wrong, the client just does the work itself
+            reply = f"error\n{type(e).__name__}: {e}".encode()
+        self.wfile.write(reply)
+
+
+class TopicsServer(socketserver.UnixStreamServer):
+    # One request at a time: answering is quick, and `get_topics` writes its cache and bundles with names only
+    # unique per process.
+    def __init__(self, socket_path: Path, memo: TopicsMemo):
+        self.memo = memo
+        super().__init__(str(socket_path), TopicsRequestHandler)
+
+
+def main(
+    socket_path: Annotated[
+        Path | None,
+        typer.Option("--socket", help="Listen here (default: $XDG_RUNTIME_DIR/shells/get_topics.sock)"),
+    ] = None,
+):
+    if socket_path is None:
+        socket_path = default_socket_path()
+    socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # A socket left behind by a server that died is just in the way; one that answers means we're not needed.
+    if socket_path.exists():
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(socket_path))
+                typer.echo(f"Error: a server is already listening on {socket_path}", err=True)
+                raise typer.Exit(1)
+            except ConnectionRefusedError:
+                socket_path.unlink()
+
+    watcher = Inotify() if inotify_available() else None
+    memo = TopicsMemo(watcher)
+    if watcher is not None:
+        threading.Thread(target=memo.forget_changed_trees, daemon=True).start()
+
+    # Stopped the usual way, `kill`, still clean up the socket.
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    with TopicsServer(socket_path, memo) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    typer.run(main)
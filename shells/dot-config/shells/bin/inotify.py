@@ -0,0 +1,124 @@
+"""
+Just enough of Linux's inotify, through `ctypes`, to notice when anything in a few directories changes.
+
+The standard library has no inotify, and I don't want a dependency just for this.  Only Linux (and so WSL) has
+inotify; everywhere else `inotify_available` returns `False`, and callers fall back to checking modification times.
+
+Example:
+    >>> watcher = Inotify()
+    >>> watcher.add_watch('~/.config/shells/topics')
+    >>> events = watcher.read_events()  # blocks until something changes
+"""
+
+import ctypes
+import ctypes.util
+import os
+import struct
+from dataclasses import dataclass
+from os import PathLike
+from pathlib import Path
+
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+
+# Anything that could change which files are in a directory, or what's in them
+CHANGE_EVENTS = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    | IN_DELETE_SELF | IN_MOVE_SELF
+)
+
+_EVENT_HEADER = struct.Struct("iIII")  # struct inotify_event: wd, mask, cookie, len; then `len` bytes of name
+
+
+def _load_libc() -> ctypes.CDLL | None:
+    if not hasattr(os, "uname") or os.uname().sysname != "Linux":
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1, libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    return libc
+
+
+_libc = _load_libc()
+
+
+def inotify_available() -> bool:
+    """`True` if this system has inotify."""
+    return _libc is not None
+
+
+@dataclass
+class InotifyEvent:
+    path: Path  # The watched directory, joined with `name` if the event is about something inside it
+    mask: int
+    cookie: int
+
+
+class Inotify:
+    """One inotify instance: watch some directories, then read what happened to them."""
+
+    def __init__(self):
+        if _libc is None:
+            raise OSError("inotify is not available on this system")
+        if (fd := _libc.inotify_init1(IN_CLOEXEC)) < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._fd = fd
+        self._paths_by_wd: dict[int, Path] = {}
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def add_watch(self, path: PathLike | str, mask: int = CHANGE_EVENTS) -> int:
+        """Watch `path` (not recursively) for `mask` events.  Watching the same path again just updates its mask."""
+        path = Path(path).expanduser()
+        if (wd := _libc.inotify_add_watch(self._fd, os.fsencode(path), mask)) < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(path))
+        self._paths_by_wd[wd] = path
+        return wd
+
+    def watch_tree(self, directory: PathLike | str, mask: int = CHANGE_EVENTS) -> None:
+        """
+        Watch `directory` and each of its immediate sub-directories (that's as deep as a topics tree goes).
+
+        Call it again after a change, and any new sub-directory gets a watch too.
+        """
+        self.add_watch(directory, mask)
+        with os.scandir(Path(directory).expanduser()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    self.add_watch(entry.path, mask)
+
+    def read_events(self) -> list[InotifyEvent]:
+        """Block until at least one event arrives, then return every event that has."""
+        buffer = os.read(self._fd, 64 * 1024)
+        events: list[InotifyEvent] = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buffer):
+            wd, mask, cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+            offset += _EVENT_HEADER.size
+            name = buffer[offset : offset + length].rstrip(b"\0")
+            offset += length
+            path = self._paths_by_wd.get(wd, Path())
+            if mask & IN_IGNORED:
+                self._paths_by_wd.pop(wd, None)
+            events.append(InotifyEvent(path / os.fsdecode(name) if name else path, mask, cookie))
+        return events
+
+    def close(self) -> None:
+        os.close(self._fd)
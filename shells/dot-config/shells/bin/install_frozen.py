@@ -0,0 +1,210 @@
+#!/usr/bin/env -S uv run --no-project --script --quiet
+# /// script
+# requires-python = ">=3.13"
+# dependencies = [
+#     "typer",
+#     "typing_extensions",
+# ]
+# ///
+"""
+Install one locked environment for every `uv run --script` script here and in `~/.config/git/bin`, and launchers for
+them that run without `uv`.
+
+Each of these scripts starts with `#!/usr/bin/env -S uv run ... --script`, so every run (several at every shell start)
+has `uv` read the script's inline metadata and check its environment against it before Python even starts; for the git
+scripts, that includes `git-workflow-utils` from GitHub.  None of that changes from one run to the next.  So this:
+
+1. gathers the dependencies (and `requires-python`) from the inline metadata of every such script;
+2. resolves them once, with `uv pip compile`, into "requirements.lock" (an existing lock keeps its versions unless you
+    say `--upgrade`), and installs exactly that into one virtual environment with `uv pip sync`;
+3. writes a launcher for each script into "bin", under the script's own name, whose shebang is that environment's
+    Python.  The launcher imports the script (so its bytecode is cached, unlike a script run directly) as `__main__`.
+
+Everything lives under `$XDG_DATA_HOME/shells/frozen` (or `--prefix`).  `.bash_profile` and `.zprofile` put its "bin"
+ahead of the scripts on `$PATH` when it exists, so nothing else changes; remove the directory to go back to `uv`.
+Run this again after changing a script's dependencies (or adding a script); until then, that script's launcher still
+runs it in the old environment.  `benchmarks/benchmark_launchers.py` compares the two ways of starting a script.
+
+Example:
+    $ install_frozen.py
+    $ install_frozen.py --upgrade ~/.config/shells/bin ~/.config/git/bin
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import tomllib
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+from typing_extensions import Annotated
+
+
+UV_SHEBANG_PREFIX = "#!/usr/bin/env -S uv run"
+LAUNCHER_MARKER = "# Launcher written by install_frozen.py"
+
+# The reference implementation from PEP 723
+SCRIPT_METADATA_RE = re.compile(r"(?m)^# /// (?P<type>[a-zA-Z0-9-]+)$\s(?P<content>(^#(| .*)$\s)+)^# ///$")
+
+
+def default_prefix() -> Path:
+    """Where the frozen environment and its launchers go: `$XDG_DATA_HOME/shells/frozen`."""
+    return Path(os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share") / "shells" / "frozen"
+
+
+def default_script_dirs() -> list[Path]:
+    """This script's own directory, and the git scripts' directory."""
+    return [Path(__file__).resolve().parent, Path.home() / ".config" / "git" / "bin"]
+
+
+def venv_python(venv: Path) -> Path:
+    return venv / ("Scripts" if os.name == "nt" else "bin") / "python"
+
+
+def read_script_metadata(script: Path) -> dict:
+    """The `script` block of inline metadata (PEP 723) in `script`, or `{}` if it has none."""
+    for match in SCRIPT_METADATA_RE.finditer(script.read_text(errors="replace")):
+        if match.group("type") == "script":
+            content = "".join(
+                line[2:] if line.startswith("# ") else line[1:]
+                for line in match.group("content").splitlines(keepends=True)
+            )
+            return tomllib.loads(content)
+    return {}
+
+
+def find_uv_scripts(directories: Iterable[Path]) -> list[Path]:
+    """
+    Every file directly in `directories` that runs itself with `uv run`, in order.  Where two have the same name, the
+    first one found wins, just as it would on `$PATH`.
+    """
+    scripts: dict[str, Path] = {}
+    for directory in directories:
+        if not directory.is_dir():
+            continue
+        for path in sorted(directory.iterdir()):
+            if path.name in scripts or not path.is_file():
+                continue
+            try:
+                with path.open(errors="replace") as f:
+                    first_line = f.readline()
+            except OSError:
+                continue
+            if first_line.startswith(UV_SHEBANG_PREFIX):
+                scripts[path.name] = path.resolve()
+    return list(scripts.values())
+
+
+def collect_requirements(scripts: Sequence[Path]) -> tuple[list[str], str | None]:
+    """The dependencies of all of `scripts`, without duplicates, and all their `requires-python`s, combined."""
+    dependencies: dict[str, None] = {}
+    python_specifiers: dict[str, None] = {}
+    for script in scripts:
+        metadata = read_script_metadata(script)
+        dependencies.update(dict.fromkeys(metadata.get("dependencies", [])))
+        if requires_python := metadata.get("requires-python"):
+            python_specifiers.update(dict.fromkeys(s.strip() for s in requires_python.split(",")))
+    return list(dependencies), ",".join(python_specifiers) or None
+
+
+def install_environment(prefix: Path, dependencies: Sequence[str], requires_python: str | None, upgrade: bool) -> Path:
+    """Resolve `dependencies` into "requirements.lock" under `prefix`, and make its "venv" match; return its Python."""
+    uv = shutil.which("uv")
+    if uv is None:
+        raise FileNotFoundError("uv")
+    prefix.mkdir(parents=True, exist_ok=True)
+    venv = prefix / "venv"
+    python = venv_python(venv)
+    requirements = prefix / "requirements.in"
+    lock = prefix / "requirements.lock"
+
+    requirements.write_text("".join(f"{dependency}\n" for dependency in dependencies))
+    venv_command = [uv, "venv", "--quiet", "--allow-existing"]
+    if requires_python:
+        venv_command += ["--python", requires_python]
+    subprocess.run([*venv_command, str(venv)], check=True)
+    compile_command = [uv, "pip", "compile", "--quiet", str(requirements), "--output-file", str(lock)]
+    compile_command += ["--python", str(python)] + (["--upgrade"] if upgrade else [])
+    subprocess.run(compile_command, check=True)
+    subprocess.run([uv, "pip", "sync", "--quiet", str(lock), "--python", str(python)], check=True)
+    return python
+
+
+def render_launcher(python: Path, script: Path) -> str:
+    """A launcher that runs `script` as `__main__` with `python`, importing it so its bytecode gets cached."""
+    return "\n".join(
+        [
+            f"#!{python} -I",
+            f"{LAUNCHER_MARKER}; runs {script}.  Run install_frozen.py again after changing its dependencies.",
+            "import sys",
+            "from importlib.util import module_from_spec, spec_from_file_location",
+            "",
+            f"sys.argv[0] = {str(script)!r}",
+            f"sys.path.insert(0, {str(script.parent)!r})",
+            'spec = spec_from_file_location("__main__", sys.argv[0])',
+            "module = module_from_spec(spec)",
+            'sys.modules["__main__"] = module',
+            "spec.loader.exec_module(module)",
+            "",
+        ]
+    )
+
+
+def is_launcher(path: Path) -> bool:
+    try:
+        return LAUNCHER_MARKER in path.read_text(errors="replace").split("\n", 2)[1]
+    except (OSError, IndexError):
+        return False
+
+
+def write_launchers(bin_dir: Path, python: Path, scripts: Sequence[Path]) -> list[Path]:
+    """A launcher in `bin_dir` for each of `scripts`; launchers for scripts no longer found are removed."""
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    launchers = []
+    for script in scripts:
+        launcher = bin_dir / script.name
+        temporary_file = launcher.with_name(f"{launcher.name}.{os.getpid()}.tmp")
+        temporary_file.write_text(render_launcher(python, script))
+        temporary_file.chmod(0o755)
+        os.replace(temporary_file, launcher)
+        launchers.append(launcher)
+    for path in bin_dir.iterdir():
+        if path not in launchers and is_launcher(path):
+            path.unlink()
+    return launchers
+
+
+def main(
+    script_dirs: Annotated[
+        Optional[List[Path]],
+        typer.Argument(help="Directories of scripts (default: this one, and ~/.config/git/bin)"),
+    ] = None,
+    prefix: Annotated[
+        Optional[Path], typer.Option(help="Where to install (default: $XDG_DATA_HOME/shells/frozen)")
+    ] = None,
+    upgrade: Annotated[bool, typer.Option(help="Resolve every dependency afresh, instead of keeping the lock")] = False,
+):
+    """Install one locked environment for the `uv run` scripts, and a launcher for each that runs in it."""
+    scripts = find_uv_scripts(script_dirs or default_script_dirs())
+    if not scripts:
+        typer.echo("Error: No `uv run` scripts found", err=True)
+        raise typer.Exit(1)
+    prefix = prefix or default_prefix()
+    dependencies, requires_python = collect_requirements(scripts)
+    try:
+        python = install_environment(prefix, dependencies, requires_python, upgrade)
+    except FileNotFoundError:
+        typer.echo("Error: install_frozen.py needs uv", err=True)
+        raise typer.Exit(1)
+    except subprocess.CalledProcessError as e:
+        typer.echo(f"Error: {' '.join(e.cmd[:3])} failed", err=True)
+        raise typer.Exit(1)
+    launchers = write_launchers(prefix / "bin", python, scripts)
+    typer.echo(f"{len(launchers)} launchers in {prefix / 'bin'}, for {len(dependencies)} locked dependencies")
+
+
+if __name__ == "__main__":
+    typer.run(main)
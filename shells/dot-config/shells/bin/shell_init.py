@@ -0,0 +1,117 @@
+#!/usr/bin/env -S uv run --no-project --script --quiet
+# /// script
+# requires-python = ">=3.13"
+# dependencies = [
+#     "typer",
+#     "typing_extensions",
+# ]
+# ///
+"""
+Everything a starting shell needs from Python, in one process: `eval "$(shell_init.py ~/.config/shells/topics bash)"`.
+
+Without it, a shell starts `get_topics.py` to learn which topics to source and, from the "deduplicate-path" topic near
+the end, `deduplicate_path.py` to clean up `$PATH`; each one pays for `uv`, the interpreter, and imports.  This prints
+an init plan instead, which the shell evaluates:
+
+1. `export SHELLS_PLATFORM=...`, so nothing started from this shell needs to work out the platform again;
+2. `source_all` with the topics (or the bundle), exactly as `get_topics.py` would list them;
+3. `clean_path_variables` (see `required_functions.sh.inc`) for `$PATH` and the other colon-separated lists.
+
+The last step can't happen here: topics add to `$PATH`, so the final `$PATH` doesn't exist until they've all run.  So
+the plan hands it to a shell function that follows the rules of `deduplicate_path.py --optimize` using only builtins
+(everything but dropping directories without executables, which would mean listing each one).  While the plan runs,
+`$SHELLS_INIT_CLEANS_PATHS` is set, so the "deduplicate-path" topic knows not to start `deduplicate_path.py` itself.
+
+Example:
+    $ shell_init.py ~/.config/shells/topics zsh --bundle ~/.cache/shells/bundle.zsh
+"""
+
+import shlex
+import sys
+from collections.abc import Sequence
+from os import PathLike
+from pathlib import Path
+from typing import Annotated
+
+from fast_cli import Argument, Option, run
+from get_platform import PLATFORM_ENVIRONMENT_VARIABLE, get_platform
+from get_topics import default_cache_dir, topics_to_source
+from posix_path import posix_path
+
+
+CLEANS_PATHS_VARIABLE = "SHELLS_INIT_CLEANS_PATHS"
+
+# The same lists the "deduplicate-path" topic cleans; in Zsh, `$FPATH` too
+PATH_VARIABLES = ("PATH", "MANPATH", "INFOPATH", "CDPATH", "PYTHONPATH", "LD_LIBRARY_PATH")
+
+
+def render_init_plan(
+    shell: str, platform: str, topics_paths: Sequence[PathLike | str], profile: Path | None = None
+) -> str:
+    """The script `shell_init.py` prints: export the platform, source the topics, then clean up the path lists."""
+    source_arguments = [] if profile is None else ["--profile", str(posix_path(profile.absolute()))]
+    source_arguments += [str(posix_path(path)) for path in topics_paths]
+    variables = PATH_VARIABLES + (("FPATH",) if shell == "zsh" else ())
+    return "\n".join(
+        [
+            f"export {PLATFORM_ENVIRONMENT_VARIABLE}={shlex.quote(platform)}",
+            f"{CLEANS_PATHS_VARIABLE}=1",
+            shlex.join(["source_all", *source_arguments]),
+            f"unset {CLEANS_PATHS_VARIABLE}",
+            shlex.join(["clean_path_variables", *variables]),
+            "",
+        ]
+    )
+
+
+def main(
+    topics_dir: Annotated[Path, Argument(help="The top-level topics directory")],
+    shell: Annotated[str, Argument(help="The shell that will evaluate the plan: 'bash' or 'zsh'")],
+    interactive: Annotated[
+        bool, Option(help="When False, only source topics needed for a non-interactive shell session.")
+    ] = True,
+    cache: Annotated[bool, Option(help="Reuse (and save) the topics from an earlier run when still valid")] = True,
+    cache_dir: Annotated[
+        Path | None, Option(help="Where to keep the cache (default: $XDG_CACHE_HOME/shells)")
+    ] = None,
+    bundle: Annotated[
+        Path | None,
+        Option(help="Concatenate the topics into this one script (if it's out of date), and source only that"),
+    ] = None,
+    stubs: Annotated[
+        Path | None,
+        Option(help="Where to write autoload stubs for 'lazy-topics' (default: $XDG_CACHE_HOME/shells)"),
+    ] = None,
+    profile: Annotated[
+        Path | None,
+        Option(help="Have `source_all` log how long each topic takes to PROFILE"),
+    ] = None,
+    zcompile: Annotated[
+        bool, Option(help="For zsh, also compile each file to be sourced (if it's out of date) into a '.zwc' beside it")
+    ] = False,
+):
+    if not topics_dir.is_dir():
+        print(f"Error: Directory {topics_dir} does not exist", file=sys.stderr)
+        sys.exit(1)
+    if shell not in ("bash", "zsh"):
+        print(f"Error: Unsupported shell '{shell}' - supported: bash, zsh", file=sys.stderr)
+        sys.exit(1)
+
+    if cache and cache_dir is None:
+        cache_dir = default_cache_dir()
+    platform = get_platform()
+    topics_paths = topics_to_source(
+        topics_dir,
+        shell,
+        interactive,
+        cache_dir=cache_dir if cache else None,
+        bundle=bundle,
+        stubs=stubs,
+        zcompile=zcompile,
+        platform=platform,
+    )
+    print(render_init_plan(shell, platform, topics_paths, profile), end="")
+
+
+if __name__ == "__main__":
+    run(main)
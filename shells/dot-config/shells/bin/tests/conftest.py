@@ -0,0 +1,37 @@
+"""Shared pytest fixtures for shells/bin script tests."""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory (and the benchmarks next to it) to path so tests can import script modules
+_SCRIPT_DIR = Path(__file__).parent.parent
+for _dir in (_SCRIPT_DIR, _SCRIPT_DIR / "benchmarks"):
+    if str(_dir) not in sys.path:
+        sys.path.insert(0, str(_dir))
+
+from synthetic_topics import make_topic_tree  # noqa: E402
+
+
+@pytest.fixture
+def topics_tree(tmp_path):
+    """
+    Create a small synthetic topics tree for testing.
+
+    Returns:
+        Path: Path to the topics root
+    """
+    return make_topic_tree(tmp_path / "topics", 20)
+
+
+@pytest.fixture
+def cache_home(tmp_path, monkeypatch):
+    """
+    Point `$XDG_CACHE_HOME` somewhere private, so tests never touch (or read) the real cache.
+
+    Returns:
+        Path: The temporary cache home
+    """
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
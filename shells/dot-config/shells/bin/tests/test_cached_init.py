@@ -0,0 +1,80 @@
+"""Tests for cached_init.py, and `cached_eval`, which reads its cache without running it."""
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from cached_init import HEADER_PREFIX, KEY_PREFIX, OUTPUT_MARKER, cache_file_name, cached_init
+
+REQUIRED_FUNCTIONS = Path(__file__).parent.parent.parent / "topics" / "required_functions.sh.inc"
+
+BASH = shutil.which("bash")
+
+needs_bash = pytest.mark.skipif(BASH is None, reason="needs bash")
+
+
+@pytest.fixture
+def shellenv(tmp_path, monkeypatch):
+    """A `shellenv` command that, like `brew shellenv`, prints nothing when $SHELLENV_DONE is set."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    command = bin_dir / "shellenv"
+    command.write_text('#!/bin/sh\n[ -n "${SHELLENV_DONE}" ] || echo "export SHELLENV_DONE=1"\n')
+    command.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.delenv("SHELLENV_DONE", raising=False)
+    return command
+
+
+class TestCachedInit:
+    def test_output_is_cached(self, shellenv, tmp_path, monkeypatch):
+        assert cached_init("bash", ["shellenv"], tmp_path / "cache") == "export SHELLENV_DONE=1\n"
+        monkeypatch.setenv("SHELLENV_DONE", "1")
+        assert cached_init("bash", ["shellenv"], tmp_path / "cache") == "export SHELLENV_DONE=1\n"
+
+    def test_empty_output_is_not_cached(self, shellenv, tmp_path, monkeypatch):
+        monkeypatch.setenv("SHELLENV_DONE", "1")
+        assert cached_init("bash", ["shellenv"], tmp_path / "cache") == ""
+        assert not (tmp_path / "cache" / cache_file_name("bash", ["shellenv"])).exists()
+
+        monkeypatch.delenv("SHELLENV_DONE")
+        assert cached_init("bash", ["shellenv"], tmp_path / "cache") == "export SHELLENV_DONE=1\n"
+        assert (tmp_path / "cache" / cache_file_name("bash", ["shellenv"])).exists()
+
+    def test_output_starting_with_a_blank_line_is_cached(self, shellenv, tmp_path, monkeypatch):
+        shellenv.write_text('#!/bin/sh\necho\n[ -n "${SHELLENV_DONE}" ] || echo "export SHELLENV_DONE=1"\n')
+        assert cached_init("bash", ["shellenv"], tmp_path / "cache") == "\nexport SHELLENV_DONE=1\n"
+        monkeypatch.setenv("SHELLENV_DONE", "1")
+        assert cached_init("bash", ["shellenv"], tmp_path / "cache") == "\nexport SHELLENV_DONE=1\n"
+
+
+@needs_bash
+class TestCachedEval:
+    def run_cached_eval(self, cache_home):
+        # Stands in for the real cached_init.py, which runs under uv: reports that the cache missed
+        script = (
+            f'source "{REQUIRED_FUNCTIONS}"\n'
+            'cached_init.py() { echo "echo miss" ; }\n'
+            "cached_eval shellenv\n"
+        )
+        env = {**os.environ, "XDG_CACHE_HOME": str(cache_home)}
+        return subprocess.run([BASH, "-c", script], capture_output=True, text=True, check=True, env=env).stdout
+
+    def write_cache(self, cache_home, binary, body, marker=OUTPUT_MARKER):
+        cache_file = cache_home / "shells" / "init" / cache_file_name("bash", ["shellenv"])
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text(f"{HEADER_PREFIX}{binary}\n{KEY_PREFIX}{{}}\n{marker}\n{body}")
+
+    def test_cache_hit_runs_nothing(self, shellenv, tmp_path):
+        self.write_cache(tmp_path / "cache", shellenv, "echo hit\n")
+        assert self.run_cached_eval(tmp_path / "cache") == "hit\n"
+
+    def test_output_starting_with_a_blank_line_is_a_hit(self, shellenv, tmp_path):
+        self.write_cache(tmp_path / "cache", shellenv, "\necho hit\n")
+        assert self.run_cached_eval(tmp_path / "cache") == "hit\n"
+
+    def test_cache_without_the_marker_is_a_miss(self, shellenv, tmp_path):
+        self.write_cache(tmp_path / "cache", shellenv, "", marker="echo hit")
+        assert self.run_cached_eval(tmp_path / "cache") == "miss\n"
@@ -0,0 +1,70 @@
+"""Tests for deduplicate_path.py."""
+import os
+
+from deduplicate_path import (
+    clean_variable,
+    index_executables,
+    most_used_commands,
+    optimize_paths,
+    render_assignment,
+    render_hash_seeds,
+    render_shadow_report,
+)
+from posix_path import posix_path
+
+
+def make_executable(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("#!/bin/sh\n")
+    path.chmod(0o755)
+
+
+class TestOptimizePaths:
+    def test_drops_what_cannot_contribute_and_keeps_precedence(self, tmp_path):
+        make_executable(tmp_path / "bin" / "tool")
+        make_executable(tmp_path / "other" / "tool")
+        (tmp_path / "empty").mkdir()
+        os.symlink(tmp_path / "bin", tmp_path / "link")
+        paths = [str(tmp_path / name) for name in ("other", "link", "missing", "empty", "bin")]
+        kept, dropped = optimize_paths(["", *paths])
+        assert kept == [str(tmp_path / "other"), str(tmp_path / "link")]
+        assert [path for path, _ in dropped] == ["", *(str(tmp_path / name) for name in ("missing", "empty", "bin"))]
+        assert dropped[-1][1] == f"same directory as {tmp_path / 'link'}"
+
+
+class TestCleanVariables:
+    def test_empty_entries_mean_something_outside_path(self, tmp_path):
+        (tmp_path / "man").mkdir()
+        paths, dropped = clean_variable("MANPATH", f":{tmp_path / 'man'}:{tmp_path / 'man'}:/nonexistent", set(), True)
+        assert paths == ["", (tmp_path / "man").as_posix()]
+        assert dropped == [("/nonexistent", "doesn't exist")]
+
+    def test_relative_entries_are_kept(self):
+        assert clean_variable("CDPATH", ".:.", set(), True) == (["."], [])
+
+    def test_remove_applies_to_any_variable(self, tmp_path):
+        paths, _ = clean_variable("PYTHONPATH", f"{tmp_path}/a:{tmp_path}/b", {posix_path(tmp_path / "a")})
+        assert paths == [f"{tmp_path.as_posix()}/b"]
+
+    def test_assignments(self):
+        assert render_assignment("MANPATH", ["", "/a"]) == 'export MANPATH=":/a"'
+        assert render_assignment("CDPATH", [".", "/a"]) == 'CDPATH=".:/a"'
+        assert render_assignment("fpath", ["/a b", "/c"]) == "fpath=('/a b' /c)"
+
+
+class TestExecutableIndex:
+    def test_shadowing_and_hash_seeds(self, tmp_path):
+        for directory in ("first", "second"):
+            make_executable(tmp_path / directory / "python3")
+        make_executable(tmp_path / "second" / "git")
+        first, second = str(tmp_path / "first"), str(tmp_path / "second")
+        index = index_executables([first, ".", second])
+        assert index == {"python3": [first, second], "git": [second]}
+        assert render_shadow_report(index) == [f"# shadowed: python3 in {first} hides {second}"]
+        assert render_hash_seeds(index, ["git", "ls"]) == [f"hash -p {(tmp_path / 'second' / 'git').as_posix()} git"]
+
+    def test_most_used_commands(self, tmp_path):
+        history = tmp_path / "history"
+        history.write_text("git status\n#1700000000\nls\nLC_ALL=C git log\nls -l\ngit diff\nvi x\n")
+        assert most_used_commands(history, 2) == ["git", "ls"]
+        assert most_used_commands(tmp_path / "missing", 2) == []
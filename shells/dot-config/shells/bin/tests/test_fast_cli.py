@@ -0,0 +1,93 @@
+"""Tests for fast_cli.py, the stdlib-only command-line parser."""
+from pathlib import Path
+from typing import Annotated, List, Optional
+
+import pytest
+
+from fast_cli import Argument, Option, UsageError, parse_arguments, run
+
+
+def example_main(
+    topics_dir: Annotated[Path, Argument(help="A directory")],
+    shell: Annotated[str, Argument(help="A shell")],
+    print0: Annotated[bool, Option(help="A flag")] = False,
+    interactive: Annotated[bool, Option(help="A flag that defaults to on")] = True,
+    cache_dir: Annotated[Path | None, Option(help="A path")] = None,
+    sizes: Annotated[Optional[List[int]], Option("--size", help="Repeatable")] = None,
+):
+    pass
+
+
+def command_main(
+    shell: Annotated[str, Argument(help="A shell")],
+    command: Annotated[List[str], Argument(help="Everything after `--`")],
+):
+    pass
+
+
+class TestParseArguments:
+    def test_positionals_and_defaults(self):
+        assert parse_arguments(example_main, ["/topics", "zsh"]) == {"topics_dir": Path("/topics"), "shell": "zsh"}
+
+    def test_bool_flags(self):
+        kwargs = parse_arguments(example_main, ["/topics", "--print0", "zsh", "--no-interactive"])
+        assert kwargs["print0"] is True
+        assert kwargs["interactive"] is False
+
+    def test_option_values(self):
+        kwargs = parse_arguments(example_main, ["/topics", "zsh", "--cache-dir", "/c", "--size=10", "--size", "20"])
+        assert kwargs["cache_dir"] == Path("/c")
+        assert kwargs["sizes"] == [10, 20]
+
+    def test_list_argument_after_double_dash(self):
+        kwargs = parse_arguments(command_main, ["bash", "--", "starship", "init", "--print-full-init"])
+        assert kwargs == {"shell": "bash", "command": ["starship", "init", "--print-full-init"]}
+
+    @pytest.mark.parametrize(
+        "arguments",
+        [
+            ["/topics"],  # missing argument
+            ["/topics", "zsh", "extra"],  # too many arguments
+            ["/topics", "zsh", "--unknown"],
+            ["/topics", "zsh", "--cache-dir"],  # missing value
+            ["/topics", "zsh", "--print0=yes"],
+            ["/topics", "zsh", "--size", "ten"],
+        ],
+    )
+    def test_mistakes_are_left_to_typer(self, arguments):
+        with pytest.raises(UsageError):
+            parse_arguments(example_main, arguments)
+
+
+class TestTyperFallback:
+    """`--help` and mistakes look exactly as they did when the script called `typer.run` itself."""
+
+    def typer_example_main(self):
+        typer = pytest.importorskip("typer")
+
+        def example_main(
+            topics_dir: Annotated[Path, typer.Argument(help="A directory")],
+            shell: Annotated[str, typer.Argument(help="A shell")],
+            print0: Annotated[bool, typer.Option(help="A flag")] = False,
+            interactive: Annotated[bool, typer.Option(help="A flag that defaults to on")] = True,
+            cache_dir: Annotated[Path | None, typer.Option(help="A path")] = None,
+            sizes: Annotated[Optional[List[int]], typer.Option("--size", help="Repeatable")] = None,
+        ):
+            pass
+
+        return example_main
+
+    def output(self, call, arguments, monkeypatch, capsys):
+        monkeypatch.setattr("sys.argv", ["example", *arguments])
+        with pytest.raises(SystemExit) as exit_info:
+            call()
+        captured = capsys.readouterr()
+        return exit_info.value.code, captured.out, captured.err
+
+    @pytest.mark.parametrize("arguments", [["--help"], ["/topics"], ["/topics", "zsh", "--unknown"]])
+    def test_same_as_typer_run(self, arguments, monkeypatch, capsys):
+        import typer
+
+        typer_example_main = self.typer_example_main()
+        expected = self.output(lambda: typer.run(typer_example_main), arguments, monkeypatch, capsys)
+        assert self.output(lambda: run(example_main), arguments, monkeypatch, capsys) == expected
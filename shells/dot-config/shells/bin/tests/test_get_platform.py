@@ -0,0 +1,51 @@
+"""Tests for get_platform.py."""
+import os
+import subprocess
+
+import pytest
+
+import get_platform
+from get_platform import PLATFORM_ENVIRONMENT_VARIABLE, detect_platform
+
+
+@pytest.fixture
+def fresh_platform(monkeypatch):
+    """`get_platform` with nothing remembered, and none of the variables it looks at set."""
+    for name in ("MSYSTEM", "MSYSTEM_CHOST", "CYGWIN", "TERM", PLATFORM_ENVIRONMENT_VARIABLE):
+        monkeypatch.delenv(name, raising=False)
+    get_platform.get_platform.cache_clear()
+    yield get_platform.get_platform
+    get_platform.get_platform.cache_clear()
+
+
+def fake_uname(monkeypatch, sysname, release):
+    real = os.uname()
+    uname = os.uname_result((sysname, real.nodename, release, real.version, real.machine))
+    monkeypatch.setattr(os, "uname", lambda: uname)
+
+
+class TestDetectPlatform:
+    def test_wsl_from_the_kernel_release_without_a_process(self, fresh_platform, monkeypatch):
+        fake_uname(monkeypatch, "Linux", "5.15.153.1-microsoft-standard-WSL2")
+        monkeypatch.setattr(subprocess, "run", lambda *args, **kwargs: pytest.fail("started a process"))
+        assert detect_platform() == "wsl"
+
+    def test_mingw_and_cygwin_from_the_environment(self, fresh_platform, monkeypatch):
+        monkeypatch.setenv("MSYSTEM", "MINGW64")
+        assert detect_platform() == "mingw"
+        monkeypatch.delenv("MSYSTEM")
+        monkeypatch.setenv("TERM", "cygwin")
+        assert detect_platform() == "cygwin"
+
+
+class TestGetPlatform:
+    def test_remembers_its_answer(self, fresh_platform, monkeypatch):
+        fake_uname(monkeypatch, "Darwin", "23.6.0")
+        assert fresh_platform() == "darwin"
+        fake_uname(monkeypatch, "Linux", "6.8.0-45-generic")
+        assert fresh_platform() == "darwin"
+
+    def test_environment_variable_wins(self, fresh_platform, monkeypatch):
+        monkeypatch.setenv(PLATFORM_ENVIRONMENT_VARIABLE, "wsl")
+        monkeypatch.setattr(get_platform, "detect_platform", lambda: pytest.fail("detected anyway"))
+        assert fresh_platform() == "wsl"
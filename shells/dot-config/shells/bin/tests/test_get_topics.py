@@ -0,0 +1,279 @@
+"""Tests for get_topics.py."""
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import get_topics
+from get_topics import get_topics as get_topics_function
+from get_topics import (
+    manifest_file,
+    parse_target,
+    topics_for_targets,
+    topics_to_source,
+    write_bundle,
+    zwc_is_current,
+)
+
+SCRIPT_PATH = Path(__file__).parent.parent / "get_topics.py"
+
+
+class TestParseTarget:
+    def test_plain_shell(self):
+        assert parse_target("bash") == ("bash", True, False)
+
+    def test_modifiers(self):
+        assert parse_target("zsh:noninteractive") == ("zsh", False, False)
+        assert parse_target("bash:noninteractive:deferred") == ("bash", False, True)
+
+    def test_modifiers_override_defaults(self):
+        assert parse_target("bash:interactive", interactive=False) == ("bash", True, False)
+
+    def test_unknown_modifier(self):
+        with pytest.raises(ValueError):
+            parse_target("bash:sideways")
+
+
+def touch_later(path):
+    """Move `path`'s modification time a second on, so a change shows even where timestamps are coarse."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestTopicsCache:
+    PLATFORM = "linux"
+
+    def answer(self, topics_tree, cache_dir=None):
+        return get_topics_function(topics_tree, ["bash"], cache_dir=cache_dir, platform=self.PLATFORM)
+
+    def changed_answer(self, topics_tree, cache_home):
+        """The cached answer after a change; it must be what working it out from scratch gives."""
+        answer = self.answer(topics_tree, cache_home / "shells")
+        assert answer == self.answer(topics_tree)
+        return answer
+
+    def test_warm_cache_scans_nothing(self, topics_tree, cache_home, monkeypatch):
+        first = self.answer(topics_tree, cache_home / "shells")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("scanned the topics again")
+
+        monkeypatch.setattr(os, "scandir", fail)
+        assert self.answer(topics_tree, cache_home / "shells") == first
+
+    def test_topic_added(self, topics_tree, cache_home):
+        self.answer(topics_tree, cache_home / "shells")
+        (topics_tree / "topic-new.sh").write_text("# new\n")
+        touch_later(topics_tree)
+        assert topics_tree / "topic-new.sh" in self.changed_answer(topics_tree, cache_home)
+
+    def test_topic_removed(self, topics_tree, cache_home):
+        assert topics_tree / "topic-5.sh" in self.answer(topics_tree, cache_home / "shells")
+        (topics_tree / "topic-5.sh").unlink()
+        touch_later(topics_tree)
+        assert topics_tree / "topic-5.sh" not in self.changed_answer(topics_tree, cache_home)
+
+    @pytest.mark.parametrize("list_file", ["initial-topics", "final-topics"])
+    def test_list_file_edited(self, topics_tree, cache_home, list_file):
+        first = self.answer(topics_tree, cache_home / "shells")
+        listed = (topics_tree / list_file).read_text().split()
+        (topics_tree / list_file).write_text("".join(f"{stem}\n" for stem in reversed(listed)))
+        touch_later(topics_tree / list_file)
+        assert self.changed_answer(topics_tree, cache_home) != first
+
+    def test_non_interactive_list_edited(self, topics_tree, cache_home):
+        def non_interactive_answer(cache_dir=None):
+            return get_topics_function(topics_tree, ["bash"], False, cache_dir, platform=self.PLATFORM)
+
+        assert topics_tree / "topic-4.sh" in non_interactive_answer(cache_home / "shells")
+        (topics_tree / "non-interactive-topics").write_text("topic-5\n")
+        touch_later(topics_tree / "non-interactive-topics")
+        assert non_interactive_answer(cache_home / "shells") == non_interactive_answer() == [topics_tree / "topic-5.sh"]
+
+    def test_platform_directory_created(self, topics_tree, cache_home):
+        shutil.rmtree(topics_tree / self.PLATFORM)
+        first = self.answer(topics_tree, cache_home / "shells")
+        (topics_tree / self.PLATFORM).mkdir()
+        (topics_tree / self.PLATFORM / "topic-3.sh").write_text("# topic-3 here\n")
+        override = topics_tree / self.PLATFORM / "topic-3.sh"
+        assert override not in first
+        assert override in self.changed_answer(topics_tree, cache_home)
+
+    def test_topic_added_to_platform_directory(self, topics_tree, cache_home):
+        self.answer(topics_tree, cache_home / "shells")
+        override = topics_tree / self.PLATFORM / "topic-3.sh"
+        override.write_text("# topic-3 here\n")
+        touch_later(topics_tree / self.PLATFORM)
+        assert override in self.changed_answer(topics_tree, cache_home)
+
+    def test_other_platform_is_not_asked_about(self, topics_tree, cache_home):
+        first = self.answer(topics_tree, cache_home / "shells")
+        (topics_tree / "darwin" / "topic-3.sh").write_text("# topic-3 on darwin\n")
+        touch_later(topics_tree / "darwin")
+        assert self.changed_answer(topics_tree, cache_home) == first
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="needs bash")
+class TestBundle:
+    def source(self, *paths):
+        """What bash prints sourcing each of `paths` in turn."""
+        script = 'for f ; do source "$f" ; done'
+        return subprocess.run(["bash", "-c", script, "bash", *paths], capture_output=True, text=True, check=True).stdout
+
+    @pytest.fixture
+    def topic_paths(self, topics_tree, cache_home):
+        (topics_tree / "topic-3.sh").write_text(
+            'echo "three"\ncommand -v no-such-tool >/dev/null 2>&1 || return\necho never\n'
+        )
+        (topics_tree / "topic-4.sh").write_text('echo "four"\n')
+        (topics_tree / "topic-18.sh").write_text('echo "eighteen, last but one"\n')
+        return get_topics_function(topics_tree, ["bash"], platform="linux")
+
+    def test_same_as_sourcing_each_topic(self, topic_paths, tmp_path):
+        write_bundle(tmp_path / "bundle.sh", topic_paths)
+        output = self.source(tmp_path / "bundle.sh")
+        assert output == self.source(*topic_paths)
+        assert output == "three\nfour\neighteen, last but one\n"  # `return` skipped only the rest of topic-3
+
+    def test_header_maps_lines_to_topics(self, topic_paths, tmp_path):
+        write_bundle(tmp_path / "bundle.sh", topic_paths)
+        lines = (tmp_path / "bundle.sh").read_text().splitlines()
+        mapped = [line.split() for line in lines if line.startswith("#  ") and line.split()[-1].startswith("/")]
+        assert [Path(path) for _, _, path in mapped] == topic_paths
+        for _, line_number, path in mapped:
+            assert lines[int(line_number) - 1] == Path(path).read_text().splitlines()[0]
+
+    def test_rebuilt_only_when_needed(self, topic_paths, tmp_path):
+        bundle = tmp_path / "bundle.sh"
+        assert write_bundle(bundle, topic_paths)
+        assert not write_bundle(bundle, topic_paths)
+
+        topic = topic_paths[topic_paths.index(bundle.parent / "topics" / "topic-4.sh")]
+        topic.write_text('echo "four, edited"\n')
+        os.utime(topic, ns=(topic.stat().st_atime_ns, bundle.stat().st_mtime_ns + 1))  # Just newer than the bundle
+        assert write_bundle(bundle, topic_paths)
+        assert "four, edited" in self.source(bundle)
+        assert not write_bundle(bundle, topic_paths)
+
+        assert write_bundle(bundle, topic_paths[:-1])  # A topic fewer
+        assert write_bundle(bundle, list(reversed(topic_paths)))  # The same topics, in another order
+
+
+class TestTopicsForTargets:
+    TARGETS = ["bash", "zsh", "bash:noninteractive", "zsh:deferred"]
+
+    def test_same_answers_as_one_at_a_time(self, topics_tree, cache_home):
+        answers = topics_for_targets(topics_tree, self.TARGETS)
+        for target in self.TARGETS:
+            shell, interactive, deferred = parse_target(target)
+            assert answers[target] == get_topics_function(topics_tree, [shell], interactive, deferred=deferred)
+
+    def test_one_platform_call_and_one_scan(self, topics_tree, cache_home, monkeypatch):
+        calls = {"get_platform": 0, "scandir": 0}
+        real_get_platform, real_scandir = get_topics.get_platform, os.scandir
+
+        def counting_get_platform():
+            calls["get_platform"] += 1
+            return real_get_platform()
+
+        def counting_scandir(path):
+            calls["scandir"] += 1
+            return real_scandir(path)
+
+        monkeypatch.setattr(get_topics, "get_platform", counting_get_platform)
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+        topics_for_targets(topics_tree, self.TARGETS)
+        assert calls["get_platform"] == 1
+        assert calls["scandir"] == len(get_topics.topic_roots(topics_tree, real_get_platform()))
+
+
+class TestAutoloadStubs:
+    @pytest.fixture
+    def lazy_tree(self, topics_tree):
+        (topics_tree / "lazy-fn.sh").write_text("lazy_fn() {  # Say hello\n    echo hello\n}\n")
+        (topics_tree / "lazy-topics").write_text("lazy-fn\n")
+        return topics_tree
+
+    def test_warm_start_resolves_nothing(self, lazy_tree, cache_home, monkeypatch):
+        stubs = cache_home / "stubs.bash"
+        first = topics_to_source(lazy_tree, "bash", cache_dir=cache_home / "shells", stubs=stubs)
+        assert first[0] == stubs and "lazy_fn()" in stubs.read_text()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("resolved the lazy topics again")
+
+        monkeypatch.setattr(get_topics, "get_lazy_topics", fail)
+        monkeypatch.setattr(get_topics, "write_autoload_stubs", fail)
+        monkeypatch.setattr(os, "scandir", fail)
+        assert topics_to_source(lazy_tree, "bash", cache_dir=cache_home / "shells", stubs=stubs) == first
+
+    def test_edited_lazy_topic_rebuilds_stubs(self, lazy_tree, cache_home):
+        stubs = cache_home / "stubs.bash"
+        topics_to_source(lazy_tree, "bash", cache_dir=cache_home / "shells", stubs=stubs)
+        lazy_topic = lazy_tree / "lazy-fn.sh"
+        lazy_topic.write_text(lazy_topic.read_text() + "other_fn() {\n    :\n}\n")
+        os.utime(lazy_topic, ns=(lazy_topic.stat().st_atime_ns, stubs.stat().st_mtime_ns + 1_000_000_000))
+        topics_to_source(lazy_tree, "bash", cache_dir=cache_home / "shells", stubs=stubs)
+        assert "other_fn()" in stubs.read_text()
+
+    def test_deleted_stubs_are_written_again(self, lazy_tree, cache_home):
+        stubs = cache_home / "stubs.bash"
+        topics_to_source(lazy_tree, "bash", cache_dir=cache_home / "shells", stubs=stubs)
+        stubs.unlink()
+        assert topics_to_source(lazy_tree, "bash", cache_dir=cache_home / "shells", stubs=stubs)[0] == stubs
+        assert stubs.exists()
+
+    def test_no_lazy_topics_no_stubs(self, topics_tree, cache_home):
+        stubs = cache_home / "stubs.bash"
+        assert stubs not in topics_to_source(topics_tree, "bash", cache_dir=cache_home / "shells", stubs=stubs)
+        assert not stubs.exists()
+
+
+class TestManifests:
+    def test_one_manifest_per_target(self, topics_tree, cache_home, tmp_path):
+        manifest_dir = tmp_path / "manifests"
+        result = subprocess.run(
+            [sys.executable, SCRIPT_PATH, topics_tree, "bash", "zsh:noninteractive", "--manifest-dir", manifest_dir],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+        for target in ("bash", "zsh:noninteractive"):
+            single = subprocess.run(
+                [sys.executable, SCRIPT_PATH, topics_tree, target], capture_output=True, text=True, check=True
+            )
+            assert manifest_file(manifest_dir, target).read_text() == single.stdout
+
+    def test_several_targets_need_a_manifest_dir(self, topics_tree, cache_home):
+        result = subprocess.run([sys.executable, SCRIPT_PATH, topics_tree, "bash", "zsh"], capture_output=True)
+        assert result.returncode == 1
+
+
+class TestZcompile:
+    def test_zwc_must_be_newer_by_a_whole_second(self, tmp_path):
+        topic, zwc = tmp_path / "git.zsh", tmp_path / "git.zsh.zwc"
+        topic.write_text("alias g=git\n")
+        assert not zwc_is_current(topic)
+        zwc.write_bytes(b"")
+        os.utime(topic, (1000, 1000.1))
+        os.utime(zwc, (1000, 1000.9))
+        assert not zwc_is_current(topic)  # Zsh would still parse the topic
+        os.utime(zwc, (1001, 1001))
+        assert zwc_is_current(topic)
+
+    def test_nothing_current_is_compiled(self, topics_tree, cache_home, monkeypatch):
+        platform = get_topics.get_platform()
+        paths = topics_to_source(topics_tree, "zsh", platform=platform)
+        for path in paths:
+            Path(f"{path}.zwc").write_bytes(b"")
+            os.utime(f"{path}.zwc", (os.stat(path).st_mtime + 2,) * 2)
+        monkeypatch.setattr(subprocess, "run", lambda *args, **kwargs: pytest.fail("compiled a current file"))
+        assert topics_to_source(topics_tree, "zsh", zcompile=True, platform=platform) == paths
+
+    @pytest.mark.skipif(shutil.which("zsh") is None, reason="needs zsh")
+    def test_compiles_each_file_zsh_sources(self, topics_tree, cache_home):
+        paths = topics_to_source(topics_tree, "zsh", zcompile=True)
+        assert paths and all(zwc_is_current(path) for path in paths)
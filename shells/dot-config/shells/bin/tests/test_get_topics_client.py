@@ -0,0 +1,121 @@
+"""Tests for get_topics_client.py, which asks get_topics_server.py, or does the work itself."""
+import inspect
+import socket
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+import get_topics
+from fast_cli import parse_arguments as parse_main_arguments
+from get_topics_client import get_topics_arguments, parse_arguments
+from get_topics_server import TopicsMemo, TopicsServer
+
+SCRIPT_DIR = Path(__file__).parent.parent
+
+MAIN_DEFAULTS = {
+    name: parameter.default
+    for name, parameter in inspect.signature(get_topics.main).parameters.items()
+    if parameter.default is not inspect.Parameter.empty
+}
+
+
+class TestParseArguments:
+    @pytest.mark.parametrize(
+        "arguments",
+        [
+            ["/topics", "bash"],
+            ["/topics", "zsh", "--print0", "--no-interactive"],
+            ["--print0", "/topics", "zsh", "--deferred", "--no-cache"],
+            ["/topics", "zsh", "--bundle", "/bundle", "--stubs", "/stubs", "--profile", "/profile", "--zcompile"],
+            ["/topics", "bash", "--cache-dir", "/cache", "--interactive", "--no-print0", "--no-deferred", "--cache"],
+            ["/topics", "bash", "--no-zcompile"],
+        ],
+    )
+    def test_same_as_get_topics(self, arguments):
+        expected = {**MAIN_DEFAULTS, **parse_main_arguments(get_topics.main, arguments)}
+        assert {**MAIN_DEFAULTS, **get_topics_arguments(parse_arguments(arguments))} == expected
+
+    def test_paths_are_made_absolute(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        options = parse_arguments(["topics", "bash", "--bundle", "bundle", "--cache-dir", "cache"])
+        assert options["topics_dir"] == tmp_path / "topics"
+        assert options["bundle"] == tmp_path / "bundle"
+        assert options["cache_dir"] == tmp_path / "cache"
+
+    @pytest.mark.parametrize(
+        "arguments",
+        [
+            ["--help"],
+            ["/topics"],
+            ["/topics", "bash", "zsh"],  # Several targets
+            ["/topics", "bash:noninteractive"],
+            ["/topics", "bash", "--manifest-dir", "/manifests"],
+            ["/topics", "bash", "--bundle"],  # Missing value
+        ],
+    )
+    def test_left_to_get_topics(self, arguments):
+        assert parse_arguments(arguments) is None
+
+
+class TestClient:
+    @pytest.fixture
+    def runtime_dir(self, tmp_path, monkeypatch):
+        """Where the client looks for the server's socket (`$XDG_RUNTIME_DIR/shells/get_topics.sock`)."""
+        runtime_dir = tmp_path / "run"
+        (runtime_dir / "shells").mkdir(parents=True)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(runtime_dir))
+        return runtime_dir
+
+    def run_script(self, script, *arguments, cwd=SCRIPT_DIR):
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT_DIR / script), *arguments], capture_output=True, check=True, cwd=cwd
+        )
+        return result.stdout
+
+    @pytest.mark.parametrize("options", [[], ["--print0", "--no-interactive"]])
+    def test_no_server(self, topics_tree, cache_home, runtime_dir, options):
+        expected = self.run_script("get_topics.py", str(topics_tree), "bash", *options)
+        assert self.run_script("get_topics_client.py", str(topics_tree), "bash", *options) == expected
+
+    def test_server_gone(self, topics_tree, cache_home, runtime_dir):
+        # The socket of a server that died: nothing listens on it
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as dead:
+            dead.bind(str(runtime_dir / "shells" / "get_topics.sock"))
+        expected = self.run_script("get_topics.py", str(topics_tree), "zsh")
+        assert self.run_script("get_topics_client.py", str(topics_tree), "zsh") == expected
+
+    @pytest.mark.parametrize("options", [[], ["--print0"], ["--profile", "profile.log"]])
+    def test_server_prints_the_same(self, topics_tree, cache_home, runtime_dir, tmp_path, options):
+        with TopicsServer(runtime_dir / "shells" / "get_topics.sock", TopicsMemo(None)) as server:
+            thread = threading.Thread(target=server.serve_forever)
+            thread.start()
+            try:
+                output = self.run_script("get_topics_client.py", str(topics_tree), "bash", *options, cwd=tmp_path)
+            finally:
+                server.shutdown()
+                thread.join()
+        assert output == self.run_script("get_topics.py", str(topics_tree), "bash", *options, cwd=tmp_path)
+        assert output
+
+    def test_server_error(self, topics_tree, cache_home, runtime_dir, tmp_path):
+        # A bundle the server can't write: the client works it out itself, and fails just as `get_topics.py` does
+        bundle = tmp_path / "not-a-directory" / "bundle"
+        (tmp_path / "not-a-directory").write_text("")
+        with TopicsServer(runtime_dir / "shells" / "get_topics.sock", TopicsMemo(None)) as server:
+            thread = threading.Thread(target=server.serve_forever)
+            thread.start()
+            try:
+                result = subprocess.run(
+                    [sys.executable, "get_topics_client.py", str(topics_tree), "bash", "--bundle", str(bundle)],
+                    capture_output=True,
+                    text=True,
+                    cwd=SCRIPT_DIR,
+                )
+            finally:
+                server.shutdown()
+                thread.join()
+        assert result.returncode != 0
+        assert result.stdout == ""
@@ -0,0 +1,87 @@
+"""Tests for get_topics_server.py's memory of answers."""
+import threading
+import time
+
+import pytest
+
+import get_topics_server
+from get_topics_server import TopicsMemo
+from inotify import Inotify, inotify_available
+
+needs_inotify = pytest.mark.skipif(not inotify_available(), reason="needs inotify")
+
+
+@pytest.fixture
+def question(topics_tree):
+    """The question `get_topics_client.py` asks for `get_topics.py <topics_tree> bash`."""
+    return {
+        "topics_dir": str(topics_tree),
+        "shell": "bash",
+        "interactive": True,
+        "deferred": False,
+        "bundle": None,
+        "stubs": None,
+        "zcompile": False,
+    }
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Every call the server makes to `topics_to_source`."""
+    calls = []
+    real_topics_to_source = get_topics_server.topics_to_source
+
+    def counting_topics_to_source(**kwargs):
+        calls.append(kwargs)
+        return real_topics_to_source(**kwargs)
+
+    monkeypatch.setattr(get_topics_server, "topics_to_source", counting_topics_to_source)
+    return calls
+
+
+def answer_eventually(memo, question, predicate, timeout=5.0):
+    """Ask until the answer satisfies `predicate` (inotify events arrive a moment after the change); return it."""
+    deadline = time.monotonic() + timeout
+    while not predicate(answer := memo.answer(question)) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return answer
+
+
+class TestTopicsMemo:
+    def test_without_inotify_nothing_is_remembered(self, question, calls, cache_home):
+        memo = TopicsMemo(None)
+        assert memo.answer(question) == memo.answer(question)
+        assert len(calls) == 2
+
+    @needs_inotify
+    def test_remembers_until_the_tree_changes(self, topics_tree, question, calls, cache_home):
+        memo = TopicsMemo(Inotify())
+        threading.Thread(target=memo.forget_changed_trees, daemon=True).start()
+        first = memo.answer(question)
+        assert memo.answer(question) == first
+        assert len(calls) == 1
+
+        new_topic = topics_tree / "new-topic.sh"
+        new_topic.write_text("# new\n")
+        assert new_topic in answer_eventually(memo, question, lambda answer: new_topic in answer)
+        assert len(calls) > 1
+
+    @needs_inotify
+    def test_forgets_after_a_change_in_a_platform_directory(self, topics_tree, question, calls, cache_home):
+        memo = TopicsMemo(Inotify())
+        threading.Thread(target=memo.forget_changed_trees, daemon=True).start()
+        first = memo.answer(question)
+        (topics_tree / "darwin" / "topic-1.sh").write_text("# topic-1 on darwin\n")
+        answer_eventually(memo, question, lambda answer: len(calls) > 1)
+        assert len(calls) > 1
+        assert memo.answer(question) == first  # Not this platform's, so the same answer; remembered again
+
+    @needs_inotify
+    def test_forgets_an_answer_whose_files_are_gone(self, question, calls, cache_home, tmp_path):
+        memo = TopicsMemo(Inotify())
+        question = {**question, "bundle": str(tmp_path / "bundle.sh")}
+        assert memo.answer(question) == [tmp_path / "bundle.sh"]
+        (tmp_path / "bundle.sh").unlink()
+        assert memo.answer(question) == [tmp_path / "bundle.sh"]
+        assert (tmp_path / "bundle.sh").exists()
+        assert len(calls) == 2
@@ -0,0 +1,90 @@
+"""Import-time budget tests: the scripts that run at every shell start must stay cheap to start."""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT_DIR = Path(__file__).parent.parent
+
+# Milliseconds of imports allowed beyond what the interpreter imports on its own.  Importing `typer` alone costs more.
+IMPORT_BUDGET_MS = 75
+
+HEAVY_MODULES = {"typer", "click", "rich", "typing_extensions"}
+
+
+def import_report(*args: str) -> list[tuple[str, int]]:
+    """Run Python with `-X importtime` and return `(module, cumulative microseconds)` for each import, indented as shown."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args], capture_output=True, text=True, cwd=SCRIPT_DIR
+    )
+    assert result.returncode == 0, result.stderr
+    report = []
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and line.count("|") == 2:
+            _, cumulative, name = line.removeprefix("import time:").split("|")
+            if cumulative.strip().isdigit():
+                report.append((name.removeprefix(" "), int(cumulative)))
+    return report
+
+
+def import_times(*args: str) -> dict[str, int]:
+    """The cumulative microseconds of each top-level import."""
+    return {name: us for name, us in import_report(*args) if not name.startswith(" ")}
+
+
+def imported_modules(*args: str) -> set[str]:
+    """The top-level packages of every module imported."""
+    return {name.strip().split(".")[0] for name, _ in import_report(*args)}
+
+
+def script_import_cost_ms(*args: str) -> float:
+    """The best of three runs: milliseconds spent importing, beyond what a bare interpreter imports."""
+    interpreter_modules = set(import_times("-c", "pass"))
+    costs = []
+    for _ in range(3):
+        times = import_times(*args)
+        costs.append(sum(us for name, us in times.items() if name not in interpreter_modules) / 1000)
+    return min(costs)
+
+
+@pytest.fixture
+def fast_path_commands(topics_tree, cache_home):
+    return {
+        "get_topics.py": ["get_topics.py", str(topics_tree), "bash"],
+        "get_topics.py --print0 --no-cache": ["get_topics.py", str(topics_tree), "zsh", "--print0", "--no-cache"],
+        "deduplicate_path.py": ["deduplicate_path.py"],
+        "shell_init.py": ["shell_init.py", str(topics_tree), "bash"],
+        "deduplicate_path.py --remove": ["deduplicate_path.py", "--remove", "/usr/bin"],
+        "tool_index.py": ["tool_index.py", "bash", str(topics_tree)],
+        "cached_init.py": ["cached_init.py", "bash", "--", "echo", "export CACHED=1"],
+    }
+
+
+class TestFastPath:
+    """The usual command lines never import typer."""
+
+    def test_no_heavy_imports(self, fast_path_commands):
+        for description, command in fast_path_commands.items():
+            heavy = imported_modules(*command) & HEAVY_MODULES
+            assert not heavy, f"{description} imported {sorted(heavy)}"
+
+    def test_within_budget(self, fast_path_commands):
+        for description, command in fast_path_commands.items():
+            cost = script_import_cost_ms(*command)
+            assert cost <= IMPORT_BUDGET_MS, f"{description} spent {cost:.1f} ms on imports (budget {IMPORT_BUDGET_MS})"
+
+
+class TestHelp:
+    """`--help` still gets typer's help."""
+
+    @pytest.mark.parametrize(
+        "script", ["get_topics.py", "deduplicate_path.py", "shell_init.py", "tool_index.py", "cached_init.py"]
+    )
+    def test_help_uses_typer(self, script):
+        pytest.importorskip("typer")
+        result = subprocess.run(
+            [sys.executable, script, "--help"], capture_output=True, text=True, cwd=SCRIPT_DIR
+        )
+        assert result.returncode == 0
+        assert "Usage:" in result.stdout
@@ -0,0 +1,79 @@
+"""Tests for install_frozen.py: finding the `uv run` scripts, gathering their dependencies, and the launchers."""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("typer")
+
+from install_frozen import collect_requirements, find_uv_scripts, is_launcher, write_launchers  # noqa: E402
+
+SCRIPT_HEADER = """#!/usr/bin/env -S uv run --no-project --script --quiet
+# /// script
+# requires-python = ">=3.13"
+# dependencies = [
+#     {dependencies}
+# ]
+# ///
+"""
+
+
+def write_script(path: Path, dependencies: str, body: str = "") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(SCRIPT_HEADER.format(dependencies=dependencies) + body)
+    return path
+
+
+class TestFindScripts:
+    def test_only_uv_scripts_and_the_first_of_each_name(self, tmp_path):
+        first = write_script(tmp_path / "one" / "tool.py", '"typer",')
+        write_script(tmp_path / "two" / "tool.py", '"rich",')
+        other = write_script(tmp_path / "two" / "other.py", '"git-workflow-utils @ git+https://example.com/x.git",')
+        (tmp_path / "two" / "module.py").write_text('"""Not a script."""\n')
+        scripts = find_uv_scripts([tmp_path / "one", tmp_path / "missing", tmp_path / "two"])
+        assert scripts == [first.resolve(), other.resolve()]
+        assert collect_requirements(scripts) == (["typer", "git-workflow-utils @ git+https://example.com/x.git"], ">=3.13")
+
+    def test_finds_the_scripts_here(self):
+        names = {script.name for script in find_uv_scripts([Path(__file__).parent.parent])}
+        assert {"get_topics.py", "deduplicate_path.py", "shell_init.py", "install_frozen.py"} <= names
+        assert "fast_cli.py" not in names
+
+
+class TestLaunchers:
+    def test_launcher_runs_the_script_as_main(self, tmp_path):
+        (tmp_path / "scripts" / "helper.py").parent.mkdir()
+        (tmp_path / "scripts" / "helper.py").write_text("GREETING = 'hello'\n")
+        body = "import sys\nfrom helper import GREETING\nif __name__ == '__main__':\n    print(GREETING, *sys.argv)\n"
+        script = write_script(tmp_path / "scripts" / "greet.py", "", body)
+        (launcher,) = write_launchers(tmp_path / "bin", Path(sys.executable), [script])
+        result = subprocess.run([launcher, "world"], capture_output=True, text=True, check=True)
+        assert result.stdout == f"hello {script} world\n"
+        assert (tmp_path / "scripts" / "__pycache__").is_dir()
+
+    def test_stale_launchers_are_removed(self, tmp_path):
+        scripts = [write_script(tmp_path / "scripts" / f"{name}.py", "") for name in ("kept", "gone")]
+        write_launchers(tmp_path / "bin", Path(sys.executable), scripts)
+        (tmp_path / "bin" / "mine").write_text("#!/bin/sh\n# not a launcher\n")
+        write_launchers(tmp_path / "bin", Path(sys.executable), scripts[:1])
+        assert sorted(path.name for path in (tmp_path / "bin").iterdir()) == ["kept.py", "mine"]
+        assert is_launcher(tmp_path / "bin" / "kept.py")
+
+    def test_deduplicate_path_keeps_the_first_entry_through_a_launcher(self, tmp_path):
+        """A launcher isn't `uv run`: nothing was put in front of $PATH, so nothing may be trimmed from it."""
+        script_dir = Path(__file__).parent.parent
+        launcher_dir = tmp_path / "frozen-bin"
+        (launcher,) = write_launchers(launcher_dir, Path(sys.executable), [script_dir / "deduplicate_path.py"])
+        path = f"{launcher_dir}:/usr/bin:/bin:/usr/bin"
+        result = subprocess.run([launcher], capture_output=True, text=True, check=True, env={"PATH": path})
+        assert result.stdout == f'export PATH="{launcher_dir}:/usr/bin:/bin"\n'
+
+    def test_deduplicate_path_trims_what_uv_run_added(self, tmp_path):
+        """Run as `uv run` would: the interpreter's own bin directory first on $PATH."""
+        script = Path(__file__).parent.parent / "deduplicate_path.py"
+        path = f"{Path(sys.executable).parent}:/usr/bin:/bin"
+        result = subprocess.run(
+            [sys.executable, script], capture_output=True, text=True, check=True, env={"PATH": path}
+        )
+        assert result.stdout == 'export PATH="/usr/bin:/bin"\n'
@@ -0,0 +1,83 @@
+"""Tests for shell_init.py, the one-process plan for a starting shell, and `clean_path_variables`, which ends it."""
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from get_topics import topics_to_source
+from shell_init import render_init_plan
+
+SCRIPT_DIR = Path(__file__).parent.parent
+REQUIRED_FUNCTIONS = SCRIPT_DIR.parent / "topics" / "required_functions.sh.inc"
+
+BASH = shutil.which("bash")
+
+needs_bash = pytest.mark.skipif(BASH is None, reason="needs bash")
+
+
+def run_bash(script, **environment):
+    script = f'source "{REQUIRED_FUNCTIONS}"\n{script}'
+    env = {**os.environ, **environment}
+    return subprocess.run([BASH, "-c", script], capture_output=True, text=True, check=True, env=env).stdout
+
+
+class TestRenderInitPlan:
+    def test_platform_then_topics_then_cleanup(self):
+        plan = render_init_plan("zsh", "linux", ["/t/a.sh", "/t/b c.zsh"]).splitlines()
+        assert plan == [
+            "export SHELLS_PLATFORM=linux",
+            "SHELLS_INIT_CLEANS_PATHS=1",
+            "source_all /t/a.sh '/t/b c.zsh'",
+            "unset SHELLS_INIT_CLEANS_PATHS",
+            "clean_path_variables PATH MANPATH INFOPATH CDPATH PYTHONPATH LD_LIBRARY_PATH FPATH",
+        ]
+
+    def test_profile_goes_ahead_of_the_paths(self, tmp_path):
+        plan = render_init_plan("bash", "darwin", ["/t/a.sh"], tmp_path / "profile.log")
+        assert f"source_all --profile {tmp_path / 'profile.log'} /t/a.sh\n" in plan
+        assert "FPATH" not in plan
+
+
+class TestShellInit:
+    def test_plans_the_same_topics_as_get_topics(self, topics_tree, cache_home):
+        result = subprocess.run(
+            [sys.executable, SCRIPT_DIR / "shell_init.py", str(topics_tree), "bash"],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "SHELLS_PLATFORM": "linux"},
+        )
+        expected = topics_to_source(topics_tree, "bash", cache_dir=cache_home / "shells", platform="linux")
+        assert result.stdout.splitlines()[2].split()[1:] == [str(path) for path in expected]
+
+    @needs_bash
+    def test_bash_sources_every_topic_and_cleans_path(self, tmp_path):
+        topic = tmp_path / "topic.sh"
+        topic.write_text('PATH="/usr/bin:${PATH}"\nSOURCED="${SOURCED}x"\n')
+        plan = render_init_plan("bash", "linux", [topic, topic])
+        out = run_bash(f'{plan}\necho "${{SOURCED}}|${{PATH}}|${{SHELLS_INIT_CLEANS_PATHS-unset}}"', PATH="/usr/bin:/bin")
+        sourced, path, cleans = out.strip().split("\n")[-1].split("|")
+        assert sourced == "xx"
+        assert path.split(":").count("/usr/bin") == 1
+        assert cleans == "unset"
+
+
+@needs_bash
+class TestCleanPathVariables:
+    def test_follows_deduplicate_path_rules(self, tmp_path):
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+        os.symlink(tmp_path / "a", tmp_path / "link")
+        (tmp_path / "file").write_text("")
+        a, b, link, file, missing = (str(tmp_path / name) for name in ("a", "b", "link", "file", "missing"))
+        out = run_bash(
+            'clean_path_variables PATH MANPATH CDPATH INFOPATH\n'
+            'echo "${PATH}"; echo "${MANPATH}"; echo "${CDPATH}"; echo "${INFOPATH-unset}"',
+            PATH=f"{a}::{link}:{missing}:{b}:{a}:{file}:bin:bin",
+            MANPATH=f":{a}::{file}:{link}",
+            CDPATH=f".:{a}:.",
+        )
+        assert out.splitlines() == [f"{a}:{b}:bin", f":{a}:{file}", f".:{a}", "unset"]
@@ -0,0 +1,147 @@
+"""Tests for tool_index.py, the index of tools topics look for with `have_tool`."""
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from tool_index import find_executables, find_wanted_tools, path_signature, tool_index
+
+
+REQUIRED_FUNCTIONS = Path(__file__).parent.parent.parent / "topics" / "required_functions.sh.inc"
+
+TOOL_INDEX = Path(__file__).parent.parent / "tool_index.py"
+
+
+def make_executable(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("#!/bin/sh\n")
+    path.chmod(0o755)
+    return path
+
+
+@pytest.fixture
+def search_path(tmp_path):
+    """Two directories on a search path: "git" in both, "fzf" only in the second, and a non-executable "bat"."""
+    first, second = tmp_path / "first", tmp_path / "second"
+    make_executable(first / "git")
+    make_executable(second / "git")
+    make_executable(second / "fzf")
+    (second / "bat").write_text("not executable\n")
+    return os.pathsep.join([str(first), str(tmp_path / "missing"), str(second)])
+
+
+class TestFindWantedTools:
+    def test_have_tool_calls_in_topics_and_platform_directories(self, tmp_path):
+        (tmp_path / "darwin").mkdir()
+        (tmp_path / "fzf.sh").write_text("have_tool fzf || return\n")
+        (tmp_path / "darwin" / "fd.sh").write_text("if have_tool as-tree ; then\n    :\nfi\n")
+        assert find_wanted_tools(tmp_path) == ["as-tree", "brew", "fzf"]
+
+
+class TestFindExecutables:
+    def test_first_on_the_path_wins(self, search_path):
+        tools = find_executables(search_path, {"git", "fzf", "bat", "eza"})
+        assert tools == {
+            "git": os.path.join(search_path.split(os.pathsep)[0], "git"),
+            "fzf": os.path.join(search_path.split(os.pathsep)[2], "fzf"),
+        }
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="needs bash")
+class TestIndex:
+    def source(self, index_file, expression):
+        script = f'source "{index_file}"; {expression}'
+        return subprocess.run(["bash", "-c", script], capture_output=True, text=True, check=True).stdout
+
+    def test_bash_can_look_tools_up(self, search_path, tmp_path):
+        index_file = tmp_path / "tool-index.bash"
+        tool_index("bash", search_path, ["fzf", "eza"], index_file)
+        lookups = 'echo "${SHELLS_TOOLS[fzf]}|${SHELLS_TOOLS[eza]+indexed}|${SHELLS_TOOLS[ls]+indexed}"'
+        fzf = os.path.join(search_path.split(os.pathsep)[2], "fzf")
+        assert self.source(index_file, lookups) == f"{fzf}|indexed|\n"
+        assert self.source(index_file, 'echo "${SHELLS_TOOLS_PATH}"') == f"{search_path}\n"
+
+    def test_have_tool_only_while_its_directory_is_on_path(self, search_path, tmp_path):
+        index_file = tmp_path / "tool-index.bash"
+        tool_index("bash", search_path, ["fzf"], index_file)
+        script = (
+            f'source "{REQUIRED_FUNCTIONS}"; source "{index_file}"; PATH="{search_path}"\n'
+            "have_tool fzf && echo found\n"
+            f'PATH="{search_path.split(os.pathsep)[0]}"\n'  # As if `deduplicate-path --remove` took "fzf"'s away
+            "have_tool fzf || echo gone\n"
+        )
+        result = subprocess.run(["bash", "-c", script], capture_output=True, text=True, check=True)
+        assert result.stdout == "found\ngone\n"
+
+    def test_rebuilt_only_when_a_directory_changes(self, search_path, tmp_path):
+        index_file = tmp_path / "tool-index.bash"
+        first = tool_index("bash", search_path, ["eza"], index_file)
+        assert tool_index("bash", search_path, ["eza"], index_file) == first
+        make_executable(tmp_path / "second" / "eza")
+        eza = str(tmp_path / "second" / "eza")
+        assert eza not in first
+        assert eza in tool_index("bash", search_path, ["eza"], index_file)
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="needs bash")
+class TestLoadToolIndex:
+    """`load_tool_index`, which only runs tool_index.py when the index it finds isn't current."""
+
+    @pytest.fixture
+    def home(self, tmp_path):
+        topics_dir = tmp_path / "home" / ".config" / "shells" / "topics"
+        topics_dir.mkdir(parents=True)
+        (topics_dir / "fzf.sh").write_text("have_tool fzf || return\n")
+        return tmp_path / "home"
+
+    def load(self, home, search_path, expression=""):
+        """Run `load_tool_index` with $PATH set to `search_path`; return `expression`'s output and if it ran Python."""
+        calls = home / "calls"
+        calls.unlink(missing_ok=True)
+        script = (
+            f'source "{REQUIRED_FUNCTIONS}"\n'
+            f'tool_index.py() {{ echo >> "{calls}" ; "{sys.executable}" "{TOOL_INDEX}" "$@" ; }}\n'
+            f'PATH="{search_path}"\n'
+            f"load_tool_index\n{expression}\n"
+        )
+        env = {**os.environ, "HOME": str(home), "XDG_CACHE_HOME": str(home / ".cache")}
+        result = subprocess.run(["bash", "-c", script], capture_output=True, text=True, check=True, env=env)
+        return result.stdout, calls.exists()
+
+    def test_current_index_runs_nothing(self, home, search_path):
+        assert self.load(home, search_path)[1]
+        assert self.load(home, search_path, 'echo "${SHELLS_TOOLS[fzf]+indexed}"') == ("indexed\n", False)
+
+    def test_new_topic_asks_about_another_tool(self, home, search_path):
+        self.load(home, search_path)
+        topics_dir = home / ".config" / "shells" / "topics"
+        (topics_dir / "eza.sh").write_text("have_tool eza || return\n")
+        assert self.load(home, search_path, 'echo "${SHELLS_TOOLS[eza]+indexed}"') == ("indexed\n", True)
+
+    def test_topic_edited_to_ask_about_another_tool(self, home, search_path):
+        self.load(home, search_path)
+        topic = home / ".config" / "shells" / "topics" / "fzf.sh"
+        topic.write_text("have_tool fzf || return\nhave_tool bat && export BAT_THEME=ansi\n")
+        assert self.load(home, search_path, 'echo "${SHELLS_TOOLS[bat]+indexed}"') == ("indexed\n", True)
+        assert self.load(home, search_path) == ("", False)
+
+    def test_one_index_per_path(self, home, search_path):
+        other_path = search_path.split(os.pathsep, 1)[1]  # As if a nested shell had one entry fewer
+        assert self.load(home, search_path)[1]
+        assert self.load(home, other_path)[1]
+        assert not self.load(home, search_path)[1]
+        assert not self.load(home, other_path)[1]
+        assert {path.name for path in (home / ".cache" / "shells").iterdir()} == {
+            f"tool-index.bash.{path_signature(search_path)}",
+            f"tool-index.bash.{path_signature(other_path)}",
+        }
+
+    def test_same_signature_is_still_checked(self, home, search_path):
+        first, missing, second = search_path.split(os.pathsep)
+        same_lengths = os.pathsep.join([first, missing[:-1] + "X", second])
+        assert path_signature(same_lengths) == path_signature(search_path)
+        self.load(home, search_path)
+        assert self.load(home, same_lengths, 'echo "${SHELLS_TOOLS_PATH}"') == (f"{same_lengths}\n", True)
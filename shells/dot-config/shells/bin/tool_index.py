@@ -0,0 +1,228 @@
+#!/usr/bin/env -S uv run --no-project --script --quiet
+# /// script
+# requires-python = ">=3.13"
+# dependencies = [
+#     "typer",
+#     "typing_extensions",
+# ]
+# ///
+"""
+Index the tools topics need from `$PATH` (and the Homebrew prefix) once, as a script a shell can source, and cache it.
+
+Nearly every topic starts with `command -v <tool> >/dev/null 2>&1 || return`, and a few run `brew --prefix` (a
+Ruby program) just to learn a directory that never changes.  Instead, `load_tool_index` (see
+`required_functions.sh.inc`) sources the index this script writes, which sets:
+
+- `SHELLS_TOOLS`: an associative array from each tool's name to its path (the first one on `$PATH`, just as
+    `command -v` would find it), or to "" if it isn't on `$PATH`;
+- `SHELLS_TOOLS_PATH`: the `$PATH` that was indexed;
+- `SHELLS_BREW_PREFIX`: what `brew --prefix` would print, or nothing if there's no `brew`.
+
+and topics say `have_tool <tool> || return`, which is a single hash lookup.
+
+The tools in the index are the ones topics ask about, i.e., every `have_tool <tool>` in the topics tree, plus `brew`.
+Not every executable: Bash takes several milliseconds just to parse an associative array of the thousand or two on a
+typical `$PATH`, far more than all the `command -v`s it would replace.  `have_tool` falls back to `command -v` for
+any tool the index doesn't know about, so a topic that starts asking about a new tool is still answered correctly.
+
+The index lists each directory on `$PATH` exactly once, with `os.scandir`.  It's keyed on `$PATH` and the
+modification time of each directory on it: installing or removing a tool changes the modification time of its
+directory, and creating a directory that was on `$PATH` but missing gives it a new one.  The first line of the index
+records `$PATH`, so `load_tool_index` can check, with nothing but shell builtins, that the index is still current (same
+`$PATH`, and no directory on it newer than the index), and only run this script when it isn't.  The key also holds the
+tools wanted, which `load_tool_index` can't work out without reading every topic; instead, it runs this script when any
+topic (or topics directory) is newer than the index.  If the tools wanted are the same after all, this script just
+touches the index.
+
+There is an index for each `$PATH`, named for `path_signature`, so that shells whose `$PATH`s differ (a nested shell,
+say, in which "brew" has put Homebrew on `$PATH` a second time) don't take turns rebuilding a single index.
+
+Example:
+    $ tool_index.py bash ~/.config/shells/topics
+"""
+
+import json
+import os
+import re
+import shlex
+import sys
+from collections.abc import Container, Sequence
+from os import PathLike
+from pathlib import Path
+from typing import Annotated
+
+from fast_cli import Argument, Option, run
+from get_topics import default_cache_dir, mtime_ns
+
+
+HEADER_PREFIX = "# tool_index: "
+KEY_PREFIX = "# key: "
+
+HAVE_TOOL_RE = re.compile(r"\bhave_tool\s+([A-Za-z0-9_.+-]+)")
+
+
+def path_directories(search_path: str) -> list[str]:
+    """The directories on `search_path`, in order, without duplicates; an empty entry means the current directory."""
+    return list(dict.fromkeys(directory or "." for directory in search_path.split(os.pathsep)))
+
+
+def path_signature(search_path: str) -> str:
+    """
+    A short name for `search_path`, cheap enough to work out in shell at every start (see `load_tool_index`).
+
+    It's a hash (djb2) of the lengths of the entries on `search_path`, not of their text: with nothing but shell
+    builtins, hashing every character costs milliseconds.  Two `$PATH`s with the same signature share an index, which
+    is still only used for the `$PATH` in its header.
+    """
+    signature = 5381
+    for directory in search_path.split(os.pathsep):
+        signature = (signature * 33 + len(directory)) & 0xFFFFFFFF
+    return str(signature)
+
+
+def default_index_file(shell: str, search_path: str) -> Path:
+    """Where the index of `search_path` for `shell` is kept: `$XDG_CACHE_HOME/shells/tool-index.SHELL.SIGNATURE`."""
+    return default_cache_dir() / f"tool-index.{shell}.{path_signature(search_path)}"
+
+
+def find_wanted_tools(topics_dir: PathLike | str) -> list[str]:
+    """Every tool named by a `have_tool` in a topic (in `topics_dir` or a platform-specific directory), and `brew`."""
+    topics_dir = Path(topics_dir)
+    wanted = {"brew"}
+    for directory in (topics_dir, *(path for path in topics_dir.iterdir() if path.is_dir())):
+        for path in directory.iterdir():
+            if path.is_file():
+                try:
+                    wanted.update(HAVE_TOOL_RE.findall(path.read_text(errors="replace")))
+                except OSError:
+                    continue
+    return sorted(wanted)
+
+
+def index_key(search_path: str, wanted: Sequence[str]) -> dict:
+    """Everything that must be unchanged for an index of `wanted` on `search_path` to still be right."""
+    return {
+        "path": search_path,
+        "mtimes": {directory: mtime_ns(directory) for directory in path_directories(search_path)},
+        "homebrew_prefix": os.environ.get("HOMEBREW_PREFIX"),
+        "tools": list(wanted),
+    }
+
+
+def find_executables(search_path: str, wanted: Container[str]) -> dict[str, str]:
+    """
+    Each executable named in `wanted` → its path, listing each directory on `search_path` once; earlier directories
+    win.
+    """
+    tools: dict[str, str] = {}
+    for directory in path_directories(search_path):
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name not in wanted or entry.name in tools:
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+                    if os.access(entry.path, os.X_OK):
+                        tools[entry.name] = entry.path
+        except OSError:
+            continue
+    return tools
+
+
+def brew_prefix(tools: dict[str, str]) -> str | None:
+    """What `brew --prefix` would print, without running it: `brew` lives in "<prefix>/bin"."""
+    if prefix := os.environ.get("HOMEBREW_PREFIX"):
+        return prefix
+    if (brew := tools.get("brew")) is None:
+        return None
+    return str(Path(brew).parent.parent)
+
+
+def render_index(shell: str, key: dict, tools: dict[str, str], homebrew_prefix: str | None) -> str:
+    """
+    The text of the index: the header `load_tool_index` checks, then assignments `shell` can source.  Each of the
+    tools in `key` gets an entry, "" if it wasn't found.
+    """
+    tools = {name: tools.get(name, "") for name in key["tools"]}
+    if shell == "zsh":
+        entries = " ".join(f"{shlex.quote(name)} {shlex.quote(path)}" for name, path in tools.items())
+        declaration = f"typeset -gA SHELLS_TOOLS\nSHELLS_TOOLS=({entries})"
+    else:
+        entries = " ".join(f"[{shlex.quote(name)}]={shlex.quote(path)}" for name, path in tools.items())
+        declaration = f"declare -gA SHELLS_TOOLS=({entries})"
+    return "\n".join(
+        [
+            f"{HEADER_PREFIX}{key['path']}",
+            f"{KEY_PREFIX}{json.dumps(key)}",
+            declaration,
+            f"SHELLS_TOOLS_PATH={shlex.quote(key['path'])}",
+            f"SHELLS_BREW_PREFIX={shlex.quote(homebrew_prefix or '')}",
+            "",
+        ]
+    )
+
+
+def read_index(index_file: Path, key: dict) -> str | None:
+    """The index in `index_file` if it was built for exactly `key`; else `None`."""
+    try:
+        text = index_file.read_text()
+        key_line = text.split("\n", 2)[1]
+        if json.loads(key_line.removeprefix(KEY_PREFIX)) == key:
+            return text
+    except (OSError, IndexError, ValueError):
+        pass
+    return None
+
+
+def write_index(index_file: Path, text: str) -> None:
+    """Save `text` as `index_file`, atomically; failing to save is not an error."""
+    temporary_file = index_file.with_name(f"{index_file.name}.{os.getpid()}.tmp")
+    try:
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        temporary_file.write_text(text)
+        os.replace(temporary_file, index_file)
+    except OSError:
+        temporary_file.unlink(missing_ok=True)
+
+
+def tool_index(shell: str, search_path: str, wanted: Sequence[str], index_file: Path) -> str:
+    """
+    The index of `wanted` on `search_path` for `shell`, from `index_file` if that's still current; else built and
+    saved there.
+    """
+    key = index_key(search_path, wanted)
+    if (text := read_index(index_file, key)) is not None:
+        os.utime(index_file)  # So `load_tool_index` sees it's newer than every directory, and stops asking
+        return text
+    tools = find_executables(search_path, set(wanted))
+    text = render_index(shell, key, tools, brew_prefix(tools))
+    write_index(index_file, text)
+    return text
+
+
+def main(
+    shell: Annotated[str, Argument(help="The shell that will source the index: 'bash' or 'zsh'")],
+    topics_dir: Annotated[Path, Argument(help="The top-level topics directory, to find the tools topics need")],
+    index_file: Annotated[
+        Path | None,
+        Option(help="Where to keep the index (default: $XDG_CACHE_HOME/shells/tool-index.SHELL.PATH-SIGNATURE)"),
+    ] = None,
+):
+    if shell not in ("bash", "zsh"):
+        print(f"Error: Unsupported shell '{shell}' - supported: bash, zsh", file=sys.stderr)
+        sys.exit(1)
+    if not topics_dir.is_dir():
+        print(f"Error: Directory {topics_dir} does not exist", file=sys.stderr)
+        sys.exit(1)
+    search_path = os.environ.get("PATH", "")
+    if index_file is None:
+        index_file = default_index_file(shell, search_path)
+    print(tool_index(shell, search_path, find_wanted_tools(topics_dir), index_file), end="")
+
+
+if __name__ == "__main__":
+    run(main)
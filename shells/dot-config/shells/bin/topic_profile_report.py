@@ -0,0 +1,192 @@
+#!/usr/bin/env -S uv run --no-project --script --quiet
+# /// script
+# requires-python = ">=3.13"
+# dependencies = [
+#     "typer",
+#     "typing_extensions",
+# ]
+# ///
+"""
+Rank topics by how long they take to source, from the timings `source_all --profile` logs across many shell sessions.
+
+To collect timings, set `SHELLS_TOPICS_PROFILE` to a log file, e.g., `~/.cache/shells/profile.log` (the default here),
+and start some shells.  `source_topics` passes `--profile` to `get_topics.py`, which passes it on to `source_all`.
+Each line of the log is one sourced file: a session id, the shell, the start and end times (`EPOCHREALTIME`), and the
+file, separated by tabs.  With `SHELLS_TOPICS_BUNDLE` set, all topics are sourced as a single file, so unset it while
+profiling.
+
+The report shows the slowest topics (by median), with their 50th and 95th percentiles, and the median total per
+session.  `--save-baseline` records today's medians; after that, any topic whose median has grown by more than
+`--threshold` (and by at least `--min-ms`) over its baseline is flagged as a regression.
+
+Example:
+    $ topic_profile_report.py --top 10
+"""
+
+import json
+import math
+from collections import defaultdict
+from dataclasses import dataclass
+from os import PathLike
+from pathlib import Path
+
+import typer
+from typing_extensions import Annotated
+
+from get_topics import default_cache_dir
+
+
+@dataclass
+class TopicTiming:
+    session: str
+    shell: str
+    path: str
+    milliseconds: float
+
+
+@dataclass
+class TopicSummary:
+    path: str
+    count: int
+    p50: float
+    p95: float
+    baseline: float | None = None
+
+    @property
+    def regression(self) -> float | None:
+        """How many milliseconds slower the median is than the baseline; `None` if there's no baseline."""
+        return None if self.baseline is None else self.p50 - self.baseline
+
+
+def read_profile_log(log_file: PathLike | str, shell: str | None = None) -> list[TopicTiming]:
+    """
+    Read every well-formed record in `log_file`, optionally only those for one `shell`.
+
+    A shell without `EPOCHREALTIME` (Bash before 5.0) logs empty times, and an interrupted shell might leave half a
+    line; such records are skipped.  Some locales write the time with a decimal comma, which is accepted.
+    """
+    timings: list[TopicTiming] = []
+    with open(log_file, "r") as f:
+        for line in f:
+            fields = line.rstrip("\n").split("\t", 4)
+            if len(fields) != 5:
+                continue
+            session, record_shell, start, end, path = fields
+            if shell is not None and record_shell != shell:
+                continue
+            try:
+                milliseconds = (float(end.replace(",", ".")) - float(start.replace(",", "."))) * 1000
+            except ValueError:
+                continue
+            timings.append(TopicTiming(session, record_shell, path, milliseconds))
+    return timings
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """The `fraction` (0 to 1) percentile of `values`, interpolating between the closest ranks."""
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * fraction
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(timings: list[TopicTiming], baseline: dict[str, float] | None = None) -> list[TopicSummary]:
+    """One `TopicSummary` per sourced file, slowest median first."""
+    by_path: dict[str, list[float]] = defaultdict(list)
+    for timing in timings:
+        by_path[timing.path].append(timing.milliseconds)
+    summaries = [
+        TopicSummary(
+            path=path,
+            count=len(values),
+            p50=percentile(values, 0.5),
+            p95=percentile(values, 0.95),
+            baseline=(baseline or {}).get(path),
+        )
+        for path, values in by_path.items()
+    ]
+    return sorted(summaries, key=lambda summary: summary.p50, reverse=True)
+
+
+def session_totals(timings: list[TopicTiming]) -> list[float]:
+    """Total milliseconds spent sourcing files, per session."""
+    totals: dict[str, float] = defaultdict(float)
+    for timing in timings:
+        totals[timing.session] += timing.milliseconds
+    return list(totals.values())
+
+
+def read_baseline(baseline_file: PathLike | str) -> dict[str, float]:
+    """The baseline medians saved by `--save-baseline`, or an empty `dict` if there aren't any yet."""
+    try:
+        with open(baseline_file, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_baseline(baseline_file: PathLike | str, summaries: list[TopicSummary]) -> None:
+    baseline_file = Path(baseline_file)
+    baseline_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(baseline_file, "w") as f:
+        json.dump({summary.path: summary.p50 for summary in summaries}, f, indent=2)
+
+
+def main(
+    log_file: Annotated[
+        Path | None, typer.Argument(help="The profile log (default: $XDG_CACHE_HOME/shells/profile.log)")
+    ] = None,
+    shell: Annotated[str | None, typer.Option(help="Only report sessions of this shell, e.g., 'zsh'")] = None,
+    top: Annotated[int, typer.Option(help="How many of the slowest topics to show (0 for all)")] = 20,
+    baseline_file: Annotated[
+        Path | None,
+        typer.Option("--baseline", help="Baseline medians (default: $XDG_CACHE_HOME/shells/profile-baseline.json)"),
+    ] = None,
+    save_baseline: Annotated[
+        bool, typer.Option(help="Record the medians from this report as the new baseline")
+    ] = False,
+    threshold: Annotated[float, typer.Option(help="Flag a topic whose median grew by more than this fraction")] = 0.25,
+    min_ms: Annotated[float, typer.Option(help="...and by at least this many milliseconds")] = 1.0,
+):
+    """Print the slowest topics, with percentiles, and flag regressions against the baseline."""
+    if log_file is None:
+        log_file = default_cache_dir() / "profile.log"
+    if baseline_file is None:
+        baseline_file = default_cache_dir() / "profile-baseline.json"
+    if not log_file.is_file():
+        typer.echo(f"Error: no profile log at {log_file}; set SHELLS_TOPICS_PROFILE and start a shell", err=True)
+        raise typer.Exit(1)
+
+    timings = read_profile_log(log_file, shell)
+    if not timings:
+        typer.echo(f"Error: {log_file} holds no usable timings", err=True)
+        raise typer.Exit(1)
+
+    summaries = summarize(timings, read_baseline(baseline_file))
+    totals = session_totals(timings)
+    typer.echo(f"{len(totals)} sessions; total per session: p50 {percentile(totals, 0.5):.1f} ms, "
+               f"p95 {percentile(totals, 0.95):.1f} ms")
+    typer.echo(f"{'p50 ms':>9} {'p95 ms':>9} {'count':>6} {'baseline':>9}  topic")
+
+    regressions = []
+    for summary in summaries:
+        if (regression := summary.regression) is not None and regression >= min_ms \
+                and regression > summary.baseline * threshold:
+            regressions.append(summary)
+    for summary in summaries[:top] if top else summaries:
+        baseline = "" if summary.baseline is None else f"{summary.baseline:.2f}"
+        flag = "  REGRESSION" if summary in regressions else ""
+        typer.echo(f"{summary.p50:>9.2f} {summary.p95:>9.2f} {summary.count:>6} {baseline:>9}  {summary.path}{flag}")
+
+    if regressions:
+        typer.echo(f"\n{len(regressions)} topic(s) slower than the baseline:")
+        for summary in regressions:
+            typer.echo(f"  {summary.path}: {summary.baseline:.2f} ms -> {summary.p50:.2f} ms")
+
+    if save_baseline:
+        write_baseline(baseline_file, summaries)
+        typer.echo(f"\nSaved baseline to {baseline_file}")
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -1,3 +1,3 @@
-command -v atuin >/dev/null 2>&1 || return
+have_tool atuin || return
 
-eval "$(atuin init bash)"
+cached_eval atuin init bash
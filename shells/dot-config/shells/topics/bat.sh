@@ -1,3 +1,3 @@
-command -v bat >/dev/null 2>&1 || return
+have_tool bat || return
 
 alias cat=bat
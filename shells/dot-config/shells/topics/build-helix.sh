@@ -6,7 +6,7 @@ build-helix() {
   # Might not be there, might not be `$(which hx)`, might be `hx.exe` (need to check that works)
   rm -f "~/.cargo/bin/hx{,.exe}"
 
-  if command -v direnv >/dev/null 2>&1; then
+  if have_tool direnv; then
     direnv block "${HELIX_BUILD_DIR}/.envrc"
   fi
 
@@ -3,7 +3,7 @@ if [ -f /etc/bash_completion ] ; then
     source /etc/bash_completion
 fi
 
-if command -v brew >/dev/null && test -f "$(brew --prefix)/etc/bash_completion" ; then
+if have_tool brew && test -f "${SHELLS_BREW_PREFIX:-$(brew --prefix)}/etc/bash_completion" ; then
     # shellcheck disable=SC1091
-    source "$(brew --prefix)"/etc/bash_completion
+    source "${SHELLS_BREW_PREFIX:-$(brew --prefix)}"/etc/bash_completion
 fi
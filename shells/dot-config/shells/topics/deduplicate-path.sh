@@ -1 +1,18 @@
-eval "$(deduplicate_path.py)"
+# In an init plan from `shell_init.py`, `clean_path_variables` does this once every topic has run, without Python.  Only
+# Bash's `SHELLS_HASH_TOP` still needs `deduplicate_path.py`.
+if [ -n "${SHELLS_INIT_CLEANS_PATHS}" ] && { [ -n "${ZSH_VERSION}" ] || [ -z "${SHELLS_HASH_TOP}" ] ; } ; then
+    return
+fi
+
+# `$CDPATH` (and, in Zsh, `$FPATH`) isn't exported, so it's handed over explicitly.
+if [ -n "${ZSH_VERSION}" ] ; then
+    eval "$(CDPATH="${CDPATH}" FPATH="${FPATH}" deduplicate_path.py --optimize \
+        PATH MANPATH INFOPATH CDPATH PYTHONPATH LD_LIBRARY_PATH fpath)"
+else
+    HASH_OPTIONS=()
+    # Set `SHELLS_HASH_TOP` to a number to tell Bash, up front, where that many of your most-used commands are
+    [ -n "${SHELLS_HASH_TOP}" ] && HASH_OPTIONS=(--hash-top "${SHELLS_HASH_TOP}")
+    eval "$(CDPATH="${CDPATH}" deduplicate_path.py --optimize "${HASH_OPTIONS[@]}" \
+        PATH MANPATH INFOPATH CDPATH PYTHONPATH LD_LIBRARY_PATH)"
+    unset HASH_OPTIONS
+fi
@@ -1,4 +1,4 @@
-command -v direnv >/dev/null 2>&1 || return
+have_tool direnv || return
 
-eval "$(direnv hook bash)"
+cached_eval direnv hook bash
 export DIRENV_LOG_FORMAT=""
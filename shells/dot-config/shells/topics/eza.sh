@@ -1,4 +1,4 @@
-command -v eza >/dev/null 2>&1 || return
+have_tool eza || return
 
 unset LS_COLORS
 unset EXA_COLORS
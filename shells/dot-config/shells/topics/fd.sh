@@ -1,4 +1,4 @@
-command -v fd >/dev/null 2>&1 || return
+have_tool fd || return
 
 f() { # f <glob> : list all the files in or below . whose names match <glob>.  You can give options to fd with all the f-commands
     fd --follow --hidden --glob "$@" 2>/dev/null
@@ -44,7 +44,7 @@ fsource() { # fsource <glob> : find all the files in or below . whose names matc
     source_all "${FILES[@]}"
 }
 
-if command -v as-tree >/dev/null 2>&1 ; then
+if have_tool as-tree ; then
     ftree() { # ftree <glob> : find all the files in or below . whose names match <glob> and display them as a tree
         fd --follow --hidden --glob "$@" | as-tree
     }
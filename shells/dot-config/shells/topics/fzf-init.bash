@@ -1,3 +1,3 @@
-command -v fzf >/dev/null 2>&1 || return
+have_tool fzf || return
 
-eval "$(fzf --bash)"
+cached_eval fzf --bash
@@ -1,4 +1,4 @@
-command -v fzf >/dev/null 2>&1 || return
+have_tool fzf || return
 
 export FZF_DEFAULT_OPTS='--ansi --layout=reverse'
 
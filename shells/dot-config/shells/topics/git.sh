@@ -2,6 +2,8 @@
 # git-top-level.{bash,zsh} must execute first, at least ... I'm pretty sure.
 
 export PATH="${HOME}/.config/git/bin:${PATH}"
+# Keep `install_frozen.py`'s launchers (if any) ahead of the scripts they stand in for
+[ -d "${SHELLS_FROZEN_BIN}" ] && export PATH="${SHELLS_FROZEN_BIN}:${PATH}"
 
 alias sync-main=sync-main.py
 
@@ -1,11 +1,11 @@
-command -v hx >/dev/null 2>&1 || return
+have_tool hx || return
 
 export EDITOR=hx
 export VISUAL=hx
 export FCEDIT=hx
 
-if command -v brew >/dev/null 2>&1 ; then
-    LLVM_BIN="$(brew --prefix)/opt/llvm/bin"
+if have_tool brew ; then
+    LLVM_BIN="${SHELLS_BREW_PREFIX:-$(brew --prefix)}/opt/llvm/bin"
     if [ -d "$LLVM_BIN" ] && [[ ":$PATH:" != *":$LLVM_BIN:"* ]] ; then
         # Yes, I'm altering `$PATH` here, but only so `hx` can see some needed tools.
         # Therefore, this topic only needs to be sourced in interactive shells.
@@ -1,4 +1,4 @@
-command -v node >/dev/null 2>&1 || return
+have_tool node || return
 
 # Altering `$PATH`.  This topic should be sourced whether the shell is interactive or not.
 export PATH="${PATH}:./node_modules/.bin"
@@ -1,4 +1,4 @@
-command -v fd >/dev/null 2>&1 || return
+have_tool fd || return
 
 f() { # f <regexp> : list all the files in or below . whose names match <regexp>.  You can give options to fd with all the f-commands
     fd --follow --hidden "$@" 2>/dev/null
@@ -44,7 +44,7 @@ fsource() { # fsource <regexp> : find all the files in or below . whose names ma
     source_all "${FILES[@]}"
 }
 
-if command -v as-tree >/dev/null 2>&1 ; then
+if have_tool as-tree ; then
     ftree() { # ftree <regexp> : find all the files in or below . whose names match <regexp> and display them as a tree
         fd --follow --hidden "$@" | as-tree
     }
@@ -1,3 +1,3 @@
-command -v pixi >/dev/null 2>&1 || return
+have_tool pixi || return
 
-eval "$(pixi completion --shell bash)"
+cached_eval pixi completion --shell bash
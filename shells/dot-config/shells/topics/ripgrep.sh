@@ -1,4 +1,4 @@
-command -v rg >/dev/null 2>&1 || return
+have_tool rg || return
 
 # An alias and a couple of functions for interactive use.
 
@@ -1,4 +1,4 @@
-command -v brew >/dev/null 2>&1 && [ -d "$(brew --prefix)/Cellar/sqlite" ] || return
+have_tool brew && [ -d "${SHELLS_BREW_PREFIX:-$(brew --prefix)}/Cellar/sqlite" ] || return
 
 # shellcheck disable=SC2139
-alias sqlite="$(fd '^sqlite3$' "$(brew --prefix)/Cellar/sqlite")"
+alias sqlite="$(fd '^sqlite3$' "${SHELLS_BREW_PREFIX:-$(brew --prefix)}/Cellar/sqlite")"
@@ -1,4 +1,4 @@
-command -v starship >/dev/null 2>&1 || return
+have_tool starship || return
 
-eval "$(starship init bash)"
-eval "$(starship completions bash)"
+cached_eval starship init bash --print-full-init
+cached_eval starship completions bash
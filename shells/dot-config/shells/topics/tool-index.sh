@@ -0,0 +1,3 @@
+# Look up, once, every tool the other topics ask about with `have_tool`, and the Homebrew prefix.  This comes right
+# after "brew" (which puts Homebrew on `$PATH`) in `initial-topics`.  See `load_tool_index`.
+load_tool_index
@@ -1,4 +1,4 @@
-command -v tree >/dev/null 2>&1 || return
+have_tool tree || return
 
 # TODO: only alias if `tree` is available.
 alias tree="tree -alC -I '.git|*venv|__pycache__|.pytest_cache|.mypy_cache|.ipython|.ruff_cache|.pixi|target|node_modules'"